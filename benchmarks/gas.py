@@ -0,0 +1,378 @@
+"""
+Measures the gas consumed by the entrypoints of the tzBTC ledger.
+
+The SmartPy simulator does not meter gas, so the contract is originated from the
+compilation snapshots (make compile-contracts) with the benchmark account as the only
+admin, gatekeeper and trusted signer and a threshold of 1. Every measured call is
+simulated on the same storage, so the numbers of the different flows are directly
+comparable. The signers benchmark adds trusted signers to compare the cost of a
+confirmation with 3, 9 and 20 signers.
+
+The benchmarks run either:
+- on a network (ghostnet), the node must be reachable and the benchmark account needs
+  to be allowed to add operators on the token contract (see deployments/deployment.py).
+- offline (mockup), in the mockup mode of octez-client which applies the operations
+  to a local context without any node. The token contract is replaced by a stub that
+  accepts every call, the gas of the token entrypoints is therefore not included.
+  octez-client must be in the PATH or given with the OCTEZ_CLIENT variable.
+
+Usage: python3 benchmarks/gas.py ghostnet|mockup [benchmark ...]
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from decimal import Decimal
+
+import requests
+from pytezos import pytezos, ContractInterface, Key
+from pytezos.michelson.format import micheline_to_michelson
+from pytezos.operation.result import OperationResult
+
+from deployments.deployment import SNAPSHOT_PATH, find_ledger_storage, make_storage
+from deployments.utils import (
+    AdministratorStatus,
+    get_address,
+    make_roles,
+    wait_applied,
+)
+import deployments.ghostnet.configuration as ghostnet_config
+from utils.btc_address import address_to_script
+
+BATCH_SIZES = [1, 10, 50]
+SIGNERS_NUMS = [3, 9, 20]
+TARGETS = ["tzBTCLedger", "tzBTCLedgerLazy"]
+
+OCTEZ_CLIENT = os.environ.get("OCTEZ_CLIENT", "octez-client")
+MOCKUP_ACCOUNT = "bootstrap1"
+# Accepts the calls made by the ledger and by the benchmarks on the token contract.
+TOKEN_STUB = """
+parameter (or (or (address %addOperator) (pair %approve (address %spender) (nat %value)))
+              (or (nat %burn)
+                  (or (pair %mint address nat) (pair %transfer address (pair address nat)))));
+storage unit;
+code { CDR; NIL operation; PAIR };
+"""
+
+
+class Network:
+    """Originates and calls the contracts on a Tezos network with pytezos."""
+
+    def __init__(self, config):
+        self.client = pytezos.using(key=config.SECRET_KEY, shell=config.NODE_URL)
+        self.account = self.client.key.public_key_hash()
+        self.clients = {self.account: self.client}
+        self.token_address = config.TOKEN_ADDRESS
+
+    def new_account(self):
+        client = self.client.using(key=Key.generate(export=False))
+        account = client.key.public_key_hash()
+        operation_group = self.client.transaction(
+            destination=account, amount=Decimal(1)
+        ).send()
+        wait_applied(self.client, operation_group.hash())
+        operation_group = client.reveal().send()
+        wait_applied(self.client, operation_group.hash())
+        self.clients[account] = client
+        return account
+
+    def originate(self, contract_code, storage):
+        operation_group = self.client.origination(
+            script=contract_code.script(initial_storage=storage)
+        ).send()
+        return get_address(self.client, operation_group.hash())
+
+    def contract_call(self, address, entrypoint, parameters, source):
+        contract = self.clients[source or self.account].contract(address)
+        return getattr(contract, entrypoint)(*parameters)
+
+    def send(self, address, entrypoint, *parameters, source=None):
+        operation_group = self.contract_call(
+            address, entrypoint, parameters, source
+        ).send()
+        wait_applied(self.client, operation_group.hash())
+
+    def consumed_gas(self, address, entrypoint, *parameters, source=None):
+        contract_call = self.contract_call(address, entrypoint, parameters, source)
+        return OperationResult.consumed_gas(contract_call.run_operation())
+
+
+class Mockup:
+    """Originates and calls the contracts in the mockup mode of octez-client."""
+
+    def __init__(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.contract_codes = {}
+        self.octez_client("create", "mockup")
+        self.aliases = {}
+        self.account = self.show_address(MOCKUP_ACCOUNT)
+        self.token_address = self.originate(
+            ContractInterface.from_michelson(TOKEN_STUB), None
+        )
+
+    def octez_client(self, *arguments):
+        return subprocess.run(
+            [OCTEZ_CLIENT, "--mode", "mockup", "--base-dir", self.base_dir]
+            + list(arguments),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def show_address(self, alias):
+        account = re.search(
+            r"Hash: (\w+)", self.octez_client("show", "address", alias)
+        ).group(1)
+        self.aliases[account] = alias
+        return account
+
+    def new_account(self):
+        alias = "account_%d" % len(self.aliases)
+        self.octez_client("gen", "keys", alias)
+        self.octez_client(
+            "transfer", "1", "from", MOCKUP_ACCOUNT, "to", alias, "--burn-cap", "1"
+        )
+        return self.show_address(alias)
+
+    def originate(self, contract_code, storage):
+        alias = "contract_%d" % len(self.contract_codes)
+        # The code is read from a file as it does not fit in a command line argument.
+        code_path = os.path.join(self.base_dir, alias + ".tz")
+        with open(code_path, "w") as code_file:
+            code_file.write(contract_code.to_michelson())
+        output = self.octez_client(
+            "originate",
+            "contract",
+            alias,
+            "transferring",
+            "0",
+            "from",
+            MOCKUP_ACCOUNT,
+            "running",
+            code_path,
+            "--init",
+            micheline_to_michelson(contract_code.storage.encode(storage), inline=True),
+            "--burn-cap",
+            "100",
+        )
+        address = re.search(r"New contract (KT1\w+) originated", output).group(1)
+        self.contract_codes[address] = contract_code
+        return address
+
+    def transfer(self, address, entrypoint, parameters, source, *options):
+        contract_call = getattr(self.contract_codes[address], entrypoint)(*parameters)
+        return self.octez_client(
+            "transfer",
+            "0",
+            "from",
+            self.aliases[source or self.account],
+            "to",
+            address,
+            "--entrypoint",
+            contract_call.parameters["entrypoint"],
+            "--arg",
+            micheline_to_michelson(contract_call.parameters["value"], inline=True),
+            "--burn-cap",
+            "10",
+            *options,
+        )
+
+    def send(self, address, entrypoint, *parameters, source=None):
+        self.transfer(address, entrypoint, parameters, source)
+
+    def consumed_gas(self, address, entrypoint, *parameters, source=None):
+        output = self.transfer(address, entrypoint, parameters, source, "--dry-run")
+        # The gas of every internal operation is listed, as in OperationResult.
+        return int(
+            sum(float(gas) for gas in re.findall(r"Consumed gas: ([\d.]+)", output))
+        )
+
+
+def is_reachable(node_url):
+    try:
+        response = requests.get(
+            node_url + "/chains/main/blocks/head/header", timeout=10
+        )
+    except requests.RequestException:
+        return False
+    return response.ok
+
+
+def originate(runner, config, target="tzBTCLedger", signers=None):
+    # Every signer has to confirm, the benchmark account is the only signer by default.
+    signers = signers or [runner.account]
+    tzbtc_ledger_code = ContractInterface.from_file(SNAPSHOT_PATH.format(target=target))
+    full_storage = make_storage(tzbtc_ledger_code, config, target)
+    storage = find_ledger_storage(full_storage)
+
+    storage["roles"] = make_roles(
+        {runner.account: AdministratorStatus.SET},
+        [runner.account],
+        signers,
+    )
+    storage["administrators_num"] = 1
+    storage["next_signer_index"] = len(signers)
+    storage["active_signers"] = (1 << len(signers)) - 1
+    storage["threshold"] = len(signers)
+    storage["token_address"] = runner.token_address
+
+    address = runner.originate(tzbtc_ledger_code, full_storage)
+    runner.send(runner.token_address, "addOperator", address)
+    return address
+
+
+def confirm_new_utxos(runner, tzbtc_ledger, n):
+    txids = [os.urandom(32) for _ in range(n)]
+    runner.send(
+        tzbtc_ledger,
+        "confirm_utxos",
+        [
+            {
+                "amount": 10_000,
+                "output_no": 0,
+                "receiver": runner.account,
+                "txid": txid,
+                "skip_confirmed": False,
+            }
+            for txid in txids
+        ],
+    )
+    return txids
+
+
+def benchmark_mint(runner, config):
+    tzbtc_ledger = originate(runner, config)
+
+    print("| N | mint x N | mint_utxos |")
+    print("|---|----------|------------|")
+    for n in BATCH_SIZES:
+        txids = confirm_new_utxos(runner, tzbtc_ledger, n)
+        single = sum(
+            runner.consumed_gas(tzbtc_ledger, "mint", {"txid": txid, "output_no": 0})
+            for txid in txids
+        )
+        batch = runner.consumed_gas(
+            tzbtc_ledger,
+            "mint_utxos",
+            [{"txid": txid, "output_no": 0} for txid in txids],
+        )
+        print("| %d | %d | %d |" % (n, single, batch))
+
+
+def benchmark_lazy_entry_points(runner, config):
+    gas = {}
+    for target in TARGETS:
+        tzbtc_ledger = originate(runner, config, target)
+        (txid,) = confirm_new_utxos(runner, tzbtc_ledger, 1)
+        runner.send(
+            tzbtc_ledger,
+            "verify_address",
+            {"address": runner.account, "verified": True},
+        )
+
+        gas[target] = {
+            "confirm_utxo": runner.consumed_gas(
+                tzbtc_ledger,
+                "confirm_utxo",
+                {
+                    "amount": 10_000,
+                    "output_no": 0,
+                    "receiver": runner.account,
+                    "txid": os.urandom(32),
+                },
+            ),
+            "mint": runner.consumed_gas(
+                tzbtc_ledger, "mint", {"txid": txid, "output_no": 0}
+            ),
+        }
+        runner.send(tzbtc_ledger, "mint", {"txid": txid, "output_no": 0})
+        runner.send(
+            runner.token_address, "approve", tzbtc_ledger, config.MIN_BURN_AMOUNT
+        )
+        gas[target]["propose_burn"] = runner.consumed_gas(
+            tzbtc_ledger,
+            "propose_burn",
+            {
+                "amount": config.MIN_BURN_AMOUNT,
+                "receiver": address_to_script(
+                    "tb1qrp33g0q5c5txsp9arysrx4k6zdkfs4nce4xj0gdcccefvpysxf3q0sl5k7"
+                ),
+                "optional_callback": None,
+            },
+        )
+        gas[target]["update_threshold"] = runner.consumed_gas(
+            tzbtc_ledger, "update_threshold", 1
+        )
+
+    print("| entrypoint | " + " | ".join(TARGETS) + " |")
+    print("|---" * (len(TARGETS) + 1) + "|")
+    for entrypoint in gas[TARGETS[0]]:
+        print(
+            "| %s | " % entrypoint
+            + " | ".join(str(gas[target][entrypoint]) for target in TARGETS)
+            + " |"
+        )
+
+
+def benchmark_signers(runner, config):
+    accounts = [runner.new_account() for _ in range(max(SIGNERS_NUMS) - 1)]
+
+    print("| signers | first vote | vote reaching the threshold |")
+    print("|---------|------------|-----------------------------|")
+    for signers_num in SIGNERS_NUMS:
+        # The benchmark account gets the highest index, so its votes set the last bit
+        # of the approvers bitmask.
+        signers = accounts[: signers_num - 1] + [runner.account]
+        tzbtc_ledger = originate(runner, config, signers=signers)
+        utxo = {
+            "amount": 10_000,
+            "output_no": 0,
+            "receiver": runner.account,
+            "txid": os.urandom(32),
+        }
+        first_vote = runner.consumed_gas(tzbtc_ledger, "confirm_utxo", utxo)
+        for signer in signers[:-1]:
+            runner.send(tzbtc_ledger, "confirm_utxo", utxo, source=signer)
+        last_vote = runner.consumed_gas(tzbtc_ledger, "confirm_utxo", utxo)
+        print("| %d | %d | %d |" % (signers_num, first_vote, last_vote))
+
+
+BENCHMARKS = {
+    "mint": benchmark_mint,
+    "lazy_entry_points": benchmark_lazy_entry_points,
+    "signers": benchmark_signers,
+}
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Invalid number of arguments")
+        sys.exit(1)
+
+    network = sys.argv[1]
+    # The mockup runs reuse the ghostnet configuration for the addresses and amounts.
+    if network in ["ghostnet", "mockup"]:
+        config = ghostnet_config
+    else:
+        print("Invalid network name")
+        sys.exit(1)
+
+    if network == "mockup":
+        if shutil.which(OCTEZ_CLIENT) is None:
+            print("%s not found, set OCTEZ_CLIENT to its path" % OCTEZ_CLIENT)
+            sys.exit(1)
+        runner = Mockup()
+    else:
+        if not is_reachable(config.NODE_URL):
+            print(
+                "%s is not reachable, run the benchmarks offline with: "
+                "python3 benchmarks/gas.py mockup" % config.NODE_URL
+            )
+            sys.exit(1)
+        runner = Network(config)
+
+    for name in sys.argv[2:] or BENCHMARKS.keys():
+        print("## " + name)
+        BENCHMARKS[name](runner, config)
@@ -6,10 +6,10 @@ from contracts.tzbtc_ledger import TzBTCLedger
 
 sp.add_compilation_target(
     "tzBTCLedger",
-    TzBTCLedger(
-        administrators = sp.big_map({}),
-        gatekeepers = sp.big_map({}),
-        trusted_signers = sp.big_map({}),
-        threshold = sp.nat(3)
-    ),
-)
\ No newline at end of file
+    TzBTCLedger(roles=sp.big_map({}), threshold=sp.nat(3)),
+)
+
+sp.add_compilation_target(
+    "tzBTCLedgerLazy",
+    TzBTCLedger(roles=sp.big_map({}), threshold=sp.nat(3), lazy_entry_points=True),
+)
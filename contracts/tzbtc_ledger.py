@@ -1,7 +1,7 @@
 import smartpy as sp
 
 import utils.errors as Errors
-from utils.administrable_mixin import SingleAdministrableMixin
+from utils.administrable_mixin import SingleAdministrableMixin, Roles
 
 
 class BurnState:
@@ -13,14 +13,69 @@ class Burn:
     def get_type():
         return sp.TRecord(
             proposer=sp.TAddress,
-            receiver=sp.TString,
+            receiver=sp.TBytes,  # scriptPubKey of the BTC receiver.
             amount=sp.TNat,
             state=sp.TNat,
             fee=sp.TNat,
             utxos=sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()),
-        ).layout(("proposer", ("receiver", ("amount", ("state", ("fee", "utxos"))))))
+            confirmed_at=sp.TNat,  # level of the confirmation, 0 while proposed.
+        ).layout(
+            (
+                "proposer",
+                (
+                    "receiver",
+                    ("amount", ("state", ("fee", ("utxos", "confirmed_at")))),
+                ),
+            )
+        )
+
+    def get_signer_key_type():
+        return sp.TRecord(burn_id=sp.TNat, signer=sp.TAddress).layout(
+            ("burn_id", "signer")
+        )
+
+    def get_signers_type():
+        return sp.TRecord(
+            signers=sp.TSet(sp.TAddress),  # signers that signed at least one UTXO.
+            complete_signers=sp.TNat,  # signers that signed all the UTXOs of the burn.
+        ).layout(("signers", "complete_signers"))
+
+    def get_status_type():
+        return sp.TRecord(
+            state=sp.TNat,
+            amount=sp.TNat,
+            fee=sp.TNat,
+            utxo_count=sp.TNat,
+            complete_signers=sp.TNat,  # signers that signed all the UTXOs of the burn.
+        ).layout(("state", ("amount", ("fee", ("utxo_count", "complete_signers")))))
+
+    def make_status(state, amount, fee, utxo_count, complete_signers):
+        return sp.set_type_expr(
+            sp.record(
+                state=state,
+                amount=amount,
+                fee=fee,
+                utxo_count=utxo_count,
+                complete_signers=complete_signers,
+            ),
+            Burn.get_status_type(),
+        )
 
-    def make(proposer, receiver, amount, state, fee, utxos):
+    def get_open_burns_type():
+        return sp.TRecord(
+            proposed=sp.TSet(sp.TNat),  # ids of the burns waiting for confirm_burn.
+            confirmed=sp.TSet(sp.TNat),  # ids of the burns waiting for signatures.
+        ).layout(("proposed", "confirmed"))
+
+    def make(
+        proposer,
+        receiver,
+        amount,
+        state,
+        fee,
+        utxos,
+        confirmed_at=sp.nat(0),
+    ):
         return sp.set_type_expr(
             sp.record(
                 proposer=proposer,
@@ -29,10 +84,110 @@ class Burn:
                 fee=fee,
                 utxos=utxos,
                 state=state,
+                confirmed_at=confirmed_at,
             ),
             Burn.get_type(),
         )
 
+    def make_signer_key(burn_id, signer):
+        return sp.set_type_expr(
+            sp.record(burn_id=burn_id, signer=signer), Burn.get_signer_key_type()
+        )
+
+    def make_signers(signers, complete_signers):
+        return sp.set_type_expr(
+            sp.record(signers=signers, complete_signers=complete_signers),
+            Burn.get_signers_type(),
+        )
+
+
+class BurnSignature:
+    def get_key_type():
+        return sp.TRecord(
+            burn_id=sp.TNat,
+            utxo_key=UTXO.get_key_type(),
+            signer=sp.TAddress,
+        ).layout(("burn_id", ("utxo_key", "signer")))
+
+    def get_utxo_signature_type():
+        return sp.TRecord(
+            txid=sp.TBytes, output_no=sp.TNat, signature=sp.TBytes
+        ).right_comb()
+
+    def make_key(burn_id, utxo_key, signer):
+        return sp.set_type_expr(
+            sp.record(burn_id=burn_id, utxo_key=utxo_key, signer=signer),
+            BurnSignature.get_key_type(),
+        )
+
+
+class RelayedApproval:
+    """
+    An approval of a trusted signer signed off-chain and submitted by a relayer (see
+    the relay_approvals entrypoint). The signer signs the packed payload, which binds
+    the action to the chain, the contract and the current relay nonce of the signer.
+    """
+
+    def get_action_type():
+        return sp.TVariant(
+            confirm_utxos=sp.TList(UTXO.get_confirmation_type()),
+            confirm_change_utxo=sp.TList(UTXO.get_change_confirmation_type()),
+            sign_burn=sp.TRecord(
+                burn_id=sp.TNat,
+                utxos_with_signature=sp.TList(BurnSignature.get_utxo_signature_type()),
+            ).layout(("burn_id", "utxos_with_signature")),
+        ).layout(("confirm_utxos", ("confirm_change_utxo", "sign_burn")))
+
+    def get_type():
+        return sp.TRecord(
+            public_key=sp.TKey,
+            signature=sp.TSignature,
+            action=RelayedApproval.get_action_type(),
+        ).layout(("public_key", ("signature", "action")))
+
+    def get_payload_type():
+        return sp.TRecord(
+            chain_id=sp.TChainId,
+            contract=sp.TAddress,
+            nonce=sp.TNat,
+            action=RelayedApproval.get_action_type(),
+        ).layout(("chain_id", ("contract", ("nonce", "action"))))
+
+    def make(public_key, signature, action):
+        return sp.set_type_expr(
+            sp.record(public_key=public_key, signature=signature, action=action),
+            RelayedApproval.get_type(),
+        )
+
+    def make_payload(chain_id, contract, nonce, action):
+        return sp.set_type_expr(
+            sp.record(chain_id=chain_id, contract=contract, nonce=nonce, action=action),
+            RelayedApproval.get_payload_type(),
+        )
+
+
+class Reserves:
+    def get_type():
+        return sp.TRecord(
+            init_amount=sp.TNat,  # amount of the UTXOs in the INIT state.
+            minted_amount=sp.TNat,  # amount of the UTXOs in the USED_FOR_MINT state.
+            proposed_burn_amount=sp.TNat,  # amount locked in PROPOSED burns.
+            utxo_count=sp.TNat,  # number of UTXOs in the UTXO map.
+        ).layout(
+            ("init_amount", ("minted_amount", ("proposed_burn_amount", "utxo_count")))
+        )
+
+    def make(init_amount, minted_amount, proposed_burn_amount, utxo_count):
+        return sp.set_type_expr(
+            sp.record(
+                init_amount=init_amount,
+                minted_amount=minted_amount,
+                proposed_burn_amount=proposed_burn_amount,
+                utxo_count=utxo_count,
+            ),
+            Reserves.get_type(),
+        )
+
 
 class UTXO_STATE:
     INIT = 0
@@ -52,26 +207,46 @@ class UTXO:
             amount=sp.TNat,
         ).layout(("receiver", "amount"))
 
+    def get_candidate_votes_type():
+        return sp.TRecord(
+            approvers=sp.TNat,  # bitmask of the signer indices.
+            count=sp.TNat,
+        ).layout(("approvers", "count"))
+
     def get_utxo_candidate_value_type():
         return sp.TRecord(
-            approvers=sp.TSet(sp.TAddress),
-            candidates=sp.TMap(UTXO.get_candidate_key_type(), sp.TSet(sp.TAddress)),
-        ).layout(("approvers", "candidates"))
+            approvers=sp.TNat,  # bitmask of the signer indices.
+            candidates=sp.TMap(
+                sp.TBytes, UTXO.get_candidate_votes_type()
+            ),  # map from the candidate hash to its votes.
+            created_at=sp.TNat,  # level of the first confirmation.
+        ).layout(("approvers", ("candidates", "created_at")))
 
     def get_value_type():
-        return sp.TRecord(
-            state=sp.TNat,
-            receiver=sp.TOption(sp.TAddress),
-            amount=sp.TNat,
-        ).layout(("state", ("receiver", "amount")))
+        # The state is the tag of the variant, the receiver is dropped once minted.
+        return sp.TVariant(
+            init=sp.TRecord(receiver=sp.TOption(sp.TAddress), amount=sp.TNat).layout(
+                ("receiver", "amount")
+            ),
+            used_for_mint=sp.TNat,  # the amount of the UTXO.
+        ).layout(("init", "used_for_mint"))
 
     def get_burn_type():
+        return sp.TRecord(amount=sp.TNat)
+
+    def get_confirmation_type():
         return sp.TRecord(
             amount=sp.TNat,
-            signatures=sp.TMap(
-                sp.TAddress, sp.TBytes
-            ),  # map from signer address to signature.
-        ).layout(("amount", "signatures"))
+            output_no=sp.TNat,
+            receiver=sp.TAddress,
+            txid=sp.TBytes,
+            skip_confirmed=sp.TBool,
+        ).layout(("amount", ("output_no", ("receiver", ("txid", "skip_confirmed")))))
+
+    def get_change_confirmation_type():
+        return sp.TRecord(txid=sp.TBytes, output_no=sp.TNat, amount=sp.TNat).layout(
+            ("txid", ("output_no", "amount"))
+        )
 
     def make_key(txid, output_no):
         return sp.set_type_expr(
@@ -82,12 +257,34 @@ class UTXO:
             UTXO.get_key_type(),
         )
 
-    def make_value(state, receiver, amount):
+    def make_packed_key(utxo_key):
+        # txid || output_no, the output number is encoded as a zarith nat (its packed
+        # bytes without the 0x0500 prefix). The entrypoints only accept 32 bytes txids
+        # (see TzBTCLedger.verify_txid), so the packed keys of two UTXOs never collide.
+        packed_output_no = sp.pack(utxo_key.output_no)
+        return (
+            utxo_key.txid
+            + sp.slice(
+                packed_output_no, 2, sp.as_nat(sp.len(packed_output_no) - 2)
+            ).open_some()
+        )
+
+    def make_init_value(receiver, amount):
         return sp.set_type_expr(
-            sp.record(state=state, receiver=receiver, amount=amount),
+            sp.variant("init", sp.record(receiver=receiver, amount=amount)),
             UTXO.get_value_type(),
         )
 
+    def make_used_for_mint_value(amount):
+        return sp.set_type_expr(
+            sp.variant("used_for_mint", amount), UTXO.get_value_type()
+        )
+
+    def make_value(state, receiver, amount):
+        if state == UTXO_STATE.INIT:
+            return UTXO.make_init_value(receiver, amount)
+        return UTXO.make_used_for_mint_value(amount)
+
     def make_candidate_key_type(receiver, amount):
         return sp.set_type_expr(
             sp.record(
@@ -97,17 +294,26 @@ class UTXO:
             UTXO.get_candidate_key_type(),
         )
 
-    def make_utxo_candidate_value_type(approvers, candidates):
+    def make_candidate_hash(receiver, amount):
+        return sp.blake2b(sp.pack(UTXO.make_candidate_key_type(receiver, amount)))
+
+    def make_candidate_votes(approvers, count):
         return sp.set_type_expr(
-            sp.record(approvers=approvers, candidates=candidates),
-            UTXO.get_utxo_candidate_value_type(),
+            sp.record(approvers=approvers, count=count),
+            UTXO.get_candidate_votes_type(),
         )
 
-    def make_burn_type(amount, signatures):
+    def make_utxo_candidate_value_type(approvers, candidates, created_at=sp.nat(0)):
         return sp.set_type_expr(
-            sp.record(amount=amount, signatures=signatures), UTXO.get_burn_type()
+            sp.record(
+                approvers=approvers, candidates=candidates, created_at=created_at
+            ),
+            UTXO.get_utxo_candidate_value_type(),
         )
 
+    def make_burn_type(amount):
+        return sp.set_type_expr(sp.record(amount=amount), UTXO.get_burn_type())
+
 
 def execute_fa1_token_transfer(token_address, sender, receiver, amount):
     """
@@ -139,17 +345,70 @@ def execute_fa1_token_transfer(token_address, sender, receiver, amount):
     sp.transfer(payload, sp.mutez(0), transfer_entrypoint)
 
 
+def execute_token_mint(token_address, receiver, amount):
+    """
+    Creates and execute a mint on the tzBTC token contract.
+
+    Parameters
+    ----------
+    token_address: sp.TAddress
+        The tzBTC token contract.
+    receiver: sp.TAddress
+        The receiver of the minted tokens.
+    amount: sp.TNat
+        The amount of tokens minted.
+
+    Raises
+    ------
+    Invalid Entrypoint: mint
+        If the token contract does not have a mint entrypoint.
+    """
+    mint_entrypoint = sp.contract(
+        sp.TPair(sp.TAddress, sp.TNat), token_address, entry_point="mint"
+    ).open_some("Invalid Entrypoint: mint")
+
+    sp.transfer(sp.pair(receiver, amount), sp.mutez(0), mint_entrypoint)
+
+
+def execute_token_burn(token_address, redeem_address, amount):
+    """
+    Burns tzBTC held by the calling contract. The amount is first transferred to the
+    redeem address and then burnt on the tzBTC contract.
+
+    Parameters
+    ----------
+    token_address: sp.TAddress
+        The tzBTC token contract.
+    redeem_address: sp.TAddress
+        The address from which the tokens are burnt.
+    amount: sp.TNat
+        The amount of tokens burnt.
+
+    Raises
+    ------
+    Invalid Entrypoint: burn
+        If the token contract does not have a burn entrypoint.
+    """
+    execute_fa1_token_transfer(token_address, sp.self_address, redeem_address, amount)
+
+    burn_entrypoint = sp.contract(sp.TNat, token_address, entry_point="burn").open_some(
+        "Invalid Entrypoint: burn"
+    )
+    sp.transfer(amount, sp.mutez(0), burn_entrypoint)
+
+
 """
 """
 
 
 class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
+
     def __init__(
         self,
-        administrators=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
+        roles=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
         administrators_num=sp.nat(0),
-        gatekeepers=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TUnit),
-        trusted_signers=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TUnit),
+        next_signer_index=sp.nat(0),
+        active_signers=sp.nat(0),
         threshold=sp.nat(3),
         token_address=sp.address("KT1PWx2mnDueood7fEmfbBDKx1D9BAnnXitn"),
         treasury_address=sp.address("KT1PWx2mnDueood7fEmfbBDKx1D9BAnnXitn"),
@@ -159,7 +418,13 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
         min_burn_amount=sp.nat(100),
         redeem_address=sp.address("KT1PWx2mnDueood7fEmfbBDKx1D9BAnnXitn"),
         max_btc_network_fee=sp.nat(1000000),
-        max_utxo_per_tx_count = sp.nat(20)
+        max_utxo_per_tx_count=sp.nat(20),
+        candidate_expiry_levels=sp.nat(40320),
+        emit_burn_signatures=False,
+        burn_prune_levels=sp.nat(40320),
+        fast_mint=False,
+        whitelist_root=sp.none,
+        lazy_entry_points=False,
     ):
         metadata = sp.big_map(
             l={
@@ -176,10 +441,10 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
 
         self.init_type(
             sp.TRecord(
-                administrators=sp.TBigMap(sp.TAddress, sp.TNat),
+                roles=sp.TBigMap(sp.TAddress, sp.TNat),
                 administrators_num=sp.TNat,
-                gatekeepers=sp.TBigMap(sp.TAddress, sp.TUnit),
-                trusted_signers=sp.TBigMap(sp.TAddress, sp.TUnit),
+                next_signer_index=sp.TNat,
+                active_signers=sp.TNat,
                 whitelisted_addresses=sp.TBigMap(sp.TAddress, sp.TUnit),
                 threshold=sp.TNat,
                 min_burn_amount=sp.TNat,
@@ -187,7 +452,11 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
                 max_btc_network_fee=sp.TNat,
                 burn_id_counter=sp.TNat,
                 burns_map=sp.TBigMap(sp.TNat, Burn.get_type()),
-                utxo_map=sp.TBigMap(UTXO.get_key_type(), UTXO.get_value_type()),
+                burn_signatures=sp.TBigMap(BurnSignature.get_key_type(), sp.TBytes),
+                burn_signed_utxos=sp.TBigMap(Burn.get_signer_key_type(), sp.TNat),
+                burn_signers=sp.TBigMap(sp.TNat, Burn.get_signers_type()),
+                burn_batches=sp.TBigMap(sp.TNat, sp.TSet(sp.TNat)),
+                utxo_map=sp.TBigMap(sp.TBytes, UTXO.get_value_type()),
                 candidate_utxo_map=sp.TBigMap(
                     UTXO.get_key_type(), UTXO.get_utxo_candidate_value_type()
                 ),
@@ -197,22 +466,37 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
                 redeem_address=sp.TAddress,
                 btc_gatekeeper_address=sp.TBytes,
                 custody_btc_address=sp.TBytes,
-                max_utxo_per_tx_count=sp.TNat
+                max_utxo_per_tx_count=sp.TNat,
+                accrued_fees=sp.TNat,
+                relay_nonces=sp.TBigMap(sp.TAddress, sp.TNat),
+                reserves=Reserves.get_type(),
+                open_burns=sp.TBigMap(sp.TNat, sp.TNat),
+                candidate_expiry_levels=sp.TNat,
+                emit_burn_signatures=sp.TBool,
+                burn_prune_levels=sp.TNat,
+                fast_mint=sp.TBool,
+                whitelist_root=sp.TOption(sp.TBytes),
             )
         )
 
         self.init(
-            administrators=administrators,
+            roles=roles,
             administrators_num=administrators_num,
-            gatekeepers=gatekeepers,
-            trusted_signers=trusted_signers,
+            next_signer_index=next_signer_index,
+            active_signers=active_signers,
             whitelisted_addresses=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TUnit),
             threshold=threshold,
             min_burn_amount=min_burn_amount,
             burns_map=sp.big_map(l={}, tkey=sp.TNat, tvalue=Burn.get_type()),
-            utxo_map=sp.big_map(
-                l={}, tkey=UTXO.get_key_type(), tvalue=UTXO.get_value_type()
+            burn_signatures=sp.big_map(
+                l={}, tkey=BurnSignature.get_key_type(), tvalue=sp.TBytes
+            ),
+            burn_signed_utxos=sp.big_map(
+                l={}, tkey=Burn.get_signer_key_type(), tvalue=sp.TNat
             ),
+            burn_signers=sp.big_map(l={}, tkey=sp.TNat, tvalue=Burn.get_signers_type()),
+            burn_batches=sp.big_map(l={}, tkey=sp.TNat, tvalue=sp.TSet(sp.TNat)),
+            utxo_map=sp.big_map(l={}, tkey=sp.TBytes, tvalue=UTXO.get_value_type()),
             candidate_utxo_map=sp.big_map(
                 l={},
                 tkey=UTXO.get_key_type(),
@@ -227,247 +511,893 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
             btc_gatekeeper_address=btc_gatekeeper_address,
             custody_btc_address=custody_btc_address,
             max_utxo_per_tx_count=max_utxo_per_tx_count,
+            accrued_fees=sp.nat(0),
+            relay_nonces=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
+            reserves=Reserves.make(sp.nat(0), sp.nat(0), sp.nat(0), sp.nat(0)),
+            open_burns=sp.big_map(l={}, tkey=sp.TNat, tvalue=sp.TNat),
+            candidate_expiry_levels=candidate_expiry_levels,
+            emit_burn_signatures=emit_burn_signatures,
+            burn_prune_levels=burn_prune_levels,
+            fast_mint=fast_mint,
+            whitelist_root=whitelist_root,
             metadata=metadata,
         )
 
+        # The code of the entrypoints that are not marked with lazify=False is stored
+        # in a big_map and only loaded when they are called, so the hot mint and burn
+        # entrypoints do not pay to deserialize the administration entrypoints.
+        if lazy_entry_points:
+            self.add_flag("lazy-entry-points")
+
     @sp.private_lambda(with_storage="read-only", with_operations=False, wrap_call=True)
-    def verify_is_gatekeeper(self, unit):
+    def verify_is_verified_user(self, proof):
         """
-        Verifies if the sender of the operation is a gatekeeper.
+        Verifies if the sender of the operation is a verified user. Without a proof,
+        the sender has to be in the whitelisted_addresses big_map. With a proof, the
+        sender has to be a leaf of the Merkle tree whose root is whitelist_root (see
+        utils/merkle_whitelist.py): the leaf is the blake2b hash of the packed address
+        and every parent is the blake2b hash of the concatenation of its two children,
+        the smallest one first.
 
         Parameters
         ----------
-        unit: sp.TUnit
-            Unit parameter
+        proof: sp.TOption(sp.TList(sp.TBytes))
+            The hashes of the siblings on the path from the leaf of the sender to the
+            root, if the sender proves its membership of the Merkle whitelist.
 
         Raises
         ------
-        NotGatekeeper
-            If the sender of the operation is not a gatekeeper
+        NotVerifiedUser
+            If the sender of the operation is not a verified user
         """
-        sp.verify(
-            self.data.gatekeepers.contains(sp.sender), message=Errors.NOT_GATEKEEPER
-        )
+        sp.set_type(proof, sp.TOption(sp.TList(sp.TBytes)))
 
-    @sp.private_lambda(with_storage="read-only", with_operations=False, wrap_call=True)
-    def verify_is_trusted_signer(self, unit):
+        with proof.match_cases() as arg:
+            with arg.match("None"):
+                sp.verify(
+                    self.data.whitelisted_addresses.contains(sp.sender),
+                    message=Errors.NOT_VERIFIED_USER,
+                )
+            with arg.match("Some") as siblings:
+                node = sp.local("node", sp.blake2b(sp.pack(sp.sender)))
+                with sp.for_("sibling", siblings) as sibling:
+                    with sp.if_(node.value < sibling):
+                        node.value = sp.blake2b(node.value + sibling)
+                    with sp.else_():
+                        node.value = sp.blake2b(sibling + node.value)
+                sp.verify(
+                    self.data.whitelist_root == sp.some(node.value),
+                    message=Errors.NOT_VERIFIED_USER,
+                )
+
+    def emit_event(self, payload, tag):
         """
-        Verifies if the sender of the operation is a trusted signer.
+        Emits a typed event. Every event of the ledger is emitted through this method.
 
         Parameters
         ----------
-        unit: sp.TUnit
-            Unit parameter
-
-        Raises
-        ------
-        NotTrustedSigner
-            If the sender of the operation is not a trusted signer
+        payload: any
+            The payload of the event, emitted with its type.
+        tag: str
+            The tag of the event.
         """
-        sp.verify(
-            self.data.trusted_signers.contains(sp.sender),
-            message=Errors.NOT_TRUSTED_SIGNER,
-        )
+        sp.emit(payload, tag=tag, with_type=True)
 
-    @sp.private_lambda(with_storage="read-only", with_operations=False, wrap_call=True)
-    def verify_is_verified_user(self, unit):
+    def verify_txid(self, txid):
         """
-        Verifies if the sender of the operation is a verified user.
+        Checks that a txid has the 32 bytes of a BTC transaction id. The packed keys of
+        the UTXO map concatenate the txid and the output number, so they are only
+        unique if every txid has the same length.
 
         Parameters
         ----------
-        unit: sp.TUnit
-            Unit parameter
+        txid: sp.TBytes
+            The transaction id of an UTXO.
 
         Raises
         ------
-        NotVerifiedUser
-            If the sender of the operation is not a verified user
+        InvalidTxid
+            If the txid is not 32 bytes long.
         """
-        sp.verify(
-            self.data.whitelisted_addresses.contains(sp.sender),
-            message=Errors.NOT_VERIFIED_USER,
-        )
+        sp.verify(sp.len(txid) == 32, message=Errors.INVALID_TXID)
 
-    @sp.entry_point(check_no_incoming_transfer=True)
-    def confirm_utxo(self, param):
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def register_utxo_confirmation(self, param):
         """
-        Confirms an UTXO which will be used for mint if enough signers confirm it.
-        This entrypoint can only be called by a trusted signer and it adds an UTXO
-        candidate to the storage or increase the number of confirmations for the given
-        candidate UTXO.
-        If one candidate has enough confirmations, it creates a new entry in the UTXO
-        map to be used for a mint.
+        Registers the confirmation of a signer for an UTXO candidate. If the candidate
+        reaches the threshold, the UTXO is moved to the UTXO map with the given state
+        and the candidate entry is removed. Emits a candidate_vote event for every
+        registered confirmation and an utxo_promoted event when the UTXO is moved.
+
+        The confirmations are tallied with the index of the signer: the approvers of an
+        UTXO and of each of its candidates are bitmasks of signer indices and each
+        candidate is stored under the hash of its receiver and amount.
 
         Parameters
         ----------
-        amount: sp.TNat
-            The amount spent by the UTXO.
-        output_no: sp.TNat
-            The output number associated with the UTXO
-        receiver: sp.TAddress
-            The receiving tezos address of tzBTC once enough confirmations are sent.
-        txid: sp.TBytes
-            The transaction id of the UTXO.
+        signer: sp.TAddress
+            The trusted signer confirming the UTXO.
+        utxo_key: UTXO.get_key_type()
+            The key of the confirmed UTXO.
+        candidate_key: UTXO.get_candidate_key_type()
+            The receiver and amount confirmed by the signer.
+        utxo_state: sp.TNat
+            The state of the UTXO once it reaches the threshold.
+        skip_confirmed: sp.TBool
+            If true, the confirmation is ignored when the signer already confirmed the
+            UTXO instead of failing.
 
         Raises
         ------
-        NotTrustedSigner
-            If the caller is not a trusted signer of the contract.
-        AmountTooLow
-            If the amount in the UTXO is lower than the service fee.
-        UTXOAlreadyConfirmed
-            If the UTXO has enough confirmations.
         MultipleConfirmationsFromSameSignerNotAllowed
-            If the same sender tries to confirm the same UTXO more than once (even if
-            the parameters are different)
+            If the signer already confirmed the UTXO and skip_confirmed is false.
         """
-        param_type = sp.TRecord(
-            amount=sp.TNat, output_no=sp.TNat, receiver=sp.TAddress, txid=sp.TBytes
-        ).layout(("amount", ("output_no", ("receiver", "txid"))))
-        sp.set_type(param, param_type)
-
-        self.verify_is_trusted_signer(sp.unit)
-        sp.verify(param.amount >= self.data.service_fee, message=Errors.AMOUNT_TOO_LOW)
-        utxo_key = sp.local("utxo_key", UTXO.make_key(param.txid, param.output_no))
-        sp.verify(
-            ~self.data.utxo_map.contains(utxo_key.value),
-            message=Errors.UTXO_ALREADY_CONFIRMED,
+        sp.set_type(
+            param,
+            sp.TRecord(
+                signer=sp.TAddress,
+                utxo_key=UTXO.get_key_type(),
+                candidate_key=UTXO.get_candidate_key_type(),
+                utxo_state=sp.TNat,
+                skip_confirmed=sp.TBool,
+            ),
         )
 
+        signer_index = sp.local(
+            "signer_index", self.data.roles[param.signer] >> Roles.SIGNER_INDEX_OFFSET
+        )
         candidate_utxo = sp.local(
             "candidate_utxo",
             self.data.candidate_utxo_map.get(
-                utxo_key.value,
+                param.utxo_key,
                 default_value=UTXO.make_utxo_candidate_value_type(
-                    sp.set([]), sp.map({})
+                    sp.nat(0), sp.map({}), sp.level
                 ),
             ),
         )
-        sp.verify(
-            ~candidate_utxo.value.approvers.contains(sp.sender),
-            message=Errors.SIGNER_ALREADY_CONFIRMED,
-        )
-        candidate_utxo.value.approvers.add(sp.sender)
-
-        candidate_key = sp.local(
-            "candidate_key",
-            UTXO.make_candidate_key_type(sp.some(param.receiver), param.amount),
-        )
-        candidate_approvers = sp.local(
-            "candidate_approvers",
-            candidate_utxo.value.candidates.get(
-                candidate_key.value, default_value=sp.set([])
-            ),
-        )
-        candidate_approvers.value.add(sp.sender)
-        candidate_utxo.value.candidates[candidate_key.value] = candidate_approvers.value
-        self.data.candidate_utxo_map[utxo_key.value] = candidate_utxo.value
+        with sp.if_((candidate_utxo.value.approvers >> signer_index.value) % 2 == 1):
+            sp.verify(param.skip_confirmed, message=Errors.SIGNER_ALREADY_CONFIRMED)
+        with sp.else_():
+            signer_bit = sp.local("signer_bit", sp.nat(1) << signer_index.value)
+            candidate_utxo.value.approvers += signer_bit.value
 
-        with sp.if_(
-            sp.len(candidate_utxo.value.candidates[candidate_key.value])
-            >= self.data.threshold
-        ):
-            self.data.utxo_map[utxo_key.value] = UTXO.make_value(
-                state=UTXO_STATE.INIT,
-                receiver=candidate_key.value.receiver,
-                amount=candidate_key.value.amount,
+            candidate_hash = sp.local(
+                "candidate_hash",
+                UTXO.make_candidate_hash(
+                    param.candidate_key.receiver, param.candidate_key.amount
+                ),
+            )
+            candidate_votes = sp.local(
+                "candidate_votes",
+                candidate_utxo.value.candidates.get(
+                    candidate_hash.value,
+                    default_value=UTXO.make_candidate_votes(sp.nat(0), sp.nat(0)),
+                ),
+            )
+            candidate_votes.value.approvers += signer_bit.value
+            candidate_votes.value.count += 1
+            candidate_utxo.value.candidates[candidate_hash.value] = (
+                candidate_votes.value
+            )
+            self.emit_event(
+                sp.record(
+                    utxo_key=param.utxo_key,
+                    signer=param.signer,
+                    receiver=param.candidate_key.receiver,
+                    amount=param.candidate_key.amount,
+                    votes=candidate_votes.value.count,
+                ),
+                tag="candidate_vote",
             )
-            del self.data.candidate_utxo_map[utxo_key.value]
-
-    @sp.entry_point(check_no_incoming_transfer=True)
-    def confirm_change_utxo(self, created_utxos):
-        """
-        Confirms a change in a list UTXOs. All UTXOs that are used for a burn, will either
-        be completely spent or split. If an UTXO is split after a burn, the signer should
-        call this entrypoint to add the newly created UTXO to the candidates map.
 
-        The old UTXO would have been completely removed from the storage in the
-        confirm_burn entrypoint.
+            with sp.if_(candidate_votes.value.count >= self.data.threshold):
+                utxo_value = self.make_utxo_value(
+                    param.utxo_state,
+                    param.candidate_key.receiver,
+                    param.candidate_key.amount,
+                )
+                # The callers only confirm UTXOs that are not in the UTXO map yet.
+                self.add_to_reserves(utxo_value.value)
+                self.data.utxo_map[UTXO.make_packed_key(param.utxo_key)] = (
+                    utxo_value.value
+                )
+                del self.data.candidate_utxo_map[param.utxo_key]
+                self.emit_event(
+                    sp.record(utxo_key=param.utxo_key, utxo=utxo_value.value),
+                    tag="utxo_promoted",
+                )
+            with sp.else_():
+                self.data.candidate_utxo_map[param.utxo_key] = candidate_utxo.value
 
-        For each candidate of a new UTXO we increase the number of approvers. If there
-        are enough approvers for a candidate, that candidate becomes the new UTXO, it is
-        added to the utxo_map and the UTXO can be later spent by a burn (the state of
-        UTXO becomes USED_FOR_MINT).
+    def make_utxo_value(self, utxo_state, receiver, amount):
+        """
+        Builds the value of an entry of the UTXO map from its state.
 
         Parameters
         ----------
-        created_utxos: sp.TList(single_param_type)
-            A list of all new created UTXOs after a burn.
-        A single entry in the list contains:
+        utxo_state: sp.TNat
+            The state of the UTXO (see UTXO_STATE).
+        receiver: sp.TOption(sp.TAddress)
+            The tezos address that should receive the tzBTC (dropped once minted).
         amount: sp.TNat
-            The amount spent by the UTXO.
-        output_no: sp.TNat
-            The output number associated with the UTXO
-        txid: sp.TBytes
-            The transaction id of the UTXO.
+            The amount of the UTXO.
 
-        Raises
-        ------
-        NotTrustedSigner
-            If the caller is not a trusted signer of the contract.
-        MultipleConfirmationsFromSameSignerNotAllowed
-            If the same sender tries to confirm the same UTXO more than once (even if
-            the parameters are different)
+        Returns
+        -------
+        sp.local(UTXO.get_value_type())
+            A local holding the value.
         """
-        single_param_type = sp.TRecord(
-            txid=sp.TBytes, output_no=sp.TNat, amount=sp.TNat
-        ).layout(("txid", ("output_no", "amount")))
-        sp.set_type(created_utxos, sp.TList(single_param_type))
+        utxo_value = sp.local("utxo_value", UTXO.make_used_for_mint_value(amount))
+        with sp.if_(utxo_state == UTXO_STATE.INIT):
+            utxo_value.value = UTXO.make_init_value(receiver, amount)
+        return utxo_value
 
-        self.verify_is_trusted_signer(sp.unit)
+    def add_to_reserves(self, utxo_value):
+        """
+        Adds an UTXO entering the UTXO map to the reserve totals.
 
-        with sp.for_("utxo", created_utxos) as utxo:
-            utxo_key = sp.local("utxo_key", UTXO.make_key(utxo.txid, utxo.output_no))
+        Parameters
+        ----------
+        utxo_value: UTXO.get_value_type()
+            The UTXO added to the UTXO map.
+        """
+        with utxo_value.match_cases() as arg:
+            with arg.match("init") as init:
+                self.data.reserves.init_amount += init.amount
+            with arg.match("used_for_mint") as amount:
+                self.data.reserves.minted_amount += amount
+        self.data.reserves.utxo_count += 1
+
+    def remove_from_reserves(self, utxo_value):
+        """
+        Removes an UTXO leaving the UTXO map from the reserve totals.
 
-            with sp.if_(~self.data.utxo_map.contains(utxo_key.value)):
-                candidate_utxo = sp.local(
-                    "candidate_utxo",
-                    self.data.candidate_utxo_map.get(
-                        utxo_key.value,
-                        default_value=sp.record(
-                            approvers=sp.set([]), candidates=sp.map({})
-                        ),
-                    ),
+        Parameters
+        ----------
+        utxo_value: UTXO.get_value_type()
+            The UTXO removed from the UTXO map.
+        """
+        with utxo_value.match_cases() as arg:
+            with arg.match("init") as init:
+                self.data.reserves.init_amount = sp.as_nat(
+                    self.data.reserves.init_amount - init.amount
                 )
-                sp.verify(
-                    ~candidate_utxo.value.approvers.contains(sp.sender),
-                    message=Errors.SIGNER_ALREADY_CONFIRMED,
+            with arg.match("used_for_mint") as amount:
+                self.data.reserves.minted_amount = sp.as_nat(
+                    self.data.reserves.minted_amount - amount
                 )
-                candidate_utxo.value.approvers.add(sp.sender)
+        self.data.reserves.utxo_count = sp.as_nat(self.data.reserves.utxo_count - 1)
 
-                candidate_key = sp.local(
-                    "candidate_key", UTXO.make_candidate_key_type(sp.none, utxo.amount)
-                )
-                candidate_approvers = sp.local(
-                    "candidate_approvers",
-                    candidate_utxo.value.candidates.get(
-                        candidate_key.value, default_value=sp.set([])
-                    ),
-                )
-                candidate_approvers.value.add(sp.sender)
-                candidate_utxo.value.candidates[candidate_key.value] = (
-                    candidate_approvers.value
-                )
-                self.data.candidate_utxo_map[utxo_key.value] = candidate_utxo.value
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def write_utxo(self, param):
+        """
+        Creates or updates an entry of the UTXO map and keeps the reserve totals in
+        sync with it. Emits an utxo_set event.
 
-                with sp.if_(
-                    sp.len(candidate_utxo.value.candidates[candidate_key.value])
-                    >= self.data.threshold
-                ):
-                    self.data.utxo_map[utxo_key.value] = UTXO.make_value(
-                        state=UTXO_STATE.USED_FOR_MINT,
-                        receiver=candidate_key.value.receiver,
-                        amount=candidate_key.value.amount,
+        Parameters
+        ----------
+        utxo_key: UTXO.get_key_type()
+            The key of the UTXO.
+        utxo_value: UTXO.get_value_type()
+            The new value of the UTXO.
+        """
+        sp.set_type(
+            param,
+            sp.TRecord(utxo_key=UTXO.get_key_type(), utxo_value=UTXO.get_value_type()),
+        )
+        self.verify_txid(param.utxo_key.txid)
+
+        packed_key = sp.local("packed_key", UTXO.make_packed_key(param.utxo_key))
+        with sp.if_(self.data.utxo_map.contains(packed_key.value)):
+            self.remove_from_reserves(self.data.utxo_map[packed_key.value])
+        self.add_to_reserves(param.utxo_value)
+        self.data.utxo_map[packed_key.value] = param.utxo_value
+        self.emit_event(
+            sp.record(utxo_key=param.utxo_key, utxo=param.utxo_value),
+            tag="utxo_set",
+        )
+
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def delete_utxo(self, utxo_key):
+        """
+        Removes an entry of the UTXO map, if present, and keeps the reserve totals in
+        sync with it. Emits an utxo_removed event if the entry was present.
+
+        Parameters
+        ----------
+        utxo_key: UTXO.get_key_type()
+            The key of the UTXO.
+        """
+        sp.set_type(utxo_key, UTXO.get_key_type())
+        self.verify_txid(utxo_key.txid)
+
+        packed_key = sp.local("packed_key", UTXO.make_packed_key(utxo_key))
+        with sp.if_(self.data.utxo_map.contains(packed_key.value)):
+            self.remove_from_reserves(self.data.utxo_map[packed_key.value])
+            del self.data.utxo_map[packed_key.value]
+            self.emit_event(utxo_key, tag="utxo_removed")
+
+    def is_candidate_purgeable(self, candidate):
+        """
+        Checks if an UTXO candidate can be purged: either it expired (it was created
+        more than candidate_expiry_levels levels ago) or none of its candidates can
+        reach the threshold anymore, even if all the trusted signers that did not
+        confirm the UTXO yet vote for it.
+
+        Parameters
+        ----------
+        candidate: UTXO.get_utxo_candidate_value_type()
+            The entry of the candidate map.
+
+        Returns
+        -------
+        sp.TBool
+            True if the candidate can be purged.
+        """
+        remaining_votes = sp.local("remaining_votes", sp.nat(0))
+        signers = sp.local("signers", self.data.active_signers)
+        approvers = sp.local("approvers", candidate.approvers)
+        with sp.while_(signers.value > 0):
+            with sp.if_((signers.value % 2 == 1) & (approvers.value % 2 == 0)):
+                remaining_votes.value += 1
+            signers.value = signers.value >> 1
+            approvers.value = approvers.value >> 1
+
+        max_votes = sp.local("max_votes", sp.nat(0))
+        with sp.for_("votes", candidate.candidates.values()) as votes:
+            with sp.if_(votes.count > max_votes.value):
+                max_votes.value = votes.count
+
+        return (
+            sp.level >= candidate.created_at + self.data.candidate_expiry_levels
+        ) | (max_votes.value + remaining_votes.value < self.data.threshold)
+
+    def load_burn_signers(self, burn_id):
+        """
+        Returns the signers of a burn (see sign_burn_as).
+
+        Parameters
+        ----------
+        burn_id: sp.TNat
+            The id of the burn.
+
+        Returns
+        -------
+        Burn.get_signers_type()
+            The signers that signed at least one UTXO of the burn and the number of
+            signers that signed all of them.
+        """
+        return self.data.burn_signers.get(
+            burn_id, default_value=Burn.make_signers(sp.set([]), sp.nat(0))
+        )
+
+    def count_bits(self, bitset):
+        """
+        Counts the bits set in a bitset.
+
+        Parameters
+        ----------
+        bitset: sp.TNat
+            The bitset.
+
+        Returns
+        -------
+        sp.TNat
+            The number of bits set.
+        """
+        count = sp.local("count", sp.nat(0))
+        bits = sp.local("bits", bitset)
+        with sp.while_(bits.value > 0):
+            count.value += bits.value % 2
+            bits.value = bits.value >> 1
+        return count.value
+
+    def is_burn_prunable(self, burn_id, burn):
+        """
+        Checks if a burn can be pruned: it was confirmed at least burn_prune_levels
+        levels ago and at least threshold signers signed all of its UTXOs, so every
+        UTXO of the burn holds enough signatures to be spent.
+
+        Parameters
+        ----------
+        burn_id: sp.TNat
+            The id of the burn.
+        burn: Burn.get_type()
+            The entry of the burns map.
+
+        Returns
+        -------
+        sp.TBool
+            True if the burn can be pruned.
+        """
+        return (
+            (burn.state == BurnState.CONFIRMED)
+            & (sp.level >= burn.confirmed_at + self.data.burn_prune_levels)
+            & (self.load_burn_signers(burn_id).complete_signers >= self.data.threshold)
+        )
+
+    def create_burn(self, amount, receiver, optional_callback, proof):
+        """
+        Creates a new burn entry for the sender and transfers the amount of tzBTC to
+        this contract (see the propose_burn entrypoint).
+
+        Parameters
+        ----------
+        amount: sp.TNat
+            The amount of tzBTC to be burnt.
+        receiver: sp.TBytes
+            The scriptPubKey of the receiving BTC address.
+        optional_callback: sp.TOption(sp.TContract(sp.TNat))
+            A optional callback contract to return the newly created burn entry.
+        proof: sp.TOption(sp.TList(sp.TBytes))
+            The Merkle proof of the sender, if it is not in the whitelisted_addresses
+            big_map (see verify_is_verified_user).
+        """
+        self.verify_is_verified_user(proof)
+        sp.verify(amount >= self.data.min_burn_amount, message=Errors.AMOUNT_TOO_LOW)
+
+        self.data.burns_map[self.data.burn_id_counter] = Burn.make(
+            proposer=sp.sender,
+            receiver=receiver,
+            amount=amount,
+            state=BurnState.PROPOSED,
+            fee=0,
+            utxos=sp.map({}),
+        )
+        self.emit_event(
+            sp.record(
+                burn_id=self.data.burn_id_counter,
+                proposer=sp.sender,
+                receiver=receiver,
+                amount=amount,
+            ),
+            tag="burn_proposed",
+        )
+
+        self.data.open_burns[self.data.burn_id_counter] = BurnState.PROPOSED
+        self.data.burn_id_counter += 1
+        self.data.reserves.proposed_burn_amount += amount
+        execute_fa1_token_transfer(
+            self.data.token_address, sp.sender, sp.self_address, amount
+        )
+
+        with sp.if_(optional_callback.is_some()):
+            callback = sp.local("callback", optional_callback.open_some())
+            sp.transfer(self.data.burn_id_counter, sp.mutez(0), callback.value)
+
+    def set_address_verified(self, address, verified):
+        """
+        Adds/Removes an address from the big_map of verified addresses (see the
+        verify_address entrypoint).
+
+        Parameters
+        ----------
+        address: sp.TAddress
+            The address to be added to or removed from the verified big map.
+        verified: sp.TBool
+            If true the address is added, if false the address is removed.
+        """
+        with sp.if_(verified):
+            self.data.whitelisted_addresses[address] = sp.unit
+        with sp.else_():
+            del self.data.whitelisted_addresses[address]
+
+    def fast_mint_utxo(self, utxo_key, receiver):
+        """
+        Mints a deposit UTXO as soon as its confirmation reached the threshold, if
+        fast_mint is set and the receiver is whitelisted. The UTXO is moved to the
+        USED_FOR_MINT state and minted exactly as in the mint entrypoint. Deposits for
+        other receivers stay in the INIT state until a gatekeeper mints them.
+
+        Only the whitelisted_addresses big_map is checked: the confirmations carry no
+        Merkle proof, so the receivers verified only through whitelist_root (see
+        set_whitelist_root) are always minted in two stages.
+
+        Parameters
+        ----------
+        utxo_key: UTXO.get_key_type()
+            The key of an UTXO that was not in the UTXO map before the confirmation.
+        receiver: sp.TAddress
+            The receiver confirmed for the UTXO.
+        """
+        with sp.if_(
+            self.data.fast_mint
+            & self.data.whitelisted_addresses.contains(receiver)
+            & self.data.utxo_map.contains(UTXO.make_packed_key(utxo_key))
+        ):
+            minted = sp.local("minted", self.use_utxo_for_mint(utxo_key))
+            execute_token_mint(
+                self.data.token_address, minted.value.receiver, minted.value.amount
+            )
+            self.data.accrued_fees += self.data.service_fee
+
+    def confirm_utxos_as(self, signer, utxos):
+        """
+        Registers the confirmations of a trusted signer for a list of UTXOs (see the
+        confirm_utxos entrypoint).
+
+        Parameters
+        ----------
+        signer: sp.TAddress
+            The trusted signer confirming the UTXOs.
+        utxos: sp.TList(UTXO.get_confirmation_type())
+            The UTXOs to be confirmed.
+        """
+        with sp.for_("utxo", utxos) as utxo:
+            sp.verify(
+                utxo.amount >= self.data.service_fee, message=Errors.AMOUNT_TOO_LOW
+            )
+            self.verify_txid(utxo.txid)
+            utxo_key = sp.local("utxo_key", UTXO.make_key(utxo.txid, utxo.output_no))
+
+            with sp.if_(
+                self.data.utxo_map.contains(UTXO.make_packed_key(utxo_key.value))
+            ):
+                sp.verify(utxo.skip_confirmed, message=Errors.UTXO_ALREADY_CONFIRMED)
+            with sp.else_():
+                self.register_utxo_confirmation(
+                    sp.record(
+                        signer=signer,
+                        utxo_key=utxo_key.value,
+                        candidate_key=UTXO.make_candidate_key_type(
+                            sp.some(utxo.receiver), utxo.amount
+                        ),
+                        utxo_state=UTXO_STATE.INIT,
+                        skip_confirmed=utxo.skip_confirmed,
                     )
-                    del self.data.candidate_utxo_map[utxo_key.value]
+                )
+                self.fast_mint_utxo(utxo_key.value, utxo.receiver)
 
-    @sp.entry_point(check_no_incoming_transfer=True)
+    def confirm_change_utxos_as(self, signer, created_utxos):
+        """
+        Registers the confirmations of a trusted signer for the change UTXOs created by
+        a burn (see the confirm_change_utxo entrypoint).
+
+        Parameters
+        ----------
+        signer: sp.TAddress
+            The trusted signer confirming the UTXOs.
+        created_utxos: sp.TList(UTXO.get_change_confirmation_type())
+            The new UTXOs created after a burn.
+        """
+        with sp.for_("utxo", created_utxos) as utxo:
+            self.verify_txid(utxo.txid)
+            utxo_key = sp.local("utxo_key", UTXO.make_key(utxo.txid, utxo.output_no))
+
+            with sp.if_(
+                ~self.data.utxo_map.contains(UTXO.make_packed_key(utxo_key.value))
+            ):
+                self.register_utxo_confirmation(
+                    sp.record(
+                        signer=signer,
+                        utxo_key=utxo_key.value,
+                        candidate_key=UTXO.make_candidate_key_type(
+                            sp.none, utxo.amount
+                        ),
+                        utxo_state=UTXO_STATE.USED_FOR_MINT,
+                        skip_confirmed=False,
+                    )
+                )
+
+    def sign_burn_as(self, signer, burn_id, utxos_with_signature):
+        """
+        Stores the signatures of a trusted signer for the UTXOs of a burn, or emits
+        them as burn_signature events if emit_burn_signatures is set (see the sign_burn
+        entrypoint).
+
+        Parameters
+        ----------
+        signer: sp.TAddress
+            The trusted signer signing the UTXOs.
+        burn_id: sp.TNat
+            The id of the burn with the associated UTXOs.
+        utxos_with_signature: sp.TList(BurnSignature.get_utxo_signature_type())
+            A list of UTXOs and their associated signature.
+        """
+        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
+
+        burn = sp.local("burn", self.data.burns_map[burn_id])
+        signer_key = sp.local("signer_key", Burn.make_signer_key(burn_id, signer))
+        previous_bitset = sp.local(
+            "previous_bitset",
+            self.data.burn_signed_utxos.get(signer_key.value, default_value=0),
+        )
+        signed_bitset = sp.local("signed_bitset", previous_bitset.value)
+
+        # The UTXOs already signed by the signer are tracked in a bitset rather than
+        # looked up in burn_signatures, so that the count is exact across calls even
+        # when the signatures are only emitted.
+        utxo_indexes = sp.local(
+            "utxo_indexes", sp.map(l={}, tkey=UTXO.get_key_type(), tvalue=sp.TNat)
+        )
+        with sp.for_("burn_utxo_key", burn.value.utxos.keys()) as burn_utxo_key:
+            utxo_indexes.value[burn_utxo_key] = sp.len(utxo_indexes.value)
+
+        with sp.for_("entry", utxos_with_signature) as entry:
+            utxo_key = sp.local("utxo_key", UTXO.make_key(entry.txid, entry.output_no))
+            sp.verify(
+                utxo_indexes.value.contains(utxo_key.value),
+                message=Errors.UTXO_NOT_PART_OF_BURN,
+            )
+            utxo_index = sp.local("utxo_index", utxo_indexes.value[utxo_key.value])
+            with sp.if_((signed_bitset.value >> utxo_index.value) % 2 == 0):
+                signed_bitset.value += sp.nat(1) << utxo_index.value
+
+            signature_key = sp.local(
+                "signature_key",
+                BurnSignature.make_key(burn_id, utxo_key.value, signer),
+            )
+            with sp.if_(self.data.emit_burn_signatures):
+                self.emit_event(
+                    sp.record(key=signature_key.value, signature=entry.signature),
+                    tag="burn_signature",
+                )
+            with sp.else_():
+                self.data.burn_signatures[signature_key.value] = entry.signature
+
+        # The burn entry is never written: the bitset of the signer is only written
+        # when it changes, and the signers of the burn only when the signer signs its
+        # first UTXO or completes the burn. A burn fully signed by threshold signers
+        # leaves the open burns.
+        with sp.if_(signed_bitset.value != previous_bitset.value):
+            self.data.burn_signed_utxos[signer_key.value] = signed_bitset.value
+            complete_bitset = sp.local(
+                "complete_bitset",
+                sp.as_nat((sp.nat(1) << sp.len(burn.value.utxos)) - 1),
+            )
+            with sp.if_(
+                (previous_bitset.value == 0)
+                | (signed_bitset.value == complete_bitset.value)
+            ):
+                burn_signers = sp.local("burn_signers", self.load_burn_signers(burn_id))
+                burn_signers.value.signers.add(signer)
+                with sp.if_(signed_bitset.value == complete_bitset.value):
+                    burn_signers.value.complete_signers += 1
+                    with sp.if_(
+                        burn_signers.value.complete_signers >= self.data.threshold
+                    ):
+                        del self.data.open_burns[burn_id]
+                self.data.burn_signers[burn_id] = burn_signers.value
+        self.emit_event(
+            sp.record(
+                burn_id=burn_id,
+                signer=signer,
+                utxos=sp.len(utxos_with_signature),
+                signed_utxos=self.count_bits(signed_bitset.value),
+            ),
+            tag="burn_signed",
+        )
+
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
+    def confirm_utxo(self, param):
+        """
+        Confirms an UTXO which will be used for mint if enough signers confirm it.
+        This entrypoint can only be called by a trusted signer and it adds an UTXO
+        candidate to the storage or increase the number of confirmations for the given
+        candidate UTXO.
+        If one candidate has enough confirmations, it creates a new entry in the UTXO
+        map to be used for a mint. If fast_mint is set and the receiver is whitelisted,
+        the UTXO is minted right away by the same operation (see fast_mint_utxo).
+
+        Parameters
+        ----------
+        amount: sp.TNat
+            The amount spent by the UTXO.
+        output_no: sp.TNat
+            The output number associated with the UTXO
+        receiver: sp.TAddress
+            The receiving tezos address of tzBTC once enough confirmations are sent.
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+
+        Raises
+        ------
+        NotTrustedSigner
+            If the caller is not a trusted signer of the contract.
+        AmountTooLow
+            If the amount in the UTXO is lower than the service fee.
+        UTXOAlreadyConfirmed
+            If the UTXO has enough confirmations.
+        MultipleConfirmationsFromSameSignerNotAllowed
+            If the same sender tries to confirm the same UTXO more than once (even if
+            the parameters are different)
+        InvalidTxid
+            If the txid of the UTXO is not 32 bytes long.
+        """
+        param_type = sp.TRecord(
+            amount=sp.TNat, output_no=sp.TNat, receiver=sp.TAddress, txid=sp.TBytes
+        ).layout(("amount", ("output_no", ("receiver", "txid"))))
+        sp.set_type(param, param_type)
+
+        self.verify_has_role(Roles.TRUSTED_SIGNER, Errors.NOT_TRUSTED_SIGNER)
+        sp.verify(param.amount >= self.data.service_fee, message=Errors.AMOUNT_TOO_LOW)
+        self.verify_txid(param.txid)
+        utxo_key = sp.local("utxo_key", UTXO.make_key(param.txid, param.output_no))
+        sp.verify(
+            ~self.data.utxo_map.contains(UTXO.make_packed_key(utxo_key.value)),
+            message=Errors.UTXO_ALREADY_CONFIRMED,
+        )
+
+        self.register_utxo_confirmation(
+            sp.record(
+                signer=sp.sender,
+                utxo_key=utxo_key.value,
+                candidate_key=UTXO.make_candidate_key_type(
+                    sp.some(param.receiver), param.amount
+                ),
+                utxo_state=UTXO_STATE.INIT,
+                skip_confirmed=False,
+            )
+        )
+        self.fast_mint_utxo(utxo_key.value, param.receiver)
+
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
+    def confirm_utxos(self, utxos):
+        """
+        Confirms a list of UTXOs which will be used for mint if enough signers confirm
+        them. Each entry is processed the same way as in the confirm_utxo entrypoint and
+        is moved to the UTXO map (and minted if fast_mint applies) as soon as it reaches
+        the threshold.
+
+        Entries with skip_confirmed set to true are ignored if the UTXO already has
+        enough confirmations or if the sender already confirmed it, so that a single
+        entry does not revert the whole batch.
+
+        Parameters
+        ----------
+        utxos: sp.TList(single_param_type)
+            A list of UTXOs to be confirmed.
+        A single entry in the list contains:
+        amount: sp.TNat
+            The amount spent by the UTXO.
+        output_no: sp.TNat
+            The output number associated with the UTXO
+        receiver: sp.TAddress
+            The receiving tezos address of tzBTC once enough confirmations are sent.
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+        skip_confirmed: sp.TBool
+            If true, the entry is skipped instead of failing when it is already
+            confirmed.
+
+        Raises
+        ------
+        NotTrustedSigner
+            If the caller is not a trusted signer of the contract.
+        AmountTooLow
+            If the amount in any of the UTXOs is lower than the service fee.
+        UTXOAlreadyConfirmed
+            If an UTXO that is not skipped has enough confirmations.
+        MultipleConfirmationsFromSameSignerNotAllowed
+            If the same sender tries to confirm an UTXO that is not skipped more than
+            once (even if the parameters are different)
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(utxos, sp.TList(UTXO.get_confirmation_type()))
+
+        self.verify_has_role(Roles.TRUSTED_SIGNER, Errors.NOT_TRUSTED_SIGNER)
+        self.confirm_utxos_as(sp.sender, utxos)
+
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
+    def confirm_change_utxo(self, created_utxos):
+        """
+        Confirms a change in a list UTXOs. All UTXOs that are used for a burn, will either
+        be completely spent or split. If an UTXO is split after a burn, the signer should
+        call this entrypoint to add the newly created UTXO to the candidates map.
+
+        The old UTXO would have been completely removed from the storage in the
+        confirm_burn entrypoint.
+
+        For each candidate of a new UTXO we increase the number of approvers. If there
+        are enough approvers for a candidate, that candidate becomes the new UTXO, it is
+        added to the utxo_map and the UTXO can be later spent by a burn (the state of
+        UTXO becomes USED_FOR_MINT).
+
+        Parameters
+        ----------
+        created_utxos: sp.TList(single_param_type)
+            A list of all new created UTXOs after a burn.
+        A single entry in the list contains:
+        amount: sp.TNat
+            The amount spent by the UTXO.
+        output_no: sp.TNat
+            The output number associated with the UTXO
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+
+        Raises
+        ------
+        NotTrustedSigner
+            If the caller is not a trusted signer of the contract.
+        MultipleConfirmationsFromSameSignerNotAllowed
+            If the same sender tries to confirm the same UTXO more than once (even if
+            the parameters are different)
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(created_utxos, sp.TList(UTXO.get_change_confirmation_type()))
+
+        self.verify_has_role(Roles.TRUSTED_SIGNER, Errors.NOT_TRUSTED_SIGNER)
+        self.confirm_change_utxos_as(sp.sender, created_utxos)
+
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def use_utxo_for_mint(self, utxo_key):
+        """
+        Checks that an UTXO can be minted and moves it to the USED_FOR_MINT state.
+        Emits an utxo_minted event.
+
+        Parameters
+        ----------
+        utxo_key: UTXO.get_key_type()
+            The key of the UTXO used for the mint.
+
+        Returns
+        -------
+        sp.TRecord(receiver=sp.TAddress, amount=sp.TNat)
+            The receiver of the tzBTC and the amount it is entitled to (the amount of
+            the UTXO without the service fee).
+
+        Raises
+        ------
+        InvalidUTXOKey
+            If the UTXO key is not part of the UTXO map.
+        InvalidUTXOState
+            If the UTXO is not in the INIT state.
+        ReceiverNotSet
+            If the receiver for the tzBTC has not been set in the UTXO.
+        InvalidTxid
+            If the txid of the UTXO is not 32 bytes long.
+        """
+        sp.set_type(utxo_key, UTXO.get_key_type())
+        self.verify_txid(utxo_key.txid)
+        packed_key = sp.local("packed_key", UTXO.make_packed_key(utxo_key))
+        sp.verify(
+            self.data.utxo_map.contains(packed_key.value),
+            message=Errors.INVALID_UTXO_KEY,
+        )
+
+        utxo = sp.local(
+            "utxo",
+            self.data.utxo_map[packed_key.value].open_variant(
+                "init", message=Errors.INVALID_UTXO_STATE
+            ),
+        )
+        sp.verify(utxo.value.receiver.is_some(), message=Errors.RECEIVER_NOT_SET)
+
+        self.data.utxo_map[packed_key.value] = UTXO.make_used_for_mint_value(
+            utxo.value.amount
+        )
+        self.data.reserves.init_amount = sp.as_nat(
+            self.data.reserves.init_amount - utxo.value.amount
+        )
+        self.data.reserves.minted_amount += utxo.value.amount
+
+        minted = sp.local(
+            "minted",
+            sp.record(
+                receiver=utxo.value.receiver.open_some(),
+                amount=sp.as_nat(utxo.value.amount - self.data.service_fee),
+            ),
+        )
+        self.emit_event(
+            sp.record(
+                utxo_key=utxo_key,
+                receiver=minted.value.receiver,
+                amount=minted.value.amount,
+                service_fee=self.data.service_fee,
+            ),
+            tag="utxo_minted",
+        )
+        sp.result(minted.value)
+
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
     def mint(self, txid, output_no):
         """
         Calls mints on the tzBTC contract if enough confirmations were sent for the
         associated UTXO and mints the amount in the UTXO for the receiver. The service
-        fee is taken away from the receiver and minted for the treasury instead.
+        fee is taken away from the receiver and accrued for the treasury instead (see
+        claim_fees).
 
         Parameters
         ----------
@@ -486,130 +1416,391 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
             If the UTXO is not in the INIT state.
         ReceiverNotSet
             If the receiver for the tzBTC has not been set in the UTXO.
+        InvalidTxid
+            If the txid is not 32 bytes long.
         """
         sp.set_type(txid, sp.TBytes)
         sp.set_type(output_no, sp.TNat)
-        self.verify_is_gatekeeper(sp.unit)
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
 
-        utxo_key = sp.local("utxo_key", UTXO.make_key(txid, output_no))
-        sp.verify(
-            self.data.utxo_map.contains(utxo_key.value), message=Errors.INVALID_UTXO_KEY
+        minted = sp.local(
+            "minted", self.use_utxo_for_mint(UTXO.make_key(txid, output_no))
+        )
+
+        execute_token_mint(
+            self.data.token_address, minted.value.receiver, minted.value.amount
         )
+        self.data.accrued_fees += self.data.service_fee
 
-        utxo_value = sp.local("utxo_value", self.data.utxo_map[utxo_key.value])
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
+    def mint_utxos(self, utxos):
+        """
+        Mints a list of UTXOs at once. Each UTXO is checked the same way as in the mint
+        entrypoint and moved to the USED_FOR_MINT state. The amounts minted for the same
+        receiver are merged into a single mint and the service fees of all UTXOs are
+        accrued for the treasury (see claim_fees).
+
+        Parameters
+        ----------
+        utxos: sp.TList(single_param_type)
+            A list of the UTXOs to be minted.
+        A single entry in the list contains:
+        txid: sp.TBytes
+            The txid of the associated UTXO.
+        output_no: sp.TNat
+            The output number of the associated UTXO.
+
+        Raises
+        ------
+        NotGatekeeper
+            If the caller of the entrypoints is not a gatekeeper of the contract.
+        InvalidUTXOKey
+            If any of the UTXO keys is not part of the UTXO map.
+        InvalidUTXOState
+            If any of the UTXOs is not in the INIT state (this includes an UTXO given
+            twice in the list).
+        ReceiverNotSet
+            If the receiver for the tzBTC has not been set in any of the UTXOs.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        single_param_type = sp.TRecord(txid=sp.TBytes, output_no=sp.TNat).layout(
+            ("txid", "output_no")
+        )
+        sp.set_type(utxos, sp.TList(single_param_type))
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+
+        mints = sp.local("mints", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TNat))
+        with sp.for_("utxo", utxos) as utxo:
+            minted = sp.local(
+                "minted",
+                self.use_utxo_for_mint(UTXO.make_key(utxo.txid, utxo.output_no)),
+            )
+            mints.value[minted.value.receiver] = (
+                mints.value.get(minted.value.receiver, default_value=0)
+                + minted.value.amount
+            )
+
+        with sp.for_("mint", mints.value.items()) as mint:
+            execute_token_mint(self.data.token_address, mint.key, mint.value)
+
+        self.data.accrued_fees += self.data.service_fee * sp.len(utxos)
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def claim_fees(self, unit):
+        """
+        Mints all the service fees accrued by mint, mint_utxos and confirm_burn for the
+        treasury in a single operation and resets the accrued fees. It can be called by
+        the treasury or by an admin of the contract.
+
+        Parameters
+        ----------
+        unit: sp.TUnit
+            Unit parameter
+
+        Raises
+        ------
+        NotAllowed
+            If the caller is not the treasury or a set admin of the contract.
+        """
+        sp.set_type(unit, sp.TUnit)
         sp.verify(
-            utxo_value.value.state == UTXO_STATE.INIT, message=Errors.INVALID_UTXO_STATE
+            (sp.sender == self.data.treasury_address)
+            | self.has_role(sp.record(address=sp.sender, role=Roles.ADMINISTRATOR)),
+            message=Errors.NOT_ALLOWED,
         )
 
-        utxo_value.value.state = UTXO_STATE.USED_FOR_MINT
-        self.data.utxo_map[utxo_key.value] = utxo_value.value
+        with sp.if_(self.data.accrued_fees > 0):
+            execute_token_mint(
+                self.data.token_address,
+                self.data.treasury_address,
+                self.data.accrued_fees,
+            )
+            self.data.accrued_fees = 0
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def set_utxo(self, txid, output_no, receiver, amount, utxo_state):
+        """
+        Creates or Updates an UTXO. This entrypoint can only be called by an admin and it
+        is a failsafe mechanism if something goes wrong with the UTXOs.
+
+        Parameters
+        ----------
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+        output_no: sp.TNat
+            The output number of the UTXO.
+        receiver: sp.TOption(sp.TAddress)
+            The tezos address that should receive the tzBTC (if any)
+        amount: sp.TNat
+            The amount associated with the UTXO.
+        utxo_state: sp.TNat
+            A value of 0, 1 or 2 corresponding to the UTXO state.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        InvalidUTXOState
+            If the UTXO state is not 0 or 1.
+        InvalidTxid
+            If the txid is not 32 bytes long.
+        """
+        sp.set_type(txid, sp.TBytes)
+        sp.set_type(output_no, sp.TNat)
+        sp.set_type(receiver, sp.TOption(sp.TAddress))
+        sp.set_type(amount, sp.TNat)
+        sp.set_type(utxo_state, sp.TNat)
 
-        mint_contract_ep = sp.contract(
-            sp.TPair(sp.TAddress, sp.TNat), self.data.token_address, entry_point="mint"
-        ).open_some("Invalid Entrypoint: mint")
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+        sp.verify(utxo_state < 2, message=Errors.INVALID_UTXO_STATE)
 
-        entitled_amount = sp.local(
-            "entitled_amount",
-            sp.as_nat(utxo_value.value.amount - self.data.service_fee),
+        self.write_utxo(
+            sp.record(
+                utxo_key=UTXO.make_key(txid, output_no),
+                utxo_value=self.make_utxo_value(utxo_state, receiver, amount).value,
+            )
         )
 
-        sp.verify(utxo_value.value.receiver.is_some(), message=Errors.RECEIVER_NOT_SET)
-        sp.transfer(
-            sp.pair(utxo_value.value.receiver.open_some(), entitled_amount.value),
-            sp.mutez(0),
-            mint_contract_ep,
-        )
-        sp.transfer(
-            sp.pair(self.data.treasury_address, self.data.service_fee),
-            sp.mutez(0),
-            mint_contract_ep,
-        )
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def remove_utxo(self, txid, output_no):
+        """
+        Removes an UTXO entirely from the map. This entrypoint can only be called by an
+        admin and it is a failsafe mechanism if something goes wrong with the UTXOs.
+
+        Parameters
+        ----------
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+        output_no: sp.TNat
+            The output number of the UTXO.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        InvalidTxid
+            If the txid is not 32 bytes long.
+        """
+        sp.set_type(txid, sp.TBytes)
+        sp.set_type(output_no, sp.TNat)
+
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        self.delete_utxo(UTXO.make_key(txid, output_no))
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def set_utxos(self, utxos):
+        """
+        Creates or Updates a list of UTXOs, the same way as the set_utxo entrypoint.
+        This entrypoint can only be called by an admin and it is a failsafe mechanism if
+        something goes wrong with the UTXOs.
+
+        Parameters
+        ----------
+        utxos: sp.TList(single_param_type)
+            A list of UTXOs to be set.
+        A single entry in the list contains:
+        txid: sp.TBytes
+            The transaction id of the UTXO.
+        output_no: sp.TNat
+            The output number of the UTXO.
+        receiver: sp.TOption(sp.TAddress)
+            The tezos address that should receive the tzBTC (if any)
+        amount: sp.TNat
+            The amount associated with the UTXO.
+        utxo_state: sp.TNat
+            A value of 0 or 1 corresponding to the UTXO state.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        InvalidUTXOState
+            If the state of any UTXO is not 0 or 1.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        single_param_type = sp.TRecord(
+            txid=sp.TBytes,
+            output_no=sp.TNat,
+            receiver=sp.TOption(sp.TAddress),
+            amount=sp.TNat,
+            utxo_state=sp.TNat,
+        ).layout(("txid", ("output_no", ("receiver", ("amount", "utxo_state")))))
+        sp.set_type(utxos, sp.TList(single_param_type))
+
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        with sp.for_("utxo", utxos) as utxo:
+            sp.verify(utxo.utxo_state < 2, message=Errors.INVALID_UTXO_STATE)
+            self.write_utxo(
+                sp.record(
+                    utxo_key=UTXO.make_key(utxo.txid, utxo.output_no),
+                    utxo_value=self.make_utxo_value(
+                        utxo.utxo_state, utxo.receiver, utxo.amount
+                    ).value,
+                )
+            )
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def remove_utxos(self, utxo_keys):
+        """
+        Removes a list of UTXOs entirely from the map. This entrypoint can only be
+        called by an admin and it is a failsafe mechanism if something goes wrong with
+        the UTXOs.
+
+        Parameters
+        ----------
+        utxo_keys: sp.TList(UTXO.get_key_type())
+            The txid and output number of the UTXOs to remove.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(utxo_keys, sp.TList(UTXO.get_key_type()))
+
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        with sp.for_("utxo_key", utxo_keys) as utxo_key:
+            self.delete_utxo(utxo_key)
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def set_max_utxo_per_tx_count(self, max_utxo_per_tx_count):
+        """
+        sets the maximum count per transaction allowed of UTXOs
+
+        Parameters
+        ----------
+        max_utxo_per_tx_count: sp.TNat
+            The maximum number of UTXOs per transaction.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        """
+        sp.set_type(max_utxo_per_tx_count, sp.TNat)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        self.data.max_utxo_per_tx_count = max_utxo_per_tx_count
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def set_candidate_expiry_levels(self, candidate_expiry_levels):
+        """
+        Sets the number of levels after which an UTXO candidate that did not reach the
+        threshold can be purged (see purge_candidates).
+
+        Parameters
+        ----------
+        candidate_expiry_levels: sp.TNat
+            The number of levels a candidate stays valid.
+
+        Raises
+        ------
+        NotAdmin
+            If the caller of the entrypoint is not an admin of the contract.
+        """
+        sp.set_type(candidate_expiry_levels, sp.TNat)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        self.data.candidate_expiry_levels = candidate_expiry_levels
 
     @sp.entry_point(check_no_incoming_transfer=True)
-    def set_utxo(self, txid, output_no, receiver, amount, utxo_state):
+    def set_burn_prune_levels(self, burn_prune_levels):
         """
-        Creates or Updates an UTXO. This entrypoint can only be called by an admin and it
-        is a failsafe mechanism if something goes wrong with the UTXOs.
+        Sets the number of levels after the confirmation of a burn before it can be
+        pruned (see prune_burns).
 
         Parameters
         ----------
-        txid: sp.TBytes
-            The transaction id of the UTXO.
-        output_no: sp.TNat
-            The output number of the UTXO.
-        receiver: sp.TOption(sp.TAddress)
-            The tezos address that should receive the tzBTC (if any)
-        amount: sp.TNat
-            The amount associated with the UTXO.
-        utxo_state: sp.TNat
-            A value of 0, 1 or 2 corresponding to the UTXO state.
+        burn_prune_levels: sp.TNat
+            The number of levels a fully signed burn is kept after its confirmation.
 
         Raises
         ------
         NotAdmin
             If the caller of the entrypoint is not an admin of the contract.
-        InvalidUTXOState
-            If the UTXO state is not 0 or 1.
         """
-        sp.set_type(txid, sp.TBytes)
-        sp.set_type(output_no, sp.TNat)
-        sp.set_type(receiver, sp.TOption(sp.TAddress))
-        sp.set_type(amount, sp.TNat)
-        sp.set_type(utxo_state, sp.TNat)
-
-        self.verify_is_admin(sp.unit)
-        sp.verify(utxo_state < 2, message=Errors.INVALID_UTXO_STATE)
+        sp.set_type(burn_prune_levels, sp.TNat)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
 
-        utxo_key = sp.local("utxo_key", UTXO.make_key(txid, output_no))
-        self.data.utxo_map[utxo_key.value] = UTXO.make_value(
-            state=utxo_state, receiver=receiver, amount=amount
-        )
+        self.data.burn_prune_levels = burn_prune_levels
 
     @sp.entry_point(check_no_incoming_transfer=True)
-    def remove_utxo(self, txid, output_no):
+    def set_emit_burn_signatures(self, emit_burn_signatures):
         """
-        Removes an UTXO entirely from the map. This entrypoint can only be called by an
-        admin and it is a failsafe mechanism if something goes wrong with the UTXOs.
+        Sets whether sign_burn emits the signatures as events instead of storing them
+        in the burn_signatures big_map.
 
         Parameters
         ----------
-        txid: sp.TBytes
-            The transaction id of the UTXO.
-        output_no: sp.TNat
-            The output number of the UTXO.
+        emit_burn_signatures: sp.TBool
+            True to emit the signatures, false to store them.
 
         Raises
         ------
         NotAdmin
             If the caller of the entrypoint is not an admin of the contract.
         """
-        sp.set_type(txid, sp.TBytes)
-        sp.set_type(output_no, sp.TNat)
-
-        self.verify_is_admin(sp.unit)
+        sp.set_type(emit_burn_signatures, sp.TBool)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
 
-        utxo_key = sp.local("utxo_key", UTXO.make_key(txid, output_no))
-        del self.data.utxo_map[utxo_key.value]
+        self.data.emit_burn_signatures = emit_burn_signatures
 
     @sp.entry_point(check_no_incoming_transfer=True)
-    def set_max_utxo_per_tx_count(self, max_utxo_per_tx_count):
+    def set_fast_mint(self, fast_mint):
         """
-        sets the maximum count per transaction allowed of UTXOs
+        Sets whether the confirmation of a deposit UTXO that reaches the threshold also
+        mints it for a whitelisted receiver (one-stage flow), instead of waiting for a
+        gatekeeper to call mint (two-stage flow). The receiver has to be in the
+        whitelisted_addresses big_map, the Merkle whitelist does not enable the
+        one-stage flow (see fast_mint_utxo).
 
         Parameters
         ----------
-        max_utxo_per_tx_count: sp.TNat
-            The maximum number of UTXOs per transaction.
+        fast_mint: sp.TBool
+            True for the one-stage flow, false for the two-stage flow.
 
         Raises
         ------
         NotAdmin
             If the caller of the entrypoint is not an admin of the contract.
         """
-        sp.set_type(max_utxo_per_tx_count, sp.TNat)
-        self.verify_is_admin(sp.unit)
+        sp.set_type(fast_mint, sp.TBool)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
 
-        self.data.max_utxo_per_tx_count = max_utxo_per_tx_count
+        self.data.fast_mint = fast_mint
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def purge_candidates(self, utxo_keys):
+        """
+        Removes the UTXO candidates with the given keys that expired or that can no
+        longer reach the threshold with the votes of the remaining trusted signers (see
+        the get_purgeable_candidates view). Keys that are not in the candidate map or
+        whose candidate is still valid are skipped. This entrypoint can be called by
+        anyone, the removed entries are refunded to the caller as storage. A
+        candidate_purged event is emitted for every removed entry.
+
+        Parameters
+        ----------
+        utxo_keys: sp.TList(UTXO.get_key_type())
+            The keys of the candidates to purge.
+        """
+        sp.set_type(utxo_keys, sp.TList(UTXO.get_key_type()))
+
+        with sp.for_("utxo_key", utxo_keys) as utxo_key:
+            with sp.if_(self.data.candidate_utxo_map.contains(utxo_key)):
+                candidate = sp.local(
+                    "candidate", self.data.candidate_utxo_map[utxo_key]
+                )
+                with sp.if_(self.is_candidate_purgeable(candidate.value)):
+                    del self.data.candidate_utxo_map[utxo_key]
+                    self.emit_event(utxo_key, tag="candidate_purged")
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def verify_address(self, address, verified):
@@ -631,13 +1822,67 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
         sp.set_type(address, sp.TAddress)
         sp.set_type(verified, sp.TBool)
 
-        self.verify_is_gatekeeper(sp.unit)
-        with sp.if_(verified):
-            self.data.whitelisted_addresses[address] = sp.unit
-        with sp.else_():
-            del self.data.whitelisted_addresses[address]
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        self.set_address_verified(address, verified)
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def verify_addresses(self, addresses):
+        """
+        Adds/Removes a list of addresses from the big_map of verified addresses, so that
+        a batch of KYC decisions fits in a single operation (see
+        deployments/sync_whitelist.py). Each entry is applied in order as in the
+        verify_address entrypoint.
+
+        Parameters
+        ----------
+        addresses: sp.TList(single_param_type)
+            The addresses to add or remove.
+        A single entry in the list contains:
+        address: sp.TAddress
+            The address to be added to or removed from the verified big map.
+        verified: sp.TBool
+            If true the address is added, if false the address is remove from the map.
+
+        Raises
+        ------
+        NotGatekeeper
+            If the sender of the operation is not a gatekeeper for the contract.
+        """
+        single_param_type = sp.TRecord(address=sp.TAddress, verified=sp.TBool).layout(
+            ("address", "verified")
+        )
+        sp.set_type(addresses, sp.TList(single_param_type))
+
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        with sp.for_("entry", addresses) as entry:
+            self.set_address_verified(entry.address, entry.verified)
 
     @sp.entry_point(check_no_incoming_transfer=True)
+    def set_whitelist_root(self, whitelist_root):
+        """
+        Commits the Merkle root of the verified users (see utils/merkle_whitelist.py),
+        which can then propose burns with propose_burn_with_proof. A whole batch of KYC
+        decisions costs a single root update. The addresses of the
+        whitelisted_addresses big_map stay verified.
+
+        Parameters
+        ----------
+        whitelist_root: sp.TOption(sp.TBytes)
+            The root of the Merkle tree of the verified users, or none to disable the
+            Merkle whitelist.
+
+        Raises
+        ------
+        NotGatekeeper
+            If the sender of the operation is not a gatekeeper for the contract.
+        """
+        sp.set_type(whitelist_root, sp.TOption(sp.TBytes))
+
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        self.data.whitelist_root = whitelist_root
+        self.emit_event(whitelist_root, tag="whitelist_root_set")
+
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
     def propose_burn(self, amount, receiver, optional_callback):
         """
         Creates a new entry for a future burn for the given amount. The new burn entry
@@ -647,48 +1892,124 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
         contract will hold the funds until the burn is confirmed or canceled.
 
         The optional callback is used to return the id of the newly created burn entry.
+        A burn_proposed event is emitted with the id of the new burn.
 
         Parameters
         ----------
         amount: sp.TNat
             The amount of tzBTC to be burnt.
-        receiver: sp.TString
-            The receiving BTC address after the tzBTC are burnt.
+        receiver: sp.TBytes
+            The scriptPubKey of the receiving BTC address after the tzBTC are burnt, in
+            the same format as the custody and gatekeeper BTC addresses (see
+            utils/btc_address.py).
         optional_callback: sp.TOption(sp.TContract(sp.TNat))
             A optional callback contract to return the newly created burn entry.
 
         Raises
         ------
         NotVerifiedUser
-            If the caller is not part of the verified users.
+            If the caller is not in the whitelisted_addresses big_map (users of the
+            Merkle whitelist call propose_burn_with_proof).
         AmountTooLow
             If the amount proposed to be burnt is lower than the minimum amount allowed to
             be burnt.
         """
         sp.set_type(amount, sp.TNat)
-        sp.set_type(receiver, sp.TString)
+        sp.set_type(receiver, sp.TBytes)
         sp.set_type(optional_callback, sp.TOption(sp.TContract(sp.TNat)))
 
-        self.verify_is_verified_user(sp.unit)
-        sp.verify(amount >= self.data.min_burn_amount, message=Errors.AMOUNT_TOO_LOW)
+        self.create_burn(amount, receiver, optional_callback, sp.none)
 
-        self.data.burns_map[self.data.burn_id_counter] = Burn.make(
-            proposer=sp.sender,
-            receiver=receiver,
-            amount=amount,
-            state=BurnState.PROPOSED,
-            fee=0,
-            utxos=sp.map({}),
-        )
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def propose_burn_with_proof(self, amount, receiver, optional_callback, proof):
+        """
+        Creates a new entry for a future burn exactly as the propose_burn entrypoint,
+        for a caller that proves its membership of the Merkle whitelist committed by
+        the gatekeepers with set_whitelist_root instead of being in the
+        whitelisted_addresses big_map. The proof can be built with
+        utils/merkle_whitelist.py.
 
-        self.data.burn_id_counter += 1
-        execute_fa1_token_transfer(
-            self.data.token_address, sp.sender, sp.self_address, amount
+        Parameters
+        ----------
+        amount: sp.TNat
+            The amount of tzBTC to be burnt.
+        receiver: sp.TBytes
+            The scriptPubKey of the receiving BTC address after the tzBTC are burnt.
+        optional_callback: sp.TOption(sp.TContract(sp.TNat))
+            A optional callback contract to return the newly created burn entry.
+        proof: sp.TList(sp.TBytes)
+            The hashes of the siblings on the path from the leaf of the caller to the
+            Merkle root.
+
+        Raises
+        ------
+        NotVerifiedUser
+            If the proof does not lead to the whitelist root.
+        AmountTooLow
+            If the amount proposed to be burnt is lower than the minimum amount allowed to
+            be burnt.
+        """
+        sp.set_type(amount, sp.TNat)
+        sp.set_type(receiver, sp.TBytes)
+        sp.set_type(optional_callback, sp.TOption(sp.TContract(sp.TNat)))
+        sp.set_type(proof, sp.TList(sp.TBytes))
+
+        self.create_burn(amount, receiver, optional_callback, sp.some(proof))
+
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def remove_proposed_burn(self, burn_id):
+        """
+        Checks that a proposed burn can be cancelled by the sender and removes it from
+        the burns map. Emits a burn_cancelled event.
+
+        Parameters
+        ----------
+        burn_id: sp.TNat
+            The id of the burn to be cancelled.
+
+        Returns
+        -------
+        sp.TRecord(proposer=sp.TAddress, amount=sp.TNat)
+            The proposer of the burn and the amount to transfer back to it.
+
+        Raises
+        ------
+        InvalidBurnId
+            If burn id is not present in the burns map.
+        NotAllowed
+            If the caller is not the proposer of the burn or a gatekeeper of the contract.
+        BurnAlreadyConfirmed
+            If the burn has already been confirmed.
+        """
+        sp.set_type(burn_id, sp.TNat)
+        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
+
+        burn = sp.local("burn", self.data.burns_map[burn_id])
+        sp.verify(
+            (burn.value.proposer == sp.sender)
+            | self.has_role(sp.record(address=sp.sender, role=Roles.GATEKEEPER)),
+            message=Errors.NOT_ALLOWED,
+        )
+        sp.verify(
+            burn.value.state == BurnState.PROPOSED,
+            message=Errors.BURN_ALREADY_CONFIRMED,
         )
 
-        with sp.if_(optional_callback.is_some()):
-            callback = sp.local("callback", optional_callback.open_some())
-            sp.transfer(self.data.burn_id_counter, sp.mutez(0), callback.value)
+        del self.data.burns_map[burn_id]
+        del self.data.open_burns[burn_id]
+        self.data.reserves.proposed_burn_amount = sp.as_nat(
+            self.data.reserves.proposed_burn_amount - burn.value.amount
+        )
+        self.emit_event(
+            sp.record(
+                burn_id=burn_id,
+                proposer=burn.value.proposer,
+                amount=burn.value.amount,
+                cancelled_by=sp.sender,
+            ),
+            tag="burn_cancelled",
+        )
+        sp.result(sp.record(proposer=burn.value.proposer, amount=burn.value.amount))
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def cancel_burn(self, burn_id):
@@ -711,34 +2032,283 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
             If the burn has already been confirmed.
         """
         sp.set_type(burn_id, sp.TNat)
-        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
+
+        cancelled_burn = sp.local("cancelled_burn", self.remove_proposed_burn(burn_id))
+        execute_fa1_token_transfer(
+            token_address=self.data.token_address,
+            sender=sp.self_address,
+            receiver=cancelled_burn.value.proposer,
+            amount=cancelled_burn.value.amount,
+        )
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def cancel_burns(self, burn_ids):
+        """
+        Cancels a list of proposed burns. Each burn is checked and removed the same way
+        as in the cancel_burn entrypoint, and the amounts are transferred back with a
+        single transfer per proposer.
+
+        Parameters
+        ----------
+        burn_ids: sp.TList(sp.TNat)
+            The ids of the burns to be cancelled.
+
+        Raises
+        ------
+        InvalidBurnId
+            If any burn id is not present in the burns map.
+        NotAllowed
+            If the caller is not the proposer of a burn or a gatekeeper of the contract.
+        BurnAlreadyConfirmed
+            If any burn has already been confirmed.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+
+        refunds = sp.local("refunds", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TNat))
+        with sp.for_("burn_id", burn_ids) as burn_id:
+            cancelled_burn = sp.local(
+                "cancelled_burn", self.remove_proposed_burn(burn_id)
+            )
+            refunds.value[cancelled_burn.value.proposer] = (
+                refunds.value.get(cancelled_burn.value.proposer, default_value=0)
+                + cancelled_burn.value.amount
+            )
+
+        with sp.for_("refund", refunds.value.items()) as refund:
+            execute_fa1_token_transfer(
+                token_address=self.data.token_address,
+                sender=sp.self_address,
+                receiver=refund.key,
+                amount=refund.value,
+            )
+
+    def spend_utxos(self, utxos, fee):
+        """
+        Removes the UTXOs spent by a BTC transaction of the ledger (a burn or a sweep)
+        from the UTXO map and the reserves, after checking that they can be spent. The
+        output UTXOs of the transaction are later added with confirm_change_utxo.
+
+        The amounts of the UTXOs are read from the UTXO map, the amounts given in the
+        parameter are ignored.
+
+        Parameters
+        ----------
+        utxos: sp.TMap(UTXO.key_type(), UTXO.burn_type())
+            The UTXOs spent by the transaction.
+        fee: sp.TNat
+            The fee associated with each UTXO.
+
+        Returns
+        -------
+        sp.TRecord(amount=sp.TNat, fee=sp.TNat, utxos=sp.TMap)
+            The amount covered by the UTXOs, the fee paid for all the UTXOs and the
+            spent UTXOs with their amount in the UTXO map.
+
+        Raises
+        ------
+        TooManyUTXOs
+            If the number of UTXOs is not lower than max_utxo_per_tx_count.
+        InvalidUTXOKey
+            If any of the given UTXO are not present in the UTXO map.
+        InvalidUTXOState
+            If any of the given UTXOs are not in the USED_FOR_MINT state.
+        FeeTooHigh
+            If the fee paid for all the UTXOs is higher than max_btc_network_fee.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
         sp.verify(
-            (self.data.burns_map[burn_id].proposer == sp.sender)
-            | (self.data.gatekeepers.contains(sp.sender)),
-            message=Errors.NOT_ALLOWED,
+            sp.len(utxos) < self.data.max_utxo_per_tx_count,
+            message=Errors.TOO_MANY_UTXOS,
+        )
+
+        spent_utxos = sp.local(
+            "spent_utxos",
+            sp.record(
+                amount=sp.nat(0),
+                fee=sp.nat(0),
+                utxos=sp.map(
+                    l={}, tkey=UTXO.get_key_type(), tvalue=UTXO.get_burn_type()
+                ),
+            ),
+        )
+        with sp.for_("burn_utxo", utxos.items()) as burn_utxo:
+            self.verify_txid(burn_utxo.key.txid)
+            packed_key = sp.local("packed_key", UTXO.make_packed_key(burn_utxo.key))
+
+            sp.verify(
+                self.data.utxo_map.contains(packed_key.value),
+                message=Errors.INVALID_UTXO_KEY,
+            )
+            utxo_amount = sp.local(
+                "utxo_amount",
+                self.data.utxo_map[packed_key.value].open_variant(
+                    "used_for_mint", message=Errors.INVALID_UTXO_STATE
+                ),
+            )
+
+            spent_utxos.value.amount += utxo_amount.value
+            spent_utxos.value.fee += fee
+            spent_utxos.value.utxos[burn_utxo.key] = UTXO.make_burn_type(
+                utxo_amount.value
+            )
+
+            # Remove the UTXO from the utxo map (the output UTXO will be later added in
+            # the confirmChangeUTXO)
+            del self.data.utxo_map[packed_key.value]
+            self.data.reserves.minted_amount = sp.as_nat(
+                self.data.reserves.minted_amount - utxo_amount.value
+            )
+            self.data.reserves.utxo_count = sp.as_nat(self.data.reserves.utxo_count - 1)
+
+        sp.verify(
+            spent_utxos.value.fee <= self.data.max_btc_network_fee,
+            message=Errors.FEE_TOO_HIGH,
+        )
+        return spent_utxos
+
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def attach_utxos_to_burns(self, param):
+        """
+        Attaches a list of UTXOs to one or several proposed burns after checking that
+        they cover the total amount specified by the burns + fees, removes the UTXOs
+        from the UTXO map and moves the burns to the CONFIRMED state. The service fee
+        of every burn is accrued for the treasury (see claim_fees).
+
+        The UTXOs and the fee are attached to the first burn of the list, whose id is
+        the batch id: the UTXOs are signed once under this id with sign_burn and pay
+        all the receivers of the batch in a single BTC transaction. If there are
+        several burns, the ids of the batch are stored in the burn_batches big_map
+        under the batch id. Emits a burn_confirmed event for every burn and a
+        burn_batched event for a batch of several burns.
+
+        Parameters
+        ----------
+        burn_ids: sp.TList(sp.TNat)
+            The ids of the burns for which the UTXOs are checked, the first one is the
+            batch id.
+        utxos: sp.TMap(UTXO.key_type(), UTXO.burn_type())
+            The list of UTXOs to cover the amount of the burns.
+        fee: sp.TNat
+            The fee associated with each UTXO.
+
+        Returns
+        -------
+        sp.TNat
+            The amount of tzBTC to burn.
+
+        Raises
+        ------
+        InvalidBurnId
+            If the list is empty or the burns map does not contain one of the burn ids.
+        InvalidState
+            If a burn is not in the proposed state (or appears twice in the list).
+        TooManyUTXOs
+            If the number of UTXOs is not lower than max_utxo_per_tx_count.
+        InvalidUTXOKey
+            If any of the given UTXO are not present in the UTXO map.
+        InvalidUTXOState
+            If any of the given UTXOs are not in the USED_FOR_MINT state.
+        AmountTooLow
+            If the given UTXOs does not cover the proposed burnt amount + fees.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(
+            param,
+            sp.TRecord(
+                burn_ids=sp.TList(sp.TNat),
+                utxos=sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()),
+                fee=sp.TNat,
+            ),
         )
+        sp.verify(sp.len(param.burn_ids) > 0, message=Errors.INVALID_BURN_ID)
+
+        total_amount = sp.local("total_amount", sp.nat(0))
+        batch_id = sp.local("batch_id", sp.nat(0))
+        batch = sp.local("batch", sp.set(l=[], t=sp.TNat))
+
+        with sp.for_("burn_id", param.burn_ids) as burn_id:
+            sp.verify(
+                self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID
+            )
+            burn_op = sp.local("burn_op", self.data.burns_map[burn_id])
+            # A burn listed twice is already CONFIRMED the second time.
+            sp.verify(
+                burn_op.value.state == BurnState.PROPOSED,
+                message=Errors.INVALID_BURN_STATE,
+            )
+            with sp.if_(sp.len(batch.value) == 0):
+                batch_id.value = burn_id
+            batch.value.add(burn_id)
+
+            # The service fee is burnt together with the rest of the amount and accrued
+            # for the treasury, which mints it back with claim_fees.
+            sp.verify(
+                burn_op.value.amount >= self.data.service_fee,
+                message=Errors.AMOUNT_TOO_LOW,
+            )
+            self.data.accrued_fees += self.data.service_fee
+            total_amount.value += burn_op.value.amount
+
+            burn_op.value.state = BurnState.CONFIRMED
+            burn_op.value.confirmed_at = sp.level
+            self.data.burns_map[burn_id] = burn_op.value
+            del self.data.open_burns[burn_id]
+            self.data.reserves.proposed_burn_amount = sp.as_nat(
+                self.data.reserves.proposed_burn_amount - burn_op.value.amount
+            )
+            with sp.if_(burn_id != batch_id.value):
+                self.emit_event(
+                    sp.record(
+                        burn_id=burn_id,
+                        amount=burn_op.value.amount,
+                        fee=sp.nat(0),
+                        utxos=sp.map(
+                            l={}, tkey=UTXO.get_key_type(), tvalue=UTXO.get_burn_type()
+                        ),
+                    ),
+                    tag="burn_confirmed",
+                )
+
+        spent_utxos = self.spend_utxos(param.utxos, param.fee)
         sp.verify(
-            self.data.burns_map[burn_id].state == BurnState.PROPOSED,
-            message=Errors.BURN_ALREADY_CONFIRMED,
+            spent_utxos.value.amount >= total_amount.value + spent_utxos.value.fee,
+            message=Errors.AMOUNT_TOO_LOW,
         )
 
-        execute_fa1_token_transfer(
-            token_address=self.data.token_address,
-            sender=sp.self_address,
-            receiver=self.data.burns_map[burn_id].proposer,
-            amount=self.data.burns_map[burn_id].amount,
+        batch_burn = sp.local("batch_burn", self.data.burns_map[batch_id.value])
+        batch_burn.value.utxos = spent_utxos.value.utxos
+        batch_burn.value.fee = spent_utxos.value.fee
+        self.data.burns_map[batch_id.value] = batch_burn.value
+        self.data.open_burns[batch_id.value] = BurnState.CONFIRMED
+        self.emit_event(
+            sp.record(
+                burn_id=batch_id.value,
+                amount=batch_burn.value.amount,
+                fee=batch_burn.value.fee,
+                utxos=batch_burn.value.utxos,
+            ),
+            tag="burn_confirmed",
         )
 
-        del self.data.burns_map[burn_id]
+        with sp.if_(sp.len(batch.value) > 1):
+            self.data.burn_batches[batch_id.value] = batch.value
+            self.emit_event(
+                sp.record(batch_id=batch_id.value, burn_ids=batch.value),
+                tag="burn_batched",
+            )
+        sp.result(total_amount.value)
 
-    @sp.entry_point(check_no_incoming_transfer=True)
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
     def confirm_burn(self, utxos, fee, burn_id):
         """
         Confirms the burn with the given burn id to the signers by attaching a list of
         UTXOs to the given burn and checks if the given UTXOs cover the amount specified
         by the burn + fees.
         This entrypoint also calls burns on the tzBTC contract after checking that the
-        UTXOs covers the burn.
+        UTXOs covers the burn. The service fee is burnt with the rest of the amount and
+        accrued for the treasury (see claim_fees).
 
         Parameters
         ----------
@@ -757,102 +2327,241 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
             If the burns map does not contain the given burn id.
         InvalidState
             If the burn is not in the proposed state
+        TooManyUTXOs
+            If the number of UTXOs is not lower than max_utxo_per_tx_count.
         InvalidUTXOKey
             If any of the given UTXO are not present in the UTXO map.
         InvalidUTXOState
             If any of the given UTXOs are not in the USED_FOR_MINT state.
         AmountTooLow
             If the given UTXOs does not cover the proposed burnt amount + fees.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
         """
         sp.set_type(utxos, sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()))
         sp.set_type(fee, sp.TNat)
         sp.set_type(burn_id, sp.TNat)
 
-        self.verify_is_gatekeeper(sp.unit)
-        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
-
-        amount_covered_by_utxos = sp.local("amount_covered_by_utxos", sp.nat(0))
-        fee_paid_for_all_utxos = sp.local("fee_paid_for_all_utxos", sp.nat(0))
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        burn_amount = sp.local(
+            "burn_amount",
+            self.attach_utxos_to_burns(
+                sp.record(burn_ids=sp.list([burn_id]), utxos=utxos, fee=fee)
+            ),
+        )
 
-        burn_op = sp.local("burn_op", self.data.burns_map[burn_id])
-        sp.verify(
-            burn_op.value.state == BurnState.PROPOSED, message=Errors.INVALID_BURN_STATE
+        # call burn on the tzBTC contract (first we need to transfer the amount to the
+        # redeem address)
+        execute_token_burn(
+            self.data.token_address, self.data.redeem_address, burn_amount.value
         )
 
-        sp.verify(sp.len(utxos) < self.data.max_utxo_per_tx_count, message=Errors.TOO_MANY_UTXOS)
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def confirm_burns(self, burns):
+        """
+        Confirms a list of burns. Each burn is checked and confirmed the same way as in
+        the confirm_burn entrypoint, and the total amount of the burns is transferred to
+        the redeem address and burnt on the tzBTC contract once.
 
-        with sp.for_("burn_utxo", utxos.items()) as burn_utxo:
-            utxo_key = burn_utxo.key
-            utxo_value = burn_utxo.value
+        Parameters
+        ----------
+        burns: sp.TList(single_param_type)
+            A list of burns to be confirmed.
+        A single entry in the list contains:
+        burn_id: sp.TNat
+            The id of the burn for which the UTXOs are checked.
+        utxos: sp.TMap(UTXO.key_type(), UTXO.burn_type())
+            The list of UTXOs to cover the burn amount.
+        fee: sp.TNat
+            The fee associated with each UTXO.
 
-            sp.verify(
-                self.data.utxo_map.contains(utxo_key), message=Errors.INVALID_UTXO_KEY
-            )
-            utxo = sp.local("utxo", self.data.utxo_map[utxo_key])
+        Raises
+        ------
+        NotGatekeeper
+            If the caller of the entrypoint is not a gatekeeper.
+        InvalidBurnId
+            If the burns map does not contain one of the burn ids.
+        InvalidState
+            If any burn is not in the proposed state
+        TooManyUTXOs
+            If the number of UTXOs of a burn is not lower than max_utxo_per_tx_count.
+        InvalidUTXOKey
+            If any of the given UTXO are not present in the UTXO map (an UTXO can only
+            be attached to one burn).
+        InvalidUTXOState
+            If any of the given UTXOs are not in the USED_FOR_MINT state.
+        AmountTooLow
+            If the given UTXOs does not cover the proposed burnt amount + fees.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        single_param_type = sp.TRecord(
+            burn_id=sp.TNat,
+            utxos=sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()),
+            fee=sp.TNat,
+        ).layout(("burn_id", ("utxos", "fee")))
+        sp.set_type(burns, sp.TList(single_param_type))
 
-            sp.verify(
-                utxo.value.state == UTXO_STATE.USED_FOR_MINT,
-                message=Errors.INVALID_UTXO_STATE,
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+
+        total_burn_amount = sp.local("total_burn_amount", sp.nat(0))
+        with sp.for_("burn", burns) as burn:
+            total_burn_amount.value += self.attach_utxos_to_burns(
+                sp.record(
+                    burn_ids=sp.list([burn.burn_id]), utxos=burn.utxos, fee=burn.fee
+                )
             )
 
-            sp.verify(sp.len(burn_utxo.value.signatures) == 0,
-                message=Errors.SIGNATURE_CANNOT_BE_SET,
+        with sp.if_(total_burn_amount.value > 0):
+            execute_token_burn(
+                self.data.token_address,
+                self.data.redeem_address,
+                total_burn_amount.value,
             )
 
-            amount_covered_by_utxos.value += utxo_value.amount
-            fee_paid_for_all_utxos.value += fee
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def confirm_burn_batch(self, burn_ids, utxos, fee):
+        """
+        Confirms several burns with a single set of UTXOs, so that one BTC transaction
+        pays all their receivers. The UTXOs have to cover the total amount of the
+        burns + fees, every burn is otherwise checked the same way as in the
+        confirm_burn entrypoint. The UTXOs and the fee are attached to the first burn
+        of the list, whose id is the batch id signed by the trusted signers with
+        sign_burn, and the ids of the batch are stored in the burn_batches big_map.
+        The total amount of the burns is transferred to the redeem address and burnt
+        on the tzBTC contract once.
 
-            # Remove the UTXO from the utxo map (the output UTXO will be later added in
-            # the confirmChangeUTXO)
-            del self.data.utxo_map[utxo_key]
+        Parameters
+        ----------
+        burn_ids: sp.TList(sp.TNat)
+            The ids of the burns of the batch, the first one is the batch id.
+        utxos: sp.TMap(UTXO.key_type(), UTXO.burn_type())
+            The list of UTXOs to cover the amount of all the burns.
+        fee: sp.TNat
+            The fee associated with each UTXO.
 
-        sp.verify(
-            amount_covered_by_utxos.value
-            >= burn_op.value.amount,
-            message=Errors.AMOUNT_TOO_LOW,
+        Raises
+        ------
+        NotGatekeeper
+            If the caller of the entrypoint is not a gatekeeper.
+        InvalidBurnId
+            If the list is empty or the burns map does not contain one of the burn ids.
+        InvalidState
+            If any burn is not in the proposed state or appears twice in the list.
+        TooManyUTXOs
+            If the number of UTXOs is not lower than max_utxo_per_tx_count.
+        InvalidUTXOKey
+            If any of the given UTXO are not present in the UTXO map.
+        InvalidUTXOState
+            If any of the given UTXOs are not in the USED_FOR_MINT state.
+        AmountTooLow
+            If the given UTXOs does not cover the total amount of the burns + fees.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+        sp.set_type(utxos, sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()))
+        sp.set_type(fee, sp.TNat)
+
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        burn_amount = sp.local(
+            "burn_amount",
+            self.attach_utxos_to_burns(
+                sp.record(burn_ids=burn_ids, utxos=utxos, fee=fee)
+            ),
         )
-        sp.verify(
-            fee_paid_for_all_utxos.value <= self.data.max_btc_network_fee,
-            message=Errors.FEE_TOO_HIGH,
+
+        execute_token_burn(
+            self.data.token_address, self.data.redeem_address, burn_amount.value
         )
 
-        burn_op.value.utxos = utxos
-        burn_op.value.fee = fee_paid_for_all_utxos.value
-        burn_op.value.state = BurnState.CONFIRMED
-        self.data.burns_map[burn_id] = burn_op.value
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def sweep_utxos(self, utxos, fee):
+        """
+        Consolidates several small UTXOs into one. The UTXOs are removed from the UTXO
+        map and locked in a sweep, a CONFIRMED burn of amount 0 paying the custody BTC
+        address, so the trusted signers sign it with sign_burn like any other burn.
+        Once the sweep transaction is mined on BTC, the consolidated UTXO is added back
+        to the UTXO map by a quorum of trusted signers with confirm_change_utxo.
+        Emits an utxos_swept event with the id of the sweep.
+
+        Parameters
+        ----------
+        utxos: sp.TMap(UTXO.key_type(), UTXO.burn_type())
+            The UTXOs to consolidate.
+        fee: sp.TNat
+            The fee associated with each UTXO.
 
-        # call burn on the tzBTC contract (first we need to transfer the amount to the
-        # redeem address)
-        amount_to_burn = sp.local(
-            "amount_to_burn", sp.as_nat(burn_op.value.amount - self.data.service_fee)
+        Raises
+        ------
+        NotGatekeeper
+            If the caller of the entrypoint is not a gatekeeper.
+        TooFewUTXOs
+            If less than two UTXOs are given.
+        TooManyUTXOs
+            If the number of UTXOs is not lower than max_utxo_per_tx_count.
+        InvalidUTXOKey
+            If any of the given UTXO are not present in the UTXO map.
+        InvalidUTXOState
+            If any of the given UTXOs are not in the USED_FOR_MINT state.
+        FeeTooHigh
+            If the fee paid for all the UTXOs is higher than max_btc_network_fee.
+        AmountTooLow
+            If the UTXOs do not cover the fee.
+        InvalidTxid
+            If the txid of any UTXO is not 32 bytes long.
+        """
+        sp.set_type(utxos, sp.TMap(UTXO.get_key_type(), UTXO.get_burn_type()))
+        sp.set_type(fee, sp.TNat)
+
+        self.verify_has_role(Roles.GATEKEEPER, Errors.NOT_GATEKEEPER)
+        sp.verify(sp.len(utxos) > 1, message=Errors.TOO_FEW_UTXOS)
+
+        spent_utxos = self.spend_utxos(utxos, fee)
+        sp.verify(
+            spent_utxos.value.amount > spent_utxos.value.fee,
+            message=Errors.AMOUNT_TOO_LOW,
         )
-        execute_fa1_token_transfer(
-            self.data.token_address,
-            sp.self_address,
-            self.data.redeem_address,
-            amount_to_burn.value,
+
+        self.data.burns_map[self.data.burn_id_counter] = Burn.make(
+            proposer=sp.sender,
+            receiver=self.data.custody_btc_address,
+            amount=sp.nat(0),
+            state=BurnState.CONFIRMED,
+            fee=spent_utxos.value.fee,
+            utxos=spent_utxos.value.utxos,
+            confirmed_at=sp.level,
         )
-        execute_fa1_token_transfer(
-            self.data.token_address,
-            sp.self_address,
-            self.data.treasury_address,
-            self.data.service_fee,
+        self.emit_event(
+            sp.record(
+                burn_id=self.data.burn_id_counter,
+                fee=spent_utxos.value.fee,
+                utxos=spent_utxos.value.utxos,
+            ),
+            tag="utxos_swept",
         )
+        self.data.open_burns[self.data.burn_id_counter] = BurnState.CONFIRMED
+        self.data.burn_id_counter += 1
 
-        burn_contract_ep = sp.contract(
-            sp.TNat, self.data.token_address, entry_point="burn"
-        ).open_some("Invalid Entrypoint: burn")
-        sp.transfer(amount_to_burn.value, sp.mutez(0), burn_contract_ep)
-
-    @sp.entry_point(check_no_incoming_transfer=True)
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
     def sign_burn(self, burn_id, utxos_with_signature):
         """
         Sets the signatures for all UTXOs contained by a burn. It can only be called by
         a trusted signer and contains a list of signatures for each UTXO to craft the BTC
         transaction associated with the UTXO.
-        The signature is added to the associated UTXO to be later used in crafting the BTC
-        transaction. The signatures will be stored with the associated signer that calls
-        this entrypoint.
+        The signature is stored in the burn_signatures big_map under the burn id, the
+        UTXO and the signer that calls this entrypoint, to be later used in crafting the
+        BTC transaction (see the get_burn_signatures view). The UTXOs signed by each
+        signer are tracked in a bitset of the burn_signed_utxos big_map under the burn
+        id and the signer, and the burn_signers big_map keeps the signers of the burn
+        and the number of them that signed all its UTXOs. The burn entry itself is not
+        written, so a signer does not pay for the UTXOs or the signatures of the other
+        signers (see the get_burn_signers view).
+        A burn_signed event is emitted with the number of UTXOs signed by the signer.
+
+        If emit_burn_signatures is set, the signatures are emitted as burn_signature
+        events instead of being stored, which saves their storage cost. The UTXOs are
+        counted the same way, so a signer can split its signatures across calls.
 
         NOTE: Not all UTXOs attached to the burn are required by this entrypoint. The
         signer can send their signatures for the UTXOs by calling sign_burn multiple
@@ -878,39 +2587,136 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
         """
         sp.set_type(burn_id, sp.TNat)
         sp.set_type(
-            utxos_with_signature,
-            sp.TList(
-                sp.TRecord(
-                    txid=sp.TBytes, output_no=sp.TNat, signature=sp.TBytes
-                ).right_comb()
-            ),
+            utxos_with_signature, sp.TList(BurnSignature.get_utxo_signature_type())
         )
 
-        self.verify_is_trusted_signer(sp.unit)
-        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
+        self.verify_has_role(Roles.TRUSTED_SIGNER, Errors.NOT_TRUSTED_SIGNER)
+        self.sign_burn_as(sp.sender, burn_id, utxos_with_signature)
 
-        burn = sp.local("burn", self.data.burns_map[burn_id])
-        utxos = sp.local("utxos", burn.value.utxos)
+    @sp.entry_point(check_no_incoming_transfer=True, lazify=False)
+    def relay_approvals(self, approvals):
+        """
+        Executes the approvals of several trusted signers in a single operation, so that
+        a relayer can land a whole quorum at once. Each approval holds an action
+        (confirm_utxos, confirm_change_utxo or sign_burn), the public key of the signer
+        and its signature of the packed payload (see RelayedApproval.make_payload) made
+        of the chain id, the address of this contract, the current relay nonce of the
+        signer and the action. The action is executed exactly as if the signer had
+        called the corresponding entrypoint.
+
+        The signer address is derived from the public key, so no key has to be
+        registered. Every signer has its own relay nonce (see get_relay_nonce), which
+        is increased when one of its approvals is executed, so an approval can never be
+        replayed. As only the approvals of a signer consume its nonce, a third party
+        relaying other approvals cannot invalidate the pending ones. This entrypoint can
+        be called by anyone.
 
-        with sp.for_("entry", utxos_with_signature) as entry:
-            utxo_key = sp.local("utxo_key", UTXO.make_key(entry.txid, entry.output_no))
+        Parameters
+        ----------
+        approvals: sp.TList(RelayedApproval.get_type())
+            The signed approvals of the trusted signers.
+
+        Raises
+        ------
+        NoApprovals
+            If the list of approvals is empty.
+        NotTrustedSigner
+            If the key of an approval does not belong to a trusted signer.
+        InvalidSignature
+            If the signature of an approval does not match the payload for the current
+            nonce of the signer.
+        """
+        sp.set_type(approvals, sp.TList(RelayedApproval.get_type()))
+
+        sp.verify(sp.len(approvals) > 0, message=Errors.NO_APPROVALS)
+
+        with sp.for_("approval", approvals) as approval:
+            signer = sp.local(
+                "signer",
+                sp.to_address(sp.implicit_account(sp.hash_key(approval.public_key))),
+            )
             sp.verify(
-                utxos.value.contains(utxo_key.value),
-                message=Errors.UTXO_NOT_PART_OF_BURN,
+                self.has_role(
+                    sp.record(address=signer.value, role=Roles.TRUSTED_SIGNER)
+                ),
+                message=Errors.NOT_TRUSTED_SIGNER,
+            )
+            nonce = sp.local(
+                "nonce", self.data.relay_nonces.get(signer.value, default_value=0)
+            )
+            payload = RelayedApproval.make_payload(
+                sp.chain_id, sp.self_address, nonce.value, approval.action
+            )
+            sp.verify(
+                sp.check_signature(
+                    approval.public_key, approval.signature, sp.pack(payload)
+                ),
+                message=Errors.INVALID_SIGNATURE,
             )
-            utxo = sp.local("utxo", utxos.value[utxo_key.value])
-            utxo.value.signatures[sp.sender] = entry.signature
+            self.data.relay_nonces[signer.value] = nonce.value + 1
+
+            with approval.action.match_cases() as arg:
+                with arg.match("confirm_utxos") as utxos:
+                    self.confirm_utxos_as(signer.value, utxos)
+                with arg.match("confirm_change_utxo") as created_utxos:
+                    self.confirm_change_utxos_as(signer.value, created_utxos)
+                with arg.match("sign_burn") as sign_burn:
+                    self.sign_burn_as(
+                        signer.value, sign_burn.burn_id, sign_burn.utxos_with_signature
+                    )
+
+    @sp.private_lambda(with_storage="read-write", with_operations=True, wrap_call=True)
+    def delete_burn(self, burn_id):
+        """
+        Deletes a burn from the burns_map together with its signatures and removes it
+        from the open burns. If the burn id is the id of a batch (see
+        confirm_burn_batch), the other burns of the batch are deleted as well. Emits a
+        burn_removed event for every deleted burn.
+
+        Parameters
+        ----------
+        burn_id: sp.TNat
+            The id of an existing burn.
+        """
+        sp.set_type(burn_id, sp.TNat)
 
-            utxos.value[utxo_key.value] = utxo.value
+        burn = sp.local("burn", self.data.burns_map[burn_id])
+        with sp.for_(
+            "signer", self.load_burn_signers(burn_id).signers.elements()
+        ) as signer:
+            with sp.for_("utxo_key", burn.value.utxos.keys()) as utxo_key:
+                del self.data.burn_signatures[
+                    BurnSignature.make_key(burn_id, utxo_key, signer)
+                ]
+            del self.data.burn_signed_utxos[Burn.make_signer_key(burn_id, signer)]
+        del self.data.burn_signers[burn_id]
+        del self.data.burns_map[burn_id]
+        del self.data.open_burns[burn_id]
+        with sp.if_(burn.value.state == BurnState.PROPOSED):
+            self.data.reserves.proposed_burn_amount = sp.as_nat(
+                self.data.reserves.proposed_burn_amount - burn.value.amount
+            )
+        self.emit_event(burn_id, tag="burn_removed")
 
-        burn.value.utxos = utxos.value
-        self.data.burns_map[burn_id] = burn.value
+        # The other burns of a batch have no UTXOs and no signatures of their own.
+        with sp.if_(self.data.burn_batches.contains(burn_id)):
+            with sp.for_(
+                "batched_burn_id", self.data.burn_batches[burn_id].elements()
+            ) as batched_burn_id:
+                with sp.if_(
+                    (batched_burn_id != burn_id)
+                    & self.data.burns_map.contains(batched_burn_id)
+                ):
+                    del self.data.burns_map[batched_burn_id]
+                    self.emit_event(batched_burn_id, tag="burn_removed")
+            del self.data.burn_batches[burn_id]
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def remove_burn(self, burn_id):
         """
         Removes an entry from the burns_map. Can only be called by the admin and it is
-        used to clear up the burns_map. It is the responsability of the caller to make
+        used to clear up the burns_map. The signatures of the burn are removed from the
+        burn_signatures big_map as well. It is the responsability of the caller to make
         sure that the burn was executed successfully and the signatures are no longer
         required.
 
@@ -928,9 +2734,63 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
         """
         sp.set_type(burn_id, sp.TNat)
 
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
-        del self.data.burns_map[burn_id]
+
+        self.delete_burn(burn_id)
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def remove_burns(self, from_burn_id, to_burn_id):
+        """
+        Removes all the entries of the burns_map with an id in the given range, together
+        with their signatures. Ids of the range that are not in the burns_map (e.g.
+        cancelled or already removed burns) are skipped. Can only be called by the admin
+        and it is used to prune executed burns. It is the responsability of the caller
+        to make sure that all the burns of the range were executed successfully.
+
+        Parameters
+        ----------
+        from_burn_id: sp.TNat
+            The first burn id of the range.
+        to_burn_id: sp.TNat
+            The end of the range (excluded).
+
+        Raises
+        ------
+        NotAdmin
+            If the caller is not an admin of the contract.
+        """
+        sp.set_type(from_burn_id, sp.TNat)
+        sp.set_type(to_burn_id, sp.TNat)
+
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        with sp.for_("burn_id", sp.range(from_burn_id, to_burn_id)) as burn_id:
+            with sp.if_(self.data.burns_map.contains(burn_id)):
+                self.delete_burn(burn_id)
+
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def prune_burns(self, burn_ids):
+        """
+        Removes the burns with the given ids that were confirmed at least
+        burn_prune_levels levels ago and that at least threshold signers signed
+        completely (see the get_prunable_burns view), together with their signatures.
+        Ids that are not in the burns map or whose burn is not prunable yet are skipped.
+        This entrypoint can be called by anyone, the removed entries are refunded to the
+        caller as storage. A burn_removed event is emitted for every removed burn.
+
+        Parameters
+        ----------
+        burn_ids: sp.TList(sp.TNat)
+            The ids of the burns to prune.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+
+        with sp.for_("burn_id", burn_ids) as burn_id:
+            with sp.if_(self.data.burns_map.contains(burn_id)):
+                burn = sp.local("burn", self.data.burns_map[burn_id])
+                with sp.if_(self.is_burn_prunable(burn_id, burn.value)):
+                    self.delete_burn(burn_id)
 
     @sp.onchain_view()
     def get_latest_burn_id(self):
@@ -941,3 +2801,225 @@ class TzBTCLedger(sp.Contract, SingleAdministrableMixin):
             sp.result(self.data.burn_id_counter)
         with sp.else_():
             sp.result(sp.as_nat(self.data.burn_id_counter - 1))
+
+    @sp.onchain_view()
+    def get_burn_signatures(self, burn_id):
+        """
+        Returns all the signatures of a burn, as a map from the UTXOs of the burn to the
+        signatures of each signer. Signatures emitted as burn_signature events (see
+        emit_burn_signatures) are not part of the result.
+        """
+        sp.set_type(burn_id, sp.TNat)
+        sp.verify(self.data.burns_map.contains(burn_id), message=Errors.INVALID_BURN_ID)
+
+        burn = sp.local("burn", self.data.burns_map[burn_id])
+        signers = sp.local("signers", self.load_burn_signers(burn_id).signers)
+        signatures = sp.local(
+            "signatures",
+            sp.map(
+                l={},
+                tkey=UTXO.get_key_type(),
+                tvalue=sp.TMap(sp.TAddress, sp.TBytes),
+            ),
+        )
+        with sp.for_("utxo_key", burn.value.utxos.keys()) as utxo_key:
+            utxo_signatures = sp.local(
+                "utxo_signatures", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TBytes)
+            )
+            with sp.for_("signer", signers.value.elements()) as signer:
+                signature_key = sp.local(
+                    "signature_key", BurnSignature.make_key(burn_id, utxo_key, signer)
+                )
+                with sp.if_(self.data.burn_signatures.contains(signature_key.value)):
+                    utxo_signatures.value[signer] = self.data.burn_signatures[
+                        signature_key.value
+                    ]
+            signatures.value[utxo_key] = utxo_signatures.value
+        sp.result(signatures.value)
+
+    @sp.onchain_view()
+    def get_burn_signers(self, burn_id):
+        """
+        Returns the signers of a burn, as a map from each signer that signed at least
+        one UTXO of the burn to the number of UTXOs it signed. Signatures emitted as
+        burn_signature events are counted as well.
+        """
+        sp.set_type(burn_id, sp.TNat)
+
+        signed_utxos = sp.local(
+            "signed_utxos", sp.map(l={}, tkey=sp.TAddress, tvalue=sp.TNat)
+        )
+        with sp.for_(
+            "signer", self.load_burn_signers(burn_id).signers.elements()
+        ) as signer:
+            signed_utxos.value[signer] = self.count_bits(
+                self.data.burn_signed_utxos[Burn.make_signer_key(burn_id, signer)]
+            )
+        sp.result(signed_utxos.value)
+
+    @sp.onchain_view()
+    def get_open_burns(self, burn_ids_range):
+        """
+        Returns the ids of the open burns with an id in the given range: the proposed
+        burns waiting for confirm_burn and the confirmed burns waiting for the
+        signatures of the trusted signers. A confirmed burn leaves the open burns once
+        threshold signers signed all of its UTXOs.
+
+        The open burns are a big_map from the burn id to its state, so the open burns
+        are listed page by page: the burn ids are consecutive, from 0 to the
+        burn_id_counter (excluded).
+        """
+        sp.set_type(
+            burn_ids_range,
+            sp.TRecord(from_burn_id=sp.TNat, to_burn_id=sp.TNat).layout(
+                ("from_burn_id", "to_burn_id")
+            ),
+        )
+
+        open_burns = sp.local(
+            "open_burns",
+            sp.set_type_expr(
+                sp.record(proposed=sp.set([]), confirmed=sp.set([])),
+                Burn.get_open_burns_type(),
+            ),
+        )
+        with sp.for_(
+            "burn_id",
+            sp.range(burn_ids_range.from_burn_id, burn_ids_range.to_burn_id),
+        ) as burn_id:
+            with sp.if_(self.data.open_burns.contains(burn_id)):
+                with sp.if_(self.data.open_burns[burn_id] == BurnState.PROPOSED):
+                    open_burns.value.proposed.add(burn_id)
+                with sp.else_():
+                    open_burns.value.confirmed.add(burn_id)
+        sp.result(open_burns.value)
+
+    @sp.onchain_view()
+    def get_relay_nonce(self, signer):
+        """
+        Returns the nonce the next relayed approval of a signer has to sign (see
+        relay_approvals).
+        """
+        sp.set_type(signer, sp.TAddress)
+
+        sp.result(self.data.relay_nonces.get(signer, default_value=sp.nat(0)))
+
+    @sp.onchain_view()
+    def get_reserves(self):
+        """
+        Returns the running totals of the reserve: the amount of the UTXOs in the INIT
+        and USED_FOR_MINT states, the amount locked in proposed burns and the number of
+        UTXOs in the UTXO map.
+        """
+        sp.result(self.data.reserves)
+
+    @sp.onchain_view()
+    def get_utxos(self, utxo_keys):
+        """
+        Returns the UTXOs of the UTXO map with the given keys, keys that are not in the
+        UTXO map are left out of the result.
+        """
+        sp.set_type(utxo_keys, sp.TList(UTXO.get_key_type()))
+
+        utxos = sp.local(
+            "utxos",
+            sp.map(l={}, tkey=UTXO.get_key_type(), tvalue=UTXO.get_value_type()),
+        )
+        with sp.for_("utxo_key", utxo_keys) as utxo_key:
+            packed_key = sp.local("packed_key", UTXO.make_packed_key(utxo_key))
+            with sp.if_(self.data.utxo_map.contains(packed_key.value)):
+                utxos.value[utxo_key] = self.data.utxo_map[packed_key.value]
+        sp.result(utxos.value)
+
+    @sp.onchain_view()
+    def get_candidates(self, utxo_keys):
+        """
+        Returns the candidates of the UTXOs with the given keys, keys that are not in
+        the candidate map are left out of the result.
+        """
+        sp.set_type(utxo_keys, sp.TList(UTXO.get_key_type()))
+
+        candidates = sp.local(
+            "candidates",
+            sp.map(
+                l={},
+                tkey=UTXO.get_key_type(),
+                tvalue=UTXO.get_utxo_candidate_value_type(),
+            ),
+        )
+        with sp.for_("utxo_key", utxo_keys) as utxo_key:
+            with sp.if_(self.data.candidate_utxo_map.contains(utxo_key)):
+                candidates.value[utxo_key] = self.data.candidate_utxo_map[utxo_key]
+        sp.result(candidates.value)
+
+    @sp.onchain_view()
+    def get_purgeable_candidates(self, utxo_keys):
+        """
+        Returns the keys, among the given ones, of the candidates that can be removed
+        with purge_candidates.
+        """
+        sp.set_type(utxo_keys, sp.TList(UTXO.get_key_type()))
+
+        purgeable = sp.local("purgeable", sp.list(l=[], t=UTXO.get_key_type()))
+        with sp.for_("utxo_key", utxo_keys) as utxo_key:
+            with sp.if_(self.data.candidate_utxo_map.contains(utxo_key)):
+                candidate = sp.local(
+                    "candidate", self.data.candidate_utxo_map[utxo_key]
+                )
+                with sp.if_(self.is_candidate_purgeable(candidate.value)):
+                    purgeable.value.push(utxo_key)
+        sp.result(purgeable.value)
+
+    @sp.onchain_view()
+    def get_burns(self, burn_ids):
+        """
+        Returns the burns with the given ids, ids that are not in the burns map are left
+        out of the result.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+
+        burns = sp.local("burns", sp.map(l={}, tkey=sp.TNat, tvalue=Burn.get_type()))
+        with sp.for_("burn_id", burn_ids) as burn_id:
+            with sp.if_(self.data.burns_map.contains(burn_id)):
+                burns.value[burn_id] = self.data.burns_map[burn_id]
+        sp.result(burns.value)
+
+    @sp.onchain_view()
+    def get_prunable_burns(self, burn_ids):
+        """
+        Returns the ids, among the given ones, of the burns that can be removed with
+        prune_burns.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+
+        prunable = sp.local("prunable", sp.list(l=[], t=sp.TNat))
+        with sp.for_("burn_id", burn_ids) as burn_id:
+            with sp.if_(self.data.burns_map.contains(burn_id)):
+                burn = sp.local("burn", self.data.burns_map[burn_id])
+                with sp.if_(self.is_burn_prunable(burn_id, burn.value)):
+                    prunable.value.push(burn_id)
+        sp.result(prunable.value)
+
+    @sp.onchain_view()
+    def get_burn_status(self, burn_ids):
+        """
+        Returns a summary of the burns with the given ids: their state, amount, fee,
+        number of UTXOs and number of signers that signed all the UTXOs. Ids that are
+        not in the burns map are left out of the result.
+        """
+        sp.set_type(burn_ids, sp.TList(sp.TNat))
+
+        statuses = sp.local(
+            "statuses", sp.map(l={}, tkey=sp.TNat, tvalue=Burn.get_status_type())
+        )
+        with sp.for_("burn_id", burn_ids) as burn_id:
+            with sp.if_(self.data.burns_map.contains(burn_id)):
+                burn = sp.local("burn", self.data.burns_map[burn_id])
+                statuses.value[burn_id] = Burn.make_status(
+                    state=burn.value.state,
+                    amount=burn.value.amount,
+                    fee=burn.value.fee,
+                    utxo_count=sp.len(burn.value.utxos),
+                    complete_signers=self.load_burn_signers(burn_id).complete_signers,
+                )
+        sp.result(statuses.value)
@@ -2,38 +2,88 @@ from pytezos.operation.result import OperationResult
 from pytezos import pytezos, ContractInterface
 import time
 import sys
-from deployments.utils import get_address, wait_applied
+from deployments.utils import get_address, make_roles, wait_applied
 import deployments.mainnet.configuration as mainnet_config
 import deployments.ghostnet.configuration as ghostnet_config
 
+SNAPSHOT_PATH = "__SNAPSHOTS__/compilation/all/{target}/step_000_cont_0_contract.tz"
+STORAGE_SNAPSHOT_PATH = (
+    "__SNAPSHOTS__/compilation/all/{target}/step_000_cont_0_storage.tz"
+)
+
+
+def find_ledger_storage(storage):
+    # The build with lazy entrypoints pairs the ledger record with the big_map
+    # holding the code of the lazy entrypoints.
+    if isinstance(storage, dict):
+        if "roles" in storage:
+            return storage
+        storage = storage.values()
+    elif not isinstance(storage, (list, tuple)):
+        return None
+    for value in storage:
+        ledger_storage = find_ledger_storage(value)
+        if ledger_storage is not None:
+            return ledger_storage
+    return None
+
+
+def make_storage(tzbtc_ledger_code, config, target="tzBTCLedger"):
+    # The compiled storage is used as a base as it already contains the code of the
+    # lazy entrypoints, all the ledger fields are overridden below.
+    with open(STORAGE_SNAPSHOT_PATH.format(target=target)) as storage_file:
+        full_storage = tzbtc_ledger_code.storage.decode(storage_file.read())
+    storage = find_ledger_storage(full_storage)
+    storage["roles"] = make_roles(
+        config.ADMINISTRATORS, config.GATEKEEPERS, config.TRUSTED_SIGNERS
+    )
+    storage["administrators_num"] = config.ADMINISTRATORS_NUM
+    storage["next_signer_index"] = len(config.TRUSTED_SIGNERS)
+    storage["active_signers"] = (1 << len(config.TRUSTED_SIGNERS)) - 1
+    storage["whitelisted_addresses"] = {}
+    storage["threshold"] = config.THRESHOLD
+    storage["min_burn_amount"] = config.MIN_BURN_AMOUNT
+    storage["service_fee"] = config.SERVICE_FEE
+    storage["max_btc_network_fee"] = config.MAX_BTC_NETWORK_FEE
+    storage["burn_id_counter"] = 0
+    storage["burns_map"] = {}
+    storage["burn_signatures"] = {}
+    storage["burn_signed_utxos"] = {}
+    storage["burn_signers"] = {}
+    storage["burn_batches"] = {}
+    storage["utxo_map"] = {}
+    storage["candidate_utxo_map"] = {}
+    storage["token_address"] = config.TOKEN_ADDRESS
+    storage["treasury_address"] = config.TREASURY_ADDRESS
+    storage["redeem_address"] = config.REDEEM_ADDRESS
+    storage["btc_gatekeeper_address"] = config.BTC_GATEKEEPER_ADDRESS
+    storage["custody_btc_address"] = config.CUSTODY_BTC_ADDRESS
+    storage["metadata"] = config.METADATA
+    storage["max_utxo_per_tx_count"] = config.MAX_UTXO_PER_TX_COUNT
+    storage["accrued_fees"] = 0
+    storage["relay_nonces"] = {}
+    storage["reserves"] = {
+        "init_amount": 0,
+        "minted_amount": 0,
+        "proposed_burn_amount": 0,
+        "utxo_count": 0,
+    }
+    storage["open_burns"] = {}
+    storage["candidate_expiry_levels"] = config.CANDIDATE_EXPIRY_LEVELS
+    storage["emit_burn_signatures"] = config.EMIT_BURN_SIGNATURES
+    storage["burn_prune_levels"] = config.BURN_PRUNE_LEVELS
+    storage["fast_mint"] = config.FAST_MINT
+    storage["whitelist_root"] = None
+    return full_storage
+
 
 def deploy(config):
     pytezos_admin_client = pytezos.using(key=config.SECRET_KEY, shell=config.NODE_URL)
 
     tzbtc_ledger_code = ContractInterface.from_file(
-        "__SNAPSHOTS__/compilation/all/tzBTCLedger/step_000_cont_0_contract.tz"
+        SNAPSHOT_PATH.format(target="tzBTCLedger")
     )
-    storage = tzbtc_ledger_code.storage.dummy()
-    storage['administrators'] = config.ADMINISTRATORS
-    storage['administrators_num'] = config.ADMINISTRATORS_NUM
-    storage['gatekeepers'] = config.GATEKEEPERS
-    storage['trusted_signers'] = config.TRUSTED_SIGNERS
-    storage['whitelisted_addresses'] = {}
-    storage['threshold'] = config.THRESHOLD
-    storage['min_burn_amount'] = config.MIN_BURN_AMOUNT
-    storage['service_fee'] = config.SERVICE_FEE
-    storage['max_btc_network_fee'] = config.MAX_BTC_NETWORK_FEE
-    storage['burn_id_counter'] = 0 
-    storage['burns_map'] = {}
-    storage['utxo_map'] = {}
-    storage['candidate_utxo_map'] = {}
-    storage['token_address'] = config.TOKEN_ADDRESS
-    storage['treasury_address'] = config.TREASURY_ADDRESS
-    storage['redeem_address'] = config.REDEEM_ADDRESS
-    storage['btc_gatekeeper_address'] = config.BTC_GATEKEEPER_ADDRESS
-    storage['custody_btc_address'] = config.CUSTODY_BTC_ADDRESS
-    storage['metadata'] = config.METADATA
-    storage['max_utxo_per_tx_count'] = config.MAX_UTXO_PER_TX_COUNT
+    storage = make_storage(tzbtc_ledger_code, config)
 
     operation_group = pytezos_admin_client.origination(
         script=tzbtc_ledger_code.script(initial_storage=storage)
@@ -46,14 +96,15 @@ def deploy(config):
     operation_group = tzbtc_contract.addOperator(address).send()
     wait_applied(pytezos_admin_client, operation_group.hash())
 
+
 if __name__ == "__main__":
     if len(sys.argv) > 2:
         print("Invalid number of arguments")
-    
+
     network = sys.argv[1]
     if network == "ghostnet":
         deploy(ghostnet_config)
     elif network == "mainnet":
         deploy(mainnet_config)
     else:
-        print("Invalid network name") 
\ No newline at end of file
+        print("Invalid network name")
@@ -0,0 +1,65 @@
+"""
+Copies the UTXOs of a deployed ledger to a new ledger using the compact UTXO layout
+(packed txid || output_no keys, receiver dropped once minted).
+
+Big_maps cannot be iterated on-chain, so the entries of the old utxo_map are listed
+with TzKT and written to the new ledger with set_utxos, which also rebuilds its
+reserve totals. The configured key needs to be an admin of the new ledger. Pending
+burns and UTXO candidates are not copied, the burns should be settled and the
+confirmations resent before switching the signers to the new ledger.
+
+Usage: python3 deployments/migrate_utxos.py ghostnet|mainnet OLD_LEDGER NEW_LEDGER
+"""
+
+import sys
+
+from pytezos import pytezos
+
+from deployments.utils import fetch_big_map_keys, wait_applied
+import deployments.mainnet.configuration as mainnet_config
+import deployments.ghostnet.configuration as ghostnet_config
+
+BATCH_SIZE = 100
+
+
+def migrate(config, old_ledger_address, new_ledger_address):
+    client = pytezos.using(key=config.SECRET_KEY, shell=config.NODE_URL)
+    new_ledger = client.contract(new_ledger_address)
+
+    entries = [
+        {
+            "txid": bytes.fromhex(utxo["key"]["txid"]),
+            "output_no": int(utxo["key"]["output_no"]),
+            "receiver": utxo["value"]["receiver"],
+            "amount": int(utxo["value"]["amount"]),
+            "utxo_state": int(utxo["value"]["state"]),
+        }
+        for utxo in fetch_big_map_keys(config, old_ledger_address, "utxo_map")
+    ]
+    for start in range(0, len(entries), BATCH_SIZE):
+        operation_group = new_ledger.set_utxos(
+            entries[start : start + BATCH_SIZE]
+        ).send()
+        wait_applied(client, operation_group.hash())
+        print(
+            "Migrated %d/%d UTXOs"
+            % (min(start + BATCH_SIZE, len(entries)), len(entries))
+        )
+
+    reserves = new_ledger.get_reserves().run_view()
+    print("Reserves of the new ledger: %s" % reserves)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        print("Invalid number of arguments")
+        sys.exit(1)
+
+    network = sys.argv[1]
+    if network == "ghostnet":
+        migrate(ghostnet_config, sys.argv[2], sys.argv[3])
+    elif network == "mainnet":
+        migrate(mainnet_config, sys.argv[2], sys.argv[3])
+    else:
+        print("Invalid network name")
+        sys.exit(1)
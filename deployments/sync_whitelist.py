@@ -0,0 +1,102 @@
+"""
+Synchronizes the whitelisted_addresses big_map of a ledger with the list of verified
+users exported by the KYC provider.
+
+The on-chain whitelist is listed with TzKT and diffed against the desired one, only
+the addresses to add or remove are sent. They are sent with verify_addresses in calls
+of BATCH_SIZE entries, and up to CALLS_PER_OPERATION calls are grouped in a single
+operation, so that the whole sync needs as few operations (and blocks) as possible.
+The configured key needs to be a gatekeeper of the ledger.
+
+With --merkle, the Merkle root of the whitelist is committed with set_whitelist_root
+instead, for the users proposing burns with propose_burn_with_proof.
+
+The whitelist file contains one address per line, empty lines and lines starting
+with # are ignored.
+
+Usage: python3 deployments/sync_whitelist.py ghostnet|mainnet LEDGER WHITELIST_FILE [--merkle]
+"""
+
+import sys
+
+from pytezos import pytezos
+
+from deployments.utils import fetch_big_map_keys, wait_applied
+import deployments.mainnet.configuration as mainnet_config
+import deployments.ghostnet.configuration as ghostnet_config
+from utils.merkle_whitelist import MerkleWhitelist, read_whitelist
+
+BATCH_SIZE = 400
+CALLS_PER_OPERATION = 5
+
+
+def commit_root(config, ledger_address, whitelist_path):
+    client = pytezos.using(key=config.SECRET_KEY, shell=config.NODE_URL)
+    ledger = client.contract(ledger_address)
+
+    tree = MerkleWhitelist(sorted(set(read_whitelist(whitelist_path))))
+    root = tree.root.hex() if tree.root is not None else None
+    operation_group = ledger.set_whitelist_root(root).send()
+    wait_applied(client, operation_group.hash())
+    print("Committed the root %s of %d addresses" % (root, len(tree)))
+
+
+def diff_whitelist(desired, current):
+    return [
+        {"address": address, "verified": True} for address in sorted(desired - current)
+    ] + [
+        {"address": address, "verified": False} for address in sorted(current - desired)
+    ]
+
+
+def sync(config, ledger_address, whitelist_path):
+    client = pytezos.using(key=config.SECRET_KEY, shell=config.NODE_URL)
+    ledger = client.contract(ledger_address)
+
+    current = {
+        entry["key"]
+        for entry in fetch_big_map_keys(config, ledger_address, "whitelisted_addresses")
+    }
+    entries = diff_whitelist(set(read_whitelist(whitelist_path)), current)
+    print(
+        "%d addresses to add, %d addresses to remove"
+        % (
+            sum(entry["verified"] for entry in entries),
+            sum(not entry["verified"] for entry in entries),
+        )
+    )
+
+    batches = [
+        entries[start : start + BATCH_SIZE]
+        for start in range(0, len(entries), BATCH_SIZE)
+    ]
+    for start in range(0, len(batches), CALLS_PER_OPERATION):
+        calls = [
+            ledger.verify_addresses(batch)
+            for batch in batches[start : start + CALLS_PER_OPERATION]
+        ]
+        operation_group = client.bulk(*calls).send()
+        wait_applied(client, operation_group.hash())
+        print(
+            "Synchronized %d/%d addresses"
+            % (
+                min((start + CALLS_PER_OPERATION) * BATCH_SIZE, len(entries)),
+                len(entries),
+            )
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (4, 5) or sys.argv[4:] not in ([], ["--merkle"]):
+        print("Invalid number of arguments")
+        sys.exit(1)
+
+    network = sys.argv[1]
+    action = commit_root if sys.argv[4:] else sync
+    if network == "ghostnet":
+        action(ghostnet_config, sys.argv[2], sys.argv[3])
+    elif network == "mainnet":
+        action(mainnet_config, sys.argv[2], sys.argv[3])
+    else:
+        print("Invalid network name")
+        sys.exit(1)
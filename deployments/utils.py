@@ -1,9 +1,61 @@
+import time
+
+import requests
 from pytezos.operation.result import OperationResult
 
+TZKT_PAGE_SIZE = 1000
+
+
 class AdministratorStatus:
     PROPOSED = 0
     SET = 1
 
+
+class Roles:
+    # Mirrors utils/administrable_mixin.py, every role is a bit of the roles big_map.
+    PROPOSED_ADMINISTRATOR = 0
+    ADMINISTRATOR = 1
+    GATEKEEPER = 2
+    TRUSTED_SIGNER = 3
+    SIGNER_INDEX_OFFSET = 8
+
+
+def make_roles(administrators, gatekeepers, trusted_signers):
+    roles = {}
+
+    def grant(address, role):
+        roles[address] = roles.get(address, 0) | (1 << role)
+
+    for administrator, status in administrators.items():
+        if status == AdministratorStatus.SET:
+            grant(administrator, Roles.ADMINISTRATOR)
+        else:
+            grant(administrator, Roles.PROPOSED_ADMINISTRATOR)
+    for gatekeeper in gatekeepers:
+        grant(gatekeeper, Roles.GATEKEEPER)
+    # Every trusted signer gets the index used to tally its confirmations.
+    for index, signer in enumerate(trusted_signers):
+        grant(signer, Roles.TRUSTED_SIGNER)
+        roles[signer] += index << Roles.SIGNER_INDEX_OFFSET
+    return roles
+
+
+def fetch_big_map_keys(config, contract_address, big_map):
+    # Big_maps cannot be iterated on-chain, their active keys are listed with TzKT.
+    keys = []
+    while True:
+        response = requests.get(
+            "%s/v1/contracts/%s/bigmaps/%s/keys"
+            % (config.TZKT_URL, contract_address, big_map),
+            params={"active": "true", "limit": TZKT_PAGE_SIZE, "offset": len(keys)},
+        )
+        response.raise_for_status()
+        page = response.json()
+        keys += page
+        if len(page) < TZKT_PAGE_SIZE:
+            return keys
+
+
 def get_address(pytezos_admin_client, operation_hash):
     while True:
         try:
@@ -17,6 +69,7 @@ def get_address(pytezos_admin_client, operation_hash):
         except:
             pass
 
+
 def wait_applied(pytezos_admin_client, operation_hash):
     while True:
         try:
@@ -27,4 +80,4 @@ def wait_applied(pytezos_admin_client, operation_hash):
 
             time.sleep(1)
         except:
-            pass
\ No newline at end of file
+            pass
@@ -20,6 +20,7 @@ MULTISIG = MULTISIG_GHOSTNET
 
 COUNTER = 1
 
+
 def accept_admin_proposal(unit):
     sp.set_type(unit, sp.TUnit)
 
@@ -27,9 +28,8 @@ def accept_admin_proposal(unit):
         sp.TUnit, TZBTC_LEDGER, entry_point="accept_admin_proposal"
     ).open_some(message="InvalidEntrypoint: accept_admin_proposal")
 
-    sp.result(sp.list([
-        sp.transfer_operation(sp.unit, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(sp.list([sp.transfer_operation(sp.unit, sp.mutez(0), ledger_ep)]))
+
 
 def add_gatekeeper(unit, gatekeeper_address):
     sp.set_type(unit, sp.TUnit)
@@ -38,156 +38,285 @@ def add_gatekeeper(unit, gatekeeper_address):
         sp.TAddress, TZBTC_LEDGER, entry_point="add_gatekeeper"
     ).open_some(message="InvalidEntrypoint: add_gatekeeper")
 
-    sp.result(sp.list([
-        sp.transfer_operation(gatekeeper_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(gatekeeper_address, sp.mutez(0), ledger_ep)])
+    )
+
 
 def add_trusted_signer(unit, trusted_signer_address):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TAddress, TZBTC_LEDGER, entry_point="add_trusted_signer"
     ).open_some(message="InvalidEntrypoint: add_trusted_signer")
 
-    sp.result(sp.list([
-        sp.transfer_operation(trusted_signer_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(trusted_signer_address, sp.mutez(0), ledger_ep)])
+    )
+
 
 def propose_administrator(unit, proposed_administrator):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TAddress, TZBTC_LEDGER, entry_point="propose_administrator"
     ).open_some(message="InvalidEntrypoint: propose_administrator")
 
-    sp.result(sp.list([
-        sp.transfer_operation(proposed_administrator, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(proposed_administrator, sp.mutez(0), ledger_ep)])
+    )
+
 
 def remove_administrator(unit, administrator_to_remove):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TAddress, TZBTC_LEDGER, entry_point="remove_administrator"
     ).open_some(message="InvalidEntrypoint: remove_administrator")
 
-    sp.result(sp.list([
-        sp.transfer_operation(administrator_to_remove, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list(
+            [sp.transfer_operation(administrator_to_remove, sp.mutez(0), ledger_ep)]
+        )
+    )
+
 
 def remove_trusted_signer(unit, trusted_signer_to_remove):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TAddress, TZBTC_LEDGER, entry_point="remove_trusted_signer"
     ).open_some(message="InvalidEntrypoint: remove_trusted_signer")
 
-    sp.result(sp.list([
-        sp.transfer_operation(trusted_signer_to_remove, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list(
+            [sp.transfer_operation(trusted_signer_to_remove, sp.mutez(0), ledger_ep)]
+        )
+    )
+
 
 def remove_gatekeeper(unit, gatekeeper_to_remove):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TAddress, TZBTC_LEDGER, entry_point="remove_gatekeeper"
     ).open_some(message="InvalidEntrypoint: remove_gatekeeper")
 
-    sp.result(sp.list([
-        sp.transfer_operation(gatekeeper_to_remove, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(gatekeeper_to_remove, sp.mutez(0), ledger_ep)])
+    )
+
 
 def remove_utxo(unit, txid, output_no):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TPair(sp.TNat, sp.TBytes), TZBTC_LEDGER, entry_point="remove_utxo"
     ).open_some(message="InvalidEntrypoint: remove_utxo")
 
-    sp.result(sp.list([
-        sp.transfer_operation(sp.pair(output_no, txid), sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list(
+            [sp.transfer_operation(sp.pair(output_no, txid), sp.mutez(0), ledger_ep)]
+        )
+    )
+
+
+def remove_utxos(unit, utxo_keys):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TList(sp.TPair(sp.TBytes, sp.TNat)), TZBTC_LEDGER, entry_point="remove_utxos"
+    ).open_some(message="InvalidEntrypoint: remove_utxos")
+
+    sp.result(
+        sp.list(
+            [
+                sp.transfer_operation(
+                    sp.list(
+                        [sp.pair(txid, output_no) for txid, output_no in utxo_keys]
+                    ),
+                    sp.mutez(0),
+                    ledger_ep,
+                )
+            ]
+        )
+    )
+
 
 def set_max_utxo_per_tx_count(unit, max_utxo_per_tx_count):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TNat, TZBTC_LEDGER, entry_point="set_max_utxo_per_tx_count"
     ).open_some(message="InvalidEntrypoint: set_max_utxo_per_tx_count")
 
-    sp.result(sp.list([
-        sp.transfer_operation(max_utxo_per_tx_count, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(max_utxo_per_tx_count, sp.mutez(0), ledger_ep)])
+    )
+
+
+def set_candidate_expiry_levels(unit, candidate_expiry_levels):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TNat, TZBTC_LEDGER, entry_point="set_candidate_expiry_levels"
+    ).open_some(message="InvalidEntrypoint: set_candidate_expiry_levels")
+
+    sp.result(
+        sp.list(
+            [sp.transfer_operation(candidate_expiry_levels, sp.mutez(0), ledger_ep)]
+        )
+    )
+
+
+def set_burn_prune_levels(unit, burn_prune_levels):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TNat, TZBTC_LEDGER, entry_point="set_burn_prune_levels"
+    ).open_some(message="InvalidEntrypoint: set_burn_prune_levels")
+
+    sp.result(
+        sp.list([sp.transfer_operation(burn_prune_levels, sp.mutez(0), ledger_ep)])
+    )
+
+
+def set_fast_mint(unit, fast_mint):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TBool, TZBTC_LEDGER, entry_point="set_fast_mint"
+    ).open_some(message="InvalidEntrypoint: set_fast_mint")
+
+    sp.result(sp.list([sp.transfer_operation(fast_mint, sp.mutez(0), ledger_ep)]))
+
+
+def set_emit_burn_signatures(unit, emit_burn_signatures):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TBool, TZBTC_LEDGER, entry_point="set_emit_burn_signatures"
+    ).open_some(message="InvalidEntrypoint: set_emit_burn_signatures")
+
+    sp.result(
+        sp.list([sp.transfer_operation(emit_burn_signatures, sp.mutez(0), ledger_ep)])
+    )
+
 
 def set_utxo(unit, txid, output_no, receiver, amount, utxo_state):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TPair(
             sp.TPair(sp.TNat, sp.TNat),
-            sp.TPair(
-                sp.TOption(sp.TAddress),
-                sp.TPair(sp.TBytes, sp.TNat)
-            )
+            sp.TPair(sp.TOption(sp.TAddress), sp.TPair(sp.TBytes, sp.TNat)),
         ),
         TZBTC_LEDGER,
-        entry_point="set_utxo"
+        entry_point="set_utxo",
     ).open_some(message="InvalidEntrypoint: set_utxo")
 
-    sp.result(sp.list([
-        sp.transfer_operation(
-            sp.pair(
-                sp.pair(amount, output_no),
-                sp.pair(receiver, sp.pair(txid, utxo_state))
-            ),
-            sp.mutez(0),
-            ledger_ep
+    sp.result(
+        sp.list(
+            [
+                sp.transfer_operation(
+                    sp.pair(
+                        sp.pair(amount, output_no),
+                        sp.pair(receiver, sp.pair(txid, utxo_state)),
+                    ),
+                    sp.mutez(0),
+                    ledger_ep,
+                )
+            ]
+        )
+    )
+
+
+def set_utxos(unit, utxos):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TList(
+            sp.TPair(
+                sp.TBytes,
+                sp.TPair(
+                    sp.TNat,
+                    sp.TPair(sp.TOption(sp.TAddress), sp.TPair(sp.TNat, sp.TNat)),
+                ),
+            )
+        ),
+        TZBTC_LEDGER,
+        entry_point="set_utxos",
+    ).open_some(message="InvalidEntrypoint: set_utxos")
+
+    sp.result(
+        sp.list(
+            [
+                sp.transfer_operation(
+                    sp.list(
+                        [
+                            sp.pair(
+                                txid,
+                                sp.pair(
+                                    output_no,
+                                    sp.pair(receiver, sp.pair(amount, utxo_state)),
+                                ),
+                            )
+                            for txid, output_no, receiver, amount, utxo_state in utxos
+                        ]
+                    ),
+                    sp.mutez(0),
+                    ledger_ep,
+                )
+            ]
         )
-    ]))
+    )
+
 
 def update_custody_btc_address(unit, custody_btc_address):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TBytes, TZBTC_LEDGER, entry_point="update_custody_btc_address"
     ).open_some(message="InvalidEntrypoint: update_custody_btc_address")
 
-    sp.result(sp.list([
-        sp.transfer_operation(custody_btc_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(custody_btc_address, sp.mutez(0), ledger_ep)])
+    )
+
 
 def update_gatekeeper_btc_address(gatekeeper_btc_address):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TBytes, TZBTC_LEDGER, entry_point="update_gatekeeper_btc_address"
     ).open_some(message="InvalidEntrypoint: update_gatekeeper_btc_address")
 
-    sp.result(sp.list([
-        sp.transfer_operation(gatekeeper_btc_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(gatekeeper_btc_address, sp.mutez(0), ledger_ep)])
+    )
+
 
 def update_max_btc_network_fee(unit, max_btc_network_fee):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TNat, TZBTC_LEDGER, entry_point="update_max_btc_network_fee"
     ).open_some(message="InvalidEntrypoint: update_max_btc_network_fee")
 
-    sp.result(sp.list([
-        sp.transfer_operation(max_btc_network_fee, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(max_btc_network_fee, sp.mutez(0), ledger_ep)])
+    )
+
 
 def update_min_burn_amount(unit, min_burn_amount):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TNat, TZBTC_LEDGER, entry_point="update_min_burn_amount"
     ).open_some(message="InvalidEntrypoint: update_min_burn_amount")
 
-    sp.result(sp.list([
-        sp.transfer_operation(min_burn_amount, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(sp.list([sp.transfer_operation(min_burn_amount, sp.mutez(0), ledger_ep)]))
+
 
 def update_redeem_address(redeem_address):
     sp.set_type(unit, sp.TUnit)
@@ -196,31 +325,61 @@ def update_redeem_address(redeem_address):
         sp.TAddress, TZBTC_LEDGER, entry_point="update_redeem_address"
     ).open_some(message="InvalidEntrypoint: update_redeem_address")
 
-    sp.result(sp.list([
-        sp.transfer_operation(redeem_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(sp.list([sp.transfer_operation(redeem_address, sp.mutez(0), ledger_ep)]))
+
 
 def update_service_fee(unit, service_fee):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TNat, TZBTC_LEDGER, entry_point="update_service_fee"
     ).open_some(message="InvalidEntrypoint: update_service_fee")
 
-    sp.result(sp.list([
-        sp.transfer_operation(service_fee, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(sp.list([sp.transfer_operation(service_fee, sp.mutez(0), ledger_ep)]))
+
 
 def update_threshold(unit, threshold):
     sp.set_type(unit, sp.TUnit)
-    
+
     ledger_ep = sp.contract(
         sp.TNat, TZBTC_LEDGER, entry_point="update_threshold"
     ).open_some(message="InvalidEntrypoint: update_threshold")
 
-    sp.result(sp.list([
-        sp.transfer_operation(threshold, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(sp.list([sp.transfer_operation(threshold, sp.mutez(0), ledger_ep)]))
+
+
+def update_roles(unit, changes, threshold=None):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(
+        sp.TPair(
+            sp.TList(sp.TPair(sp.TAddress, sp.TPair(sp.TNat, sp.TBool))),
+            sp.TOption(sp.TNat),
+        ),
+        TZBTC_LEDGER,
+        entry_point="update_roles",
+    ).open_some(message="InvalidEntrypoint: update_roles")
+
+    sp.result(
+        sp.list(
+            [
+                sp.transfer_operation(
+                    sp.pair(
+                        sp.list(
+                            [
+                                sp.pair(address, sp.pair(sp.nat(role), enabled))
+                                for address, role, enabled in changes
+                            ]
+                        ),
+                        sp.none if threshold is None else sp.some(sp.nat(threshold)),
+                    ),
+                    sp.mutez(0),
+                    ledger_ep,
+                )
+            ]
+        )
+    )
+
 
 def update_treasury_address(unit, treasury_address):
     sp.set_type(unit, sp.TUnit)
@@ -229,20 +388,48 @@ def update_treasury_address(unit, treasury_address):
         sp.TAddress, TZBTC_LEDGER, entry_point="update_treasury_address"
     ).open_some(message="InvalidEntrypoint: update_treasury_address")
 
-    sp.result(sp.list([
-        sp.transfer_operation(treasury_address, sp.mutez(0), ledger_ep)
-    ]))
+    sp.result(
+        sp.list([sp.transfer_operation(treasury_address, sp.mutez(0), ledger_ep)])
+    )
+
 
 def remove_burn(unit, burn_id):
     sp.set_type(unit, sp.TUnit)
 
+    ledger_ep = sp.contract(sp.TNat, TZBTC_LEDGER, entry_point="remove_burn").open_some(
+        message="InvalidEntrypoint: remove_burn"
+    )
+
+    sp.result(sp.list([sp.transfer_operation(burn_id, sp.mutez(0), ledger_ep)]))
+
+
+def remove_burns(unit, from_burn_id, to_burn_id):
+    sp.set_type(unit, sp.TUnit)
+
     ledger_ep = sp.contract(
-        sp.TNat, TZBTC_LEDGER, entry_point="remove_burn"
-    ).open_some(message="InvalidEntrypoint: remove_burn")
+        sp.TPair(sp.TNat, sp.TNat), TZBTC_LEDGER, entry_point="remove_burns"
+    ).open_some(message="InvalidEntrypoint: remove_burns")
+
+    sp.result(
+        sp.list(
+            [
+                sp.transfer_operation(
+                    sp.pair(from_burn_id, to_burn_id), sp.mutez(0), ledger_ep
+                )
+            ]
+        )
+    )
+
+
+def claim_fees(unit):
+    sp.set_type(unit, sp.TUnit)
+
+    ledger_ep = sp.contract(sp.TUnit, TZBTC_LEDGER, entry_point="claim_fees").open_some(
+        message="InvalidEntrypoint: claim_fees"
+    )
+
+    sp.result(sp.list([sp.transfer_operation(sp.unit, sp.mutez(0), ledger_ep)]))
 
-    sp.result(sp.list([
-        sp.transfer_operation(burn_id, sp.mutez(0), ledger_ep)
-    ]))
 
 class MultiSigPayload:
     def make_change_keys(
@@ -324,7 +511,9 @@ if __name__ == "__main__":
         lambda_builder = LambdaBuilder()
         scenario += lambda_builder
 
-        lambda_to_send = lambda unit: set_utxo(unit, sp.bytes("0xbb"), 11, sp.none, 22, 1)
+        lambda_to_send = lambda unit: set_utxo(
+            unit, sp.bytes("0xbb"), 11, sp.none, 22, 1
+        )
         # lambda_to_send = lambda unit: accept_admin_proposal(unit)
         execution_payload = MultiSigPayload.make_lambda(
             chain_id=CHAINID,
@@ -335,4 +524,4 @@ if __name__ == "__main__":
         packed_payload = sp.pack(execution_payload)
         scenario.show(packed_payload)
         lambda_builder.builder(sp.build_lambda(lambda_to_send))
-        lambda_builder.multisig_builder(execution_payload)
\ No newline at end of file
+        lambda_builder.multisig_builder(execution_payload)
@@ -1,15 +1,15 @@
 import smartpy as sp
 
-from utils.administrable_mixin import SingleAdministrableMixin, AdministratorStatus
+from utils.administrable_mixin import SingleAdministrableMixin, Roles
 
 
 class AdministrableContract(sp.Contract, SingleAdministrableMixin):
     def __init__(
         self,
-        administrators=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
+        roles=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TNat),
         administrators_num=sp.nat(0),
-        gatekeepers=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TUnit),
-        trusted_signers=sp.big_map(l={}, tkey=sp.TAddress, tvalue=sp.TUnit),
+        next_signer_index=sp.nat(0),
+        active_signers=sp.nat(0),
         threshold=sp.nat(3),
         min_burn_amount=sp.nat(100),
         btc_gatekeeper_address=sp.bytes("0xff"),
@@ -21,10 +21,10 @@ class AdministrableContract(sp.Contract, SingleAdministrableMixin):
     ):
         self.init_type(
             sp.TRecord(
-                administrators=sp.TBigMap(sp.TAddress, sp.TNat),
+                roles=sp.TBigMap(sp.TAddress, sp.TNat),
                 administrators_num=sp.TNat,
-                gatekeepers=sp.TBigMap(sp.TAddress, sp.TUnit),
-                trusted_signers=sp.TBigMap(sp.TAddress, sp.TUnit),
+                next_signer_index=sp.TNat,
+                active_signers=sp.TNat,
                 threshold=sp.TNat,
                 min_burn_amount=sp.TNat,
                 service_fee=sp.TNat,
@@ -37,10 +37,10 @@ class AdministrableContract(sp.Contract, SingleAdministrableMixin):
         )
 
         self.init(
-            administrators=administrators,
+            roles=roles,
             administrators_num=administrators_num,
-            gatekeepers=gatekeepers,
-            trusted_signers=trusted_signers,
+            next_signer_index=next_signer_index,
+            active_signers=active_signers,
             threshold=threshold,
             min_burn_amount=min_burn_amount,
             service_fee=service_fee,
@@ -73,10 +73,8 @@ def test():
     scenario.show([admin1, admin2, admin3, gatekeeper, trusted_signer, alice, bob])
 
     administable_contract = AdministrableContract(
-        administrators=sp.big_map({admin1.address: AdministratorStatus.PROPOSED}),
+        roles=sp.big_map({admin1.address: Roles.make(Roles.PROPOSED_ADMINISTRATOR)}),
         administrators_num=sp.nat(0),
-        gatekeepers=sp.big_map({}),
-        trusted_signers=sp.big_map({}),
         threshold=sp.nat(3),
         min_burn_amount=sp.nat(100),
         btc_gatekeeper_address=sp.bytes("0xff"),
@@ -94,8 +92,8 @@ def test():
     )
     scenario += administable_contract.accept_admin_proposal().run(sender=admin1)
     scenario.verify_equal(
-        administable_contract.data.administrators[admin1.address],
-        AdministratorStatus.SET,
+        administable_contract.data.roles[admin1.address],
+        Roles.make(Roles.ADMINISTRATOR),
     )
     scenario.verify(administable_contract.data.administrators_num == 1)
 
@@ -104,8 +102,8 @@ def test():
         sender=admin1
     )
     scenario.verify_equal(
-        administable_contract.data.administrators[admin2.address],
-        AdministratorStatus.PROPOSED,
+        administable_contract.data.roles[admin2.address],
+        Roles.make(Roles.PROPOSED_ADMINISTRATOR),
     )
     scenario.verify(administable_contract.data.administrators_num == 1)
     scenario += administable_contract.propose_administrator(alice.address).run(
@@ -114,6 +112,9 @@ def test():
     scenario += administable_contract.propose_administrator(alice.address).run(
         sender=admin2, valid=False
     )
+    scenario += administable_contract.propose_administrator(admin2.address).run(
+        sender=admin1, valid=False
+    )
 
     scenario.h2("Only a set admin can add a gatekeeper")
     scenario += administable_contract.add_gatekeeper(gatekeeper.address).run(
@@ -125,7 +126,10 @@ def test():
     scenario += administable_contract.add_gatekeeper(gatekeeper.address).run(
         sender=admin1
     )
-    scenario.verify(administable_contract.data.gatekeepers.contains(gatekeeper.address))
+    scenario.verify_equal(
+        administable_contract.data.roles[gatekeeper.address],
+        Roles.make(Roles.GATEKEEPER),
+    )
 
     scenario.h2("Only a set admin can add a trusted signer")
     scenario += administable_contract.add_trusted_signer(trusted_signer.address).run(
@@ -137,9 +141,33 @@ def test():
     scenario += administable_contract.add_trusted_signer(trusted_signer.address).run(
         sender=admin1
     )
-    scenario.verify(
-        administable_contract.data.trusted_signers.contains(trusted_signer.address)
+    scenario.verify_equal(
+        administable_contract.data.roles[trusted_signer.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
     )
+    scenario.verify_equal(administable_contract.data.next_signer_index, sp.nat(1))
+    scenario.verify_equal(administable_contract.data.active_signers, sp.nat(1))
+
+    scenario.h2("Adding a trusted signer again keeps its index")
+    scenario += administable_contract.add_trusted_signer(trusted_signer.address).run(
+        sender=admin1
+    )
+    scenario.verify_equal(
+        administable_contract.data.roles[trusted_signer.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+    )
+    scenario.verify_equal(administable_contract.data.next_signer_index, sp.nat(1))
+
+    scenario.h2("An address can hold several roles")
+    scenario += administable_contract.add_trusted_signer(gatekeeper.address).run(
+        sender=admin1
+    )
+    scenario.verify_equal(
+        administable_contract.data.roles[gatekeeper.address],
+        Roles.make(Roles.GATEKEEPER, Roles.TRUSTED_SIGNER, signer_index=1),
+    )
+    scenario.verify_equal(administable_contract.data.next_signer_index, sp.nat(2))
+    scenario.verify_equal(administable_contract.data.active_signers, sp.nat(3))
 
     scenario.h2("Only a set admin can update threshold")
     scenario += administable_contract.update_threshold(sp.nat(2)).run(
@@ -239,16 +267,16 @@ def test():
     # Small setup to have 2 set admins and one proposed one.
     scenario += administable_contract.accept_admin_proposal().run(sender=admin2)
     scenario.verify_equal(
-        administable_contract.data.administrators[admin2.address],
-        AdministratorStatus.SET,
+        administable_contract.data.roles[admin2.address],
+        Roles.make(Roles.ADMINISTRATOR),
     )
     scenario.verify(administable_contract.data.administrators_num == 2)
     scenario += administable_contract.propose_administrator(admin3.address).run(
         sender=admin2
     )
     scenario.verify_equal(
-        administable_contract.data.administrators[admin3.address],
-        AdministratorStatus.PROPOSED,
+        administable_contract.data.roles[admin3.address],
+        Roles.make(Roles.PROPOSED_ADMINISTRATOR),
     )
     scenario.verify(
         administable_contract.data.administrators_num == 2
@@ -263,7 +291,7 @@ def test():
     scenario += administable_contract.remove_administrator(admin2.address).run(
         sender=admin1
     )
-    scenario.verify(~administable_contract.data.administrators.contains(admin2.address))
+    scenario.verify(~administable_contract.data.roles.contains(admin2.address))
     scenario.verify(administable_contract.data.administrators_num == 1)
 
     scenario.h2("Cannot remove the last administrator")
@@ -281,8 +309,9 @@ def test():
     scenario += administable_contract.remove_gatekeeper(gatekeeper.address).run(
         sender=admin1
     )
-    scenario.verify(
-        ~administable_contract.data.gatekeepers.contains(gatekeeper.address)
+    scenario.verify_equal(
+        administable_contract.data.roles[gatekeeper.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
     )
 
     scenario.h2("Only a set admin can remove a trusted signer")
@@ -295,6 +324,124 @@ def test():
     scenario += administable_contract.remove_trusted_signer(trusted_signer.address).run(
         sender=admin1
     )
-    scenario.verify(
-        ~administable_contract.data.trusted_signers.contains(trusted_signer.address)
+    scenario.verify(~administable_contract.data.roles.contains(trusted_signer.address))
+    scenario.verify_equal(administable_contract.data.active_signers, sp.nat(2))
+
+    scenario.h2("A removed trusted signer gets a new index when added again")
+    scenario += administable_contract.add_trusted_signer(trusted_signer.address).run(
+        sender=admin1
+    )
+    scenario.verify_equal(
+        administable_contract.data.roles[trusted_signer.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=2),
+    )
+    scenario.verify_equal(administable_contract.data.next_signer_index, sp.nat(3))
+    scenario.verify_equal(administable_contract.data.active_signers, sp.nat(6))
+
+    scenario.h2("Only a set admin can update roles")
+    rotation = sp.list(
+        [
+            sp.record(
+                address=gatekeeper.address, role=Roles.TRUSTED_SIGNER, enabled=False
+            ),
+            sp.record(
+                address=trusted_signer.address, role=Roles.TRUSTED_SIGNER, enabled=False
+            ),
+            sp.record(address=alice.address, role=Roles.TRUSTED_SIGNER, enabled=True),
+            sp.record(address=bob.address, role=Roles.TRUSTED_SIGNER, enabled=True),
+            sp.record(address=bob.address, role=Roles.GATEKEEPER, enabled=True),
+        ]
+    )
+    scenario += administable_contract.update_roles(
+        changes=rotation, threshold=sp.some(sp.nat(1))
+    ).run(sender=alice, valid=False)
+    scenario += administable_contract.update_roles(
+        changes=rotation, threshold=sp.some(sp.nat(1))
+    ).run(sender=admin3, valid=False)
+    scenario += administable_contract.update_roles(
+        changes=rotation, threshold=sp.some(sp.nat(1))
+    ).run(sender=admin1)
+    scenario.verify(~administable_contract.data.roles.contains(gatekeeper.address))
+    scenario.verify(~administable_contract.data.roles.contains(trusted_signer.address))
+    scenario.verify_equal(
+        administable_contract.data.roles[alice.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=3),
+    )
+    scenario.verify_equal(
+        administable_contract.data.roles[bob.address],
+        Roles.make(Roles.GATEKEEPER, Roles.TRUSTED_SIGNER, signer_index=4),
+    )
+    scenario.verify_equal(administable_contract.data.next_signer_index, sp.nat(5))
+    scenario.verify_equal(administable_contract.data.active_signers, sp.nat(24))
+    scenario.verify_equal(administable_contract.data.threshold, sp.nat(1))
+
+    scenario.h2("Update roles is atomic")
+    scenario += administable_contract.update_roles(
+        changes=sp.list(
+            [
+                sp.record(address=alice.address, role=Roles.GATEKEEPER, enabled=True),
+                sp.record(address=bob.address, role=Roles.ADMINISTRATOR, enabled=True),
+            ]
+        ),
+        threshold=sp.some(sp.nat(2)),
+    ).run(sender=admin1, valid=False)
+    scenario.verify_equal(
+        administable_contract.data.roles[alice.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=3),
+    )
+    scenario.verify_equal(administable_contract.data.threshold, sp.nat(1))
+
+    scenario.h2("Update roles without threshold keeps the threshold")
+    scenario += administable_contract.update_roles(
+        changes=sp.list(
+            [sp.record(address=bob.address, role=Roles.GATEKEEPER, enabled=False)]
+        ),
+        threshold=sp.none,
+    ).run(sender=admin1)
+    scenario.verify_equal(
+        administable_contract.data.roles[bob.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=4),
+    )
+    scenario.verify_equal(administable_contract.data.threshold, sp.nat(1))
+
+    scenario.h2("Signer indices are limited to Roles.MAX_SIGNER_INDEX")
+    exhausted_contract = AdministrableContract(
+        roles=sp.big_map({admin1.address: Roles.make(Roles.ADMINISTRATOR)}),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(Roles.MAX_SIGNER_INDEX),
+        treasury_address=default.address,
+        redeem_address=default.address,
+    )
+    scenario += exhausted_contract
+    scenario += exhausted_contract.add_trusted_signer(alice.address).run(sender=admin1)
+    scenario.verify_equal(
+        exhausted_contract.data.roles[alice.address],
+        Roles.make(Roles.TRUSTED_SIGNER, signer_index=Roles.MAX_SIGNER_INDEX),
+    )
+    scenario.verify_equal(
+        exhausted_contract.data.active_signers, sp.nat(1 << Roles.MAX_SIGNER_INDEX)
+    )
+    scenario.verify_equal(
+        exhausted_contract.data.next_signer_index, sp.nat(Roles.MAX_SIGNER_INDEX + 1)
+    )
+    scenario += exhausted_contract.add_trusted_signer(bob.address).run(
+        sender=admin1, valid=False
+    )
+    scenario += exhausted_contract.update_roles(
+        changes=sp.list(
+            [sp.record(address=bob.address, role=Roles.TRUSTED_SIGNER, enabled=True)]
+        ),
+        threshold=sp.none,
+    ).run(sender=admin1, valid=False)
+
+    scenario.p("Adding an existing signer does not need a new index")
+    scenario += exhausted_contract.add_trusted_signer(alice.address).run(sender=admin1)
+
+    scenario.p("A removed signer cannot be added again")
+    scenario += exhausted_contract.remove_trusted_signer(alice.address).run(
+        sender=admin1
+    )
+    scenario.verify_equal(exhausted_contract.data.active_signers, sp.nat(0))
+    scenario += exhausted_contract.add_trusted_signer(alice.address).run(
+        sender=admin1, valid=False
     )
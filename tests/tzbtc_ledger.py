@@ -1,7 +1,17 @@
 import smartpy as sp
 
-from utils.administrable_mixin import SingleAdministrableMixin, AdministratorStatus
-from contracts.tzbtc_ledger import TzBTCLedger, UTXO, UTXO_STATE, Burn, BurnState
+from utils.administrable_mixin import SingleAdministrableMixin, Roles
+from utils.merkle_whitelist import MerkleWhitelist, pack_address
+from contracts.tzbtc_ledger import (
+    TzBTCLedger,
+    UTXO,
+    UTXO_STATE,
+    Burn,
+    BurnState,
+    BurnSignature,
+    RelayedApproval,
+    Reserves,
+)
 
 
 class DummyTzBtcToken(sp.Contract):
@@ -119,6 +129,73 @@ class DummyTzBtcToken(sp.Contract):
         self.data.operators[params] = sp.unit
 
 
+class EventRecorder(sp.Contract):
+    """
+    Stores the events forwarded by an EventRecordingLedger. The SmartPy scenarios do
+    not expose the events emitted by a contract, so they are checked in this storage.
+    """
+
+    def __init__(self):
+        self.init(events=sp.list(l=[], t=get_event_type()))
+
+    @sp.entry_point
+    def record(self, event):
+        sp.set_type(event, get_event_type())
+        self.data.events.push(event)
+
+    @sp.entry_point
+    def clear(self):
+        self.data.events = sp.list(l=[], t=get_event_type())
+
+
+class EventRecordingLedger(TzBTCLedger):
+    """
+    TzBTCLedger that also forwards every event it emits to an EventRecorder.
+    """
+
+    def __init__(self, recorder_address, **kwargs):
+        self.recorder_address = recorder_address
+        TzBTCLedger.__init__(self, **kwargs)
+
+    def emit_event(self, payload, tag):
+        TzBTCLedger.emit_event(self, payload, tag)
+        recorder = sp.contract(
+            get_event_type(), self.recorder_address, entry_point="record"
+        ).open_some()
+        sp.transfer(make_event(tag, payload), sp.mutez(0), recorder)
+
+
+def get_event_type():
+    return sp.TRecord(tag=sp.TString, payload=sp.TBytes).layout(("tag", "payload"))
+
+
+def make_event(tag, payload):
+    """
+    Builds an event as stored by the EventRecorder, the payload is packed so that the
+    events of every tag have the same type.
+    """
+    return sp.set_type_expr(
+        sp.record(tag=tag, payload=sp.pack(payload)), get_event_type()
+    )
+
+
+def make_txid(txid):
+    """
+    Right pads a short test txid with zeros to the 32 bytes of a BTC transaction id,
+    the only length accepted by the ledger.
+    """
+    return sp.bytes(txid + "0" * (66 - len(txid)))
+
+
+def list_open_burns(tzbtc_ledger):
+    """
+    Lists the open burns among all the burn ids created by the ledger.
+    """
+    return tzbtc_ledger.get_open_burns(
+        sp.record(from_burn_id=sp.nat(0), to_burn_id=tzbtc_ledger.data.burn_id_counter)
+    )
+
+
 @sp.add_test(name="TzBTC Ledger")
 def test():
     scenario = sp.test_scenario()
@@ -150,18 +227,24 @@ def test():
     SERVICE_FEE = 100
     MIN_BURN_AMOUNT = 100
     MAX_BTC_NETWORK_FEE = 1_000
+    # Bits of the signers in the approvers bitmasks (signer indices 0, 1 and 2)
+    SIGNER1_BIT = sp.nat(1)
+    SIGNER2_BIT = sp.nat(2)
+    SIGNER3_BIT = sp.nat(4)
 
     tzbtc_ledger = TzBTCLedger(
-        administrators=sp.big_map({ledger_admin.address: AdministratorStatus.SET}),
-        administrators_num=sp.nat(1),
-        gatekeepers=sp.big_map({gatekeeper.address: sp.unit}),
-        trusted_signers=sp.big_map(
+        roles=sp.big_map(
             {
-                signer1.address: sp.unit,
-                signer2.address: sp.unit,
-                signer3.address: sp.unit,
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+                signer2.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
+                signer3.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=2),
             }
         ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(3),
+        active_signers=SIGNER1_BIT + SIGNER2_BIT + SIGNER3_BIT,
         threshold=THRESHOLD,
         token_address=token_contract.address,
         treasury_address=treasury.address,
@@ -197,7 +280,7 @@ def test():
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=alice.address,
-            txid=sp.bytes("0xffffff"),
+            txid=make_txid("0xffffff"),
         )
     ).run(sender=alice, valid=False)
 
@@ -207,63 +290,77 @@ def test():
             amount=sp.nat(SERVICE_FEE - 1),
             output_no=sp.nat(0),
             receiver=alice.address,
+            txid=make_txid("0xffffff"),
+        )
+    ).run(sender=signer1, valid=False)
+
+    scenario.p("confirm_utxo fails if the txid is not 32 bytes long")
+    scenario += tzbtc_ledger.confirm_utxo(
+        sp.record(
+            amount=sp.nat(1000),
+            output_no=sp.nat(0),
+            receiver=alice.address,
             txid=sp.bytes("0xffffff"),
         )
     ).run(sender=signer1, valid=False)
 
     scenario.p("new confirm_utxo passed if it is sent by signer")
-    UTXO_KEY = UTXO.make_key(sp.bytes("0xeeeeee"), sp.nat(0))
+    UTXO_KEY = UTXO.make_key(make_txid("0xeeeeee"), sp.nat(0))
     scenario += tzbtc_ledger.confirm_utxo(
         sp.record(
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=bob.address,
-            txid=sp.bytes("0xeeeeee"),
+            txid=make_txid("0xeeeeee"),
         )
     ).run(sender=signer1)
-    candidate_bob_key = UTXO.make_candidate_key_type(sp.some(bob.address), sp.nat(1000))
+    candidate_bob_hash = UTXO.make_candidate_hash(sp.some(bob.address), sp.nat(1000))
     scenario.verify_equal(
         tzbtc_ledger.data.candidate_utxo_map[UTXO_KEY],
         UTXO.make_utxo_candidate_value_type(
-            approvers=sp.set([signer1.address]),
-            candidates=sp.map({candidate_bob_key: sp.set([signer1.address])}),
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {candidate_bob_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1)}
+            ),
         ),
     )
 
     scenario.p(
         "confirm_utxo from the same signer with different amount/receiver is not allowed"
     )
-    UTXO_KEY = UTXO.make_key(sp.bytes("0xeeeeee"), sp.nat(0))
+    UTXO_KEY = UTXO.make_key(make_txid("0xeeeeee"), sp.nat(0))
     scenario += tzbtc_ledger.confirm_utxo(
         sp.record(
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=alice.address,  # changed the receiver to alice
-            txid=sp.bytes("0xeeeeee"),
+            txid=make_txid("0xeeeeee"),
         )
     ).run(
         sender=signer1, valid=False
     )  # signer 1 already sent the confirmation.
 
     scenario.p("confirm_utxo passed if it is sent by signer")
-    UTXO_KEY = UTXO.make_key(sp.bytes("0xffffff"), sp.nat(0))
+    UTXO_KEY = UTXO.make_key(make_txid("0xffffff"), sp.nat(0))
     scenario += tzbtc_ledger.confirm_utxo(
         sp.record(
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=alice.address,
-            txid=sp.bytes("0xffffff"),
+            txid=make_txid("0xffffff"),
         )
     ).run(sender=signer1)
-    candidate_alice_key = UTXO.make_candidate_key_type(
+    candidate_alice_hash = UTXO.make_candidate_hash(
         sp.some(alice.address), sp.nat(1000)
     )
 
     scenario.verify_equal(
         tzbtc_ledger.data.candidate_utxo_map[UTXO_KEY],
         UTXO.make_utxo_candidate_value_type(
-            approvers=sp.set([signer1.address]),
-            candidates=sp.map({candidate_alice_key: sp.set([signer1.address])}),
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {candidate_alice_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1)}
+            ),
         ),
     )
 
@@ -275,18 +372,18 @@ def test():
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=bob.address,  # receiver was changed to bob.
-            txid=sp.bytes("0xffffff"),
+            txid=make_txid("0xffffff"),
         )
     ).run(sender=signer2)
-    candidate_bob_key = UTXO.make_candidate_key_type(sp.some(bob.address), sp.nat(1000))
+    candidate_bob_hash = UTXO.make_candidate_hash(sp.some(bob.address), sp.nat(1000))
     scenario.verify_equal(
         tzbtc_ledger.data.candidate_utxo_map[UTXO_KEY],
         UTXO.make_utxo_candidate_value_type(
-            approvers=sp.set([signer1.address, signer2.address]),
+            approvers=SIGNER1_BIT + SIGNER2_BIT,
             candidates=sp.map(
                 {
-                    candidate_alice_key: sp.set([signer1.address]),
-                    candidate_bob_key: sp.set([signer2.address]),
+                    candidate_alice_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1),
+                    candidate_bob_hash: UTXO.make_candidate_votes(SIGNER2_BIT, 1),
                 }
             ),
         ),
@@ -298,75 +395,308 @@ def test():
             amount=sp.nat(1000),
             output_no=sp.nat(0),
             receiver=alice.address,
-            txid=sp.bytes("0xffffff"),
+            txid=make_txid("0xffffff"),
         )
     ).run(sender=signer3)
     # candidate is removed once the quorum has been reached and a new UTXO is created
     scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(UTXO_KEY) == False)
     scenario.verify_equal(
-        tzbtc_ledger.data.utxo_map[UTXO_KEY],
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(UTXO_KEY)],
         UTXO.make_value(
             state=UTXO_STATE.INIT, receiver=sp.some(alice.address), amount=sp.nat(1000)
         ),
     )
 
+    #####################################################################################
+    #                               confirm_utxos checks                                #
+    #####################################################################################
+    scenario.h2("confirm_utxos")
+
+    scenario.p("NonSigners cannot call confirm_utxos")
+    scenario += tzbtc_ledger.confirm_utxos(
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=False,
+                )
+            ]
+        )
+    ).run(sender=alice, valid=False)
+
+    scenario.p("confirm_utxos fails if the amount of any entry is too low")
+    scenario += tzbtc_ledger.confirm_utxos(
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=False,
+                ),
+                sp.record(
+                    amount=sp.nat(SERVICE_FEE - 1),
+                    output_no=sp.nat(1),
+                    receiver=charlie.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=True,
+                ),
+            ]
+        )
+    ).run(sender=signer1, valid=False)
+
+    scenario.p("confirm_utxos creates a candidate for every entry")
+    BATCH_UTXO_KEY_0 = UTXO.make_key(make_txid("0xcccccc"), sp.nat(0))
+    BATCH_UTXO_KEY_1 = UTXO.make_key(make_txid("0xcccccc"), sp.nat(1))
+    candidate_charlie_hash = UTXO.make_candidate_hash(
+        sp.some(charlie.address), sp.nat(1000)
+    )
+    BATCH_UTXOS = sp.list(
+        [
+            sp.record(
+                amount=sp.nat(1000),
+                output_no=sp.nat(0),
+                receiver=charlie.address,
+                txid=make_txid("0xcccccc"),
+                skip_confirmed=False,
+            ),
+            sp.record(
+                amount=sp.nat(2000),
+                output_no=sp.nat(1),
+                receiver=dan.address,
+                txid=make_txid("0xcccccc"),
+                skip_confirmed=False,
+            ),
+        ]
+    )
+    scenario += tzbtc_ledger.confirm_utxos(BATCH_UTXOS).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.data.candidate_utxo_map[BATCH_UTXO_KEY_0],
+        UTXO.make_utxo_candidate_value_type(
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {candidate_charlie_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1)}
+            ),
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.candidate_utxo_map[BATCH_UTXO_KEY_1],
+        UTXO.make_utxo_candidate_value_type(
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {
+                    UTXO.make_candidate_hash(
+                        sp.some(dan.address), sp.nat(2000)
+                    ): UTXO.make_candidate_votes(SIGNER1_BIT, 1)
+                }
+            ),
+        ),
+    )
+
+    scenario.p("confirm_utxos fails if the same signer confirms an entry again")
+    scenario += tzbtc_ledger.confirm_utxos(BATCH_UTXOS).run(sender=signer1, valid=False)
+
+    scenario.p("confirm_utxos skips entries already confirmed by the same signer")
+    scenario += tzbtc_ledger.confirm_utxos(
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=True,
+                ),
+            ]
+        )
+    ).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.data.candidate_utxo_map[BATCH_UTXO_KEY_0],
+        UTXO.make_utxo_candidate_value_type(
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {candidate_charlie_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1)}
+            ),
+        ),
+    )
+
+    scenario.p("confirm_utxos fails on an already confirmed UTXO that is not skipped")
+    scenario += tzbtc_ledger.confirm_utxos(
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=alice.address,
+                    txid=make_txid("0xffffff"),
+                    skip_confirmed=False,
+                ),
+            ]
+        )
+    ).run(sender=signer2, valid=False)
+
+    scenario.p("confirm_utxos creates the utxos with enough signers confirming them")
+    scenario += tzbtc_ledger.confirm_utxos(
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=alice.address,
+                    txid=make_txid("0xffffff"),  # already confirmed, skipped
+                    skip_confirmed=True,
+                ),
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=False,
+                ),
+                sp.record(
+                    amount=sp.nat(2000),
+                    output_no=sp.nat(1),
+                    receiver=dan.address,
+                    txid=make_txid("0xcccccc"),
+                    skip_confirmed=False,
+                ),
+            ]
+        )
+    ).run(sender=signer2)
+    scenario.verify(~tzbtc_ledger.data.candidate_utxo_map.contains(BATCH_UTXO_KEY_0))
+    scenario.verify(~tzbtc_ledger.data.candidate_utxo_map.contains(BATCH_UTXO_KEY_1))
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(BATCH_UTXO_KEY_0)],
+        UTXO.make_value(
+            state=UTXO_STATE.INIT,
+            receiver=sp.some(charlie.address),
+            amount=sp.nat(1000),
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(BATCH_UTXO_KEY_1)],
+        UTXO.make_value(
+            state=UTXO_STATE.INIT, receiver=sp.some(dan.address), amount=sp.nat(2000)
+        ),
+    )
+
     #####################################################################################
     #                                 mint checks                                       #
     #####################################################################################
     scenario.h2("Minting")
     scenario.p("Minting fails if the caller is not the gatekeeper")
-    scenario += tzbtc_ledger.mint(txid=sp.bytes("0xffffff"), output_no=sp.nat(0)).run(
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xffffff"), output_no=sp.nat(0)).run(
         sender=alice, valid=False
     )
 
     scenario.p("Minting fails if the UTXO does not exist")
-    scenario += tzbtc_ledger.mint(txid=sp.bytes("0xffffff"), output_no=sp.nat(1)).run(
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xffffff"), output_no=sp.nat(1)).run(
         sender=gatekeeper, valid=False
     )
 
     scenario.p("Minting fails if the UTXO is not in the init state")
     # setup
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.some(alice.address),
         amount=sp.nat(1000),
         utxo_state=UTXO_STATE.USED_FOR_MINT,
     ).run(sender=ledger_admin)
-    scenario += tzbtc_ledger.mint(txid=sp.bytes("0xeeeeee"), output_no=sp.nat(0)).run(
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xeeeeee"), output_no=sp.nat(0)).run(
         sender=gatekeeper, valid=False
     )
 
     scenario.p("Minting fails if there is no receiver set in the UTXO")
     # setup
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.none,
         amount=sp.nat(1000),
         utxo_state=UTXO_STATE.INIT,
     ).run(sender=ledger_admin)
-    scenario += tzbtc_ledger.mint(txid=sp.bytes("0xeeeeee"), output_no=sp.nat(0)).run(
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xeeeeee"), output_no=sp.nat(0)).run(
         sender=gatekeeper, valid=False
     )
     # clean up
     scenario += tzbtc_ledger.remove_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
     ).run(sender=ledger_admin)
 
     scenario.p("Minting goes through")
-    scenario += tzbtc_ledger.mint(txid=sp.bytes("0xffffff"), output_no=sp.nat(0)).run(
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xffffff"), output_no=sp.nat(0)).run(
         sender=gatekeeper
     )
     scenario.verify_equal(
         token_contract.data.ledger[alice.address].balance, sp.nat(1000 - SERVICE_FEE)
     )
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, sp.nat(SERVICE_FEE))
+    scenario.verify(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(UTXO_KEY)].is_variant(
+            "used_for_mint"
+        )
+    )
+
+    #####################################################################################
+    #                               mint_utxos checks                                   #
+    #####################################################################################
+    scenario.h2("Batch minting")
+    scenario.p("Batch minting fails if the caller is not the gatekeeper")
+    scenario += tzbtc_ledger.mint_utxos(
+        sp.list([sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(0))])
+    ).run(sender=alice, valid=False)
+
+    scenario.p("Batch minting fails if any of the UTXOs is not in the init state")
+    scenario += tzbtc_ledger.mint_utxos(
+        sp.list(
+            [
+                sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(0)),
+                sp.record(txid=make_txid("0xffffff"), output_no=sp.nat(0)),
+            ]
+        )
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("Batch minting fails if the same UTXO is given twice")
+    scenario += tzbtc_ledger.mint_utxos(
+        sp.list(
+            [
+                sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(0)),
+                sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(0)),
+            ]
+        )
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("Batch minting goes through")
+    scenario += tzbtc_ledger.mint_utxos(
+        sp.list(
+            [
+                sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(0)),
+                sp.record(txid=make_txid("0xcccccc"), output_no=sp.nat(1)),
+            ]
+        )
+    ).run(sender=gatekeeper)
     scenario.verify_equal(
-        token_contract.data.ledger[treasury.address].balance, sp.nat(SERVICE_FEE)
+        token_contract.data.ledger[charlie.address].balance, sp.nat(1000 - SERVICE_FEE)
     )
     scenario.verify_equal(
-        tzbtc_ledger.data.utxo_map[UTXO_KEY].state, UTXO_STATE.USED_FOR_MINT
+        token_contract.data.ledger[dan.address].balance, sp.nat(2000 - SERVICE_FEE)
+    )
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, sp.nat(3 * SERVICE_FEE))
+    scenario.verify(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(BATCH_UTXO_KEY_0)].is_variant(
+            "used_for_mint"
+        )
+    )
+    scenario.verify(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(BATCH_UTXO_KEY_1)].is_variant(
+            "used_for_mint"
+        )
     )
 
     #####################################################################################
@@ -378,7 +708,7 @@ def test():
         sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     amount=sp.nat(1000),
                 )
@@ -387,24 +717,26 @@ def test():
     ).run(sender=alice, valid=False)
 
     scenario.p("confirm_change_utxo creates candidate if the sender is a signer")
-    UTXO_KEY = UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0))
+    UTXO_KEY = UTXO.make_key(make_txid("0xdddddd"), sp.nat(0))
     scenario += tzbtc_ledger.confirm_change_utxo(
         sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     amount=sp.nat(1000),
                 )
             ]
         )
     ).run(sender=signer1)
-    candidate_1000_key = UTXO.make_candidate_key_type(sp.none, sp.nat(1000))
+    candidate_1000_hash = UTXO.make_candidate_hash(sp.none, sp.nat(1000))
     scenario.verify_equal(
         tzbtc_ledger.data.candidate_utxo_map[UTXO_KEY],
         UTXO.make_utxo_candidate_value_type(
-            approvers=sp.set([signer1.address]),
-            candidates=sp.map({candidate_1000_key: sp.set([signer1.address])}),
+            approvers=SIGNER1_BIT,
+            candidates=sp.map(
+                {candidate_1000_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1)}
+            ),
         ),
     )
 
@@ -413,7 +745,7 @@ def test():
         sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     amount=sp.nat(1000),
                 )
@@ -428,22 +760,22 @@ def test():
         sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     amount=sp.nat(999),
                 )
             ]
         )
     ).run(sender=signer2)
-    candidate_999_key = UTXO.make_candidate_key_type(sp.none, sp.nat(999))
+    candidate_999_hash = UTXO.make_candidate_hash(sp.none, sp.nat(999))
     scenario.verify_equal(
         tzbtc_ledger.data.candidate_utxo_map[UTXO_KEY],
         UTXO.make_utxo_candidate_value_type(
-            approvers=sp.set([signer1.address, signer2.address]),
+            approvers=SIGNER1_BIT + SIGNER2_BIT,
             candidates=sp.map(
                 {
-                    candidate_1000_key: sp.set([signer1.address]),
-                    candidate_999_key: sp.set([signer2.address]),
+                    candidate_1000_hash: UTXO.make_candidate_votes(SIGNER1_BIT, 1),
+                    candidate_999_hash: UTXO.make_candidate_votes(SIGNER2_BIT, 1),
                 }
             ),
         ),
@@ -456,7 +788,7 @@ def test():
         sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     amount=sp.nat(1000),
                 )
@@ -465,7 +797,7 @@ def test():
     ).run(sender=signer3)
     scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(UTXO_KEY) == False)
     scenario.verify_equal(
-        tzbtc_ledger.data.utxo_map[UTXO_KEY],
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(UTXO_KEY)],
         UTXO.make_value(
             state=UTXO_STATE.USED_FOR_MINT, receiver=sp.none, amount=sp.nat(1000)
         ),
@@ -477,7 +809,7 @@ def test():
     scenario.h2("Set UTXO")
     scenario.p("set_utxo fails if sender is not admin")
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.none,
         amount=sp.nat(1000),
@@ -486,16 +818,28 @@ def test():
 
     scenario.p("set_utxo fails the set state is not valid")
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.none,
         amount=sp.nat(1000),
         utxo_state=2,  # No such state exists
     ).run(sender=ledger_admin, valid=False)
 
+    scenario.p(
+        "set_utxo fails if the txid is not 32 bytes long: the packed key of "
+        "(txid || 0x81, 1) would be the packed key of (txid, 65)"
+    )
+    scenario += tzbtc_ledger.set_utxo(
+        txid=sp.bytes("0xeeeeee" + "0" * 58 + "81"),
+        output_no=sp.nat(1),
+        receiver=sp.none,
+        amount=sp.nat(1000),
+        utxo_state=UTXO_STATE.USED_FOR_MINT,
+    ).run(sender=ledger_admin, valid=False)
+
     scenario.p("set_utxo goes through")
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.none,
         amount=sp.nat(1000),
@@ -508,16 +852,94 @@ def test():
     scenario.h2("Remove UTXO")
     scenario.p("remove_utxo fails if sender is not admin")
     scenario += tzbtc_ledger.remove_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
     ).run(sender=alice, valid=False)
 
     scenario.p("remove_utxo goes through")
     scenario += tzbtc_ledger.remove_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
     ).run(sender=ledger_admin)
 
+    ######################################################################################
+    #                          set_utxos/remove_utxos checks                             #
+    ######################################################################################
+    scenario.h2("Set and remove UTXOs in bulk")
+    BULK_UTXOS = sp.list(
+        [
+            sp.record(
+                txid=make_txid("0xacac01"),
+                output_no=sp.nat(0),
+                receiver=sp.some(alice.address),
+                amount=sp.nat(1000),
+                utxo_state=UTXO_STATE.INIT,
+            ),
+            sp.record(
+                txid=make_txid("0xacac01"),
+                output_no=sp.nat(1),
+                receiver=sp.none,
+                amount=sp.nat(2000),
+                utxo_state=UTXO_STATE.USED_FOR_MINT,
+            ),
+        ]
+    )
+    BULK_UTXO_KEYS = sp.list(
+        [
+            UTXO.make_key(make_txid("0xacac01"), sp.nat(0)),
+            UTXO.make_key(make_txid("0xacac01"), sp.nat(1)),
+        ]
+    )
+
+    scenario.p("set_utxos fails if sender is not admin")
+    scenario += tzbtc_ledger.set_utxos(BULK_UTXOS).run(sender=alice, valid=False)
+
+    scenario.p("set_utxos fails if any state is not valid")
+    scenario += tzbtc_ledger.set_utxos(
+        sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xacac02"),
+                    output_no=sp.nat(0),
+                    receiver=sp.none,
+                    amount=sp.nat(1000),
+                    utxo_state=2,  # No such state exists
+                )
+            ]
+        )
+    ).run(sender=ledger_admin, valid=False)
+
+    scenario.p("set_utxos goes through")
+    scenario += tzbtc_ledger.set_utxos(BULK_UTXOS).run(sender=ledger_admin)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xacac01"), sp.nat(0)))
+        ],
+        UTXO.make_value(UTXO_STATE.INIT, sp.some(alice.address), sp.nat(1000)),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xacac01"), sp.nat(1)))
+        ],
+        UTXO.make_value(UTXO_STATE.USED_FOR_MINT, sp.none, sp.nat(2000)),
+    )
+
+    scenario.p("remove_utxos fails if sender is not admin")
+    scenario += tzbtc_ledger.remove_utxos(BULK_UTXO_KEYS).run(sender=alice, valid=False)
+
+    scenario.p("remove_utxos goes through")
+    scenario += tzbtc_ledger.remove_utxos(BULK_UTXO_KEYS).run(sender=ledger_admin)
+    scenario.verify(
+        ~tzbtc_ledger.data.utxo_map.contains(
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xacac01"), sp.nat(0)))
+        )
+    )
+    scenario.verify(
+        ~tzbtc_ledger.data.utxo_map.contains(
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xacac01"), sp.nat(1)))
+        )
+    )
+
     ######################################################################################
     #                             verify_address checks                                  #
     ######################################################################################
@@ -544,6 +966,36 @@ def test():
     )
     scenario.verify(~tzbtc_ledger.data.whitelisted_addresses.contains(alice.address))
 
+    scenario.p("verify_addresses fails if sender is not gatekeeper")
+    scenario += tzbtc_ledger.verify_addresses(
+        sp.list([sp.record(address=alice.address, verified=True)])
+    ).run(sender=alice, valid=False)
+
+    scenario.p("verify_addresses applies all the entries in order")
+    scenario += tzbtc_ledger.verify_addresses(
+        sp.list(
+            [
+                sp.record(address=alice.address, verified=True),
+                sp.record(address=bob.address, verified=True),
+                sp.record(address=charlie.address, verified=True),
+                sp.record(address=charlie.address, verified=False),
+            ]
+        )
+    ).run(sender=gatekeeper)
+    scenario.verify(tzbtc_ledger.data.whitelisted_addresses.contains(alice.address))
+    scenario.verify(tzbtc_ledger.data.whitelisted_addresses.contains(bob.address))
+    scenario.verify(~tzbtc_ledger.data.whitelisted_addresses.contains(charlie.address))
+    scenario += tzbtc_ledger.verify_addresses(
+        sp.list(
+            [
+                sp.record(address=alice.address, verified=False),
+                sp.record(address=bob.address, verified=False),
+            ]
+        )
+    ).run(sender=gatekeeper)
+    scenario.verify(~tzbtc_ledger.data.whitelisted_addresses.contains(alice.address))
+    scenario.verify(~tzbtc_ledger.data.whitelisted_addresses.contains(bob.address))
+
     ######################################################################################
     #                             propose_burn checks                                    #
     ######################################################################################
@@ -635,11 +1087,11 @@ def test():
     ).run(sender=alice)
     BURN_UTXOS = sp.map(
         {
-            UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
-                sp.nat(1000), sp.map({})
+            UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
+                sp.nat(1000)
             ),
-            UTXO.make_key(sp.bytes("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
-                sp.nat(1000), sp.map({})
+            UTXO.make_key(make_txid("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
+                sp.nat(1000)
             ),
         }
     )
@@ -658,14 +1110,14 @@ def test():
     scenario += tzbtc_ledger.confirm_burn(
         utxos=sp.map(
             {
-                UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
-                UTXO.make_key(sp.bytes("0xeeeeee"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xeeeeee"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
-                UTXO.make_key(sp.bytes("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
             }
         ),
@@ -678,7 +1130,7 @@ def test():
     )
     # set up
     scenario += tzbtc_ledger.set_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
         receiver=sp.some(alice.address),
         amount=sp.nat(1000),
@@ -687,14 +1139,14 @@ def test():
     scenario += tzbtc_ledger.confirm_burn(
         utxos=sp.map(
             {
-                UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
-                UTXO.make_key(sp.bytes("0xeeeeee"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xeeeeee"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
-                UTXO.make_key(sp.bytes("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
             }
         ),
@@ -703,7 +1155,7 @@ def test():
     ).run(sender=gatekeeper, valid=False)
     # clean up
     scenario += tzbtc_ledger.remove_utxo(
-        txid=sp.bytes("0xeeeeee"),
+        txid=make_txid("0xeeeeee"),
         output_no=sp.nat(0),
     ).run(sender=ledger_admin)
 
@@ -711,8 +1163,8 @@ def test():
     scenario += tzbtc_ledger.confirm_burn(
         utxos=sp.map(
             {
-                UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
-                    sp.nat(1000), sp.map({})
+                UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
                 ),
             }
         ),
@@ -739,8 +1191,13 @@ def test():
         token_contract.data.ledger[tzbtc_ledger.address].balance, sp.nat(0)
     )
     scenario.verify_equal(
-        token_contract.data.ledger[treasury.address].balance,
-        sp.nat(200),  # 100 from mint + 100 from the burn
+        token_contract.data.ledger[redeem_address.address].balance, sp.nat(0)
+    )
+    # The accrued fees are what the treasury was paid before by one transfer per mint
+    # and per burn.
+    scenario.verify_equal(
+        tzbtc_ledger.data.accrued_fees,
+        sp.nat(400),  # 300 from mints + 100 from the burn
     )
 
     scenario.p(
@@ -755,6 +1212,27 @@ def test():
     scenario += tzbtc_ledger.cancel_burn(sp.nat(2)).run(sender=gatekeeper, valid=False)
     scenario += tzbtc_ledger.cancel_burn(sp.nat(2)).run(sender=alice, valid=False)
 
+    ######################################################################################
+    #                               claim_fees checks                                    #
+    ######################################################################################
+    scenario.h2("Claim fees")
+    scenario.p("claim_fees fails if the sender is not the treasury or an admin")
+    scenario += tzbtc_ledger.claim_fees().run(sender=alice, valid=False)
+    scenario += tzbtc_ledger.claim_fees().run(sender=gatekeeper, valid=False)
+
+    scenario.p("claim_fees mints all the accrued fees for the treasury")
+    scenario += tzbtc_ledger.claim_fees().run(sender=treasury)
+    scenario.verify_equal(
+        token_contract.data.ledger[treasury.address].balance, sp.nat(400)
+    )
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, sp.nat(0))
+
+    scenario.p("claim_fees can be called by an admin and does nothing without fees")
+    scenario += tzbtc_ledger.claim_fees().run(sender=ledger_admin)
+    scenario.verify_equal(
+        token_contract.data.ledger[treasury.address].balance, sp.nat(400)
+    )
+
     ######################################################################################
     #                                sign_burn checks                                    #
     ######################################################################################
@@ -765,12 +1243,12 @@ def test():
         utxos_with_signature=sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x000000"),
                 ),
                 sp.record(
-                    txid=sp.bytes("0xffffff"),
+                    txid=make_txid("0xffffff"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x111000"),
                 ),
@@ -784,12 +1262,12 @@ def test():
         utxos_with_signature=sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x000000"),
                 ),
                 sp.record(
-                    txid=sp.bytes("0xffffff"),
+                    txid=make_txid("0xffffff"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x111000"),
                 ),
@@ -803,12 +1281,12 @@ def test():
         utxos_with_signature=sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x000000"),
                 ),
                 sp.record(
-                    txid=sp.bytes("0xeeeeee"),  # not part of the burns utxos
+                    txid=make_txid("0xeeeeee"),  # not part of the burns utxos
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x111000"),
                 ),
@@ -822,12 +1300,12 @@ def test():
         utxos_with_signature=sp.list(
             [
                 sp.record(
-                    txid=sp.bytes("0xdddddd"),
+                    txid=make_txid("0xdddddd"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x000000"),
                 ),
                 sp.record(
-                    txid=sp.bytes("0xffffff"),
+                    txid=make_txid("0xffffff"),
                     output_no=sp.nat(0),
                     signature=sp.bytes("0x111000"),
                 ),
@@ -842,31 +1320,2158 @@ def test():
             amount=sp.nat(900),
             state=BurnState.CONFIRMED,
             fee=2 * 101,
-            utxos=sp.map(
-                {
-                    UTXO.make_key(sp.bytes("0xdddddd"), sp.nat(0)): UTXO.make_burn_type(
-                        sp.nat(1000), sp.map({signer1.address: sp.bytes("0x000000")})
-                    ),
-                    UTXO.make_key(sp.bytes("0xffffff"), sp.nat(0)): UTXO.make_burn_type(
-                        sp.nat(1000), sp.map({signer1.address: sp.bytes("0x111000")})
-                    ),
-                }
-            ),
+            utxos=BURN_UTXOS,
         ),
     )
-
-    ######################################################################################
-    #                              remove_burn checks                                    #
-    ######################################################################################
-    scenario.h2("Remove Burn")
-    scenario.p("remove_burn fails if the sender is not an admin of the contract")
-    scenario += tzbtc_ledger.remove_burn(sp.nat(2)).run(sender=alice, valid=False)
-
-    scenario.p("remove_burn fails if the burn id does not exist")
-    scenario += tzbtc_ledger.remove_burn(sp.nat(3)).run(
-        sender=ledger_admin, valid=False
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signed_utxos[
+            Burn.make_signer_key(sp.nat(2), signer1.address)
+        ],
+        sp.nat(3),
     )
-
-    scenario.p("remove_burn goes through")
-    scenario += tzbtc_ledger.remove_burn(sp.nat(2)).run(sender=ledger_admin)
-    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(2)) == False)
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signers[sp.nat(2)],
+        Burn.make_signers(sp.set([signer1.address]), sp.nat(1)),
+    )
+    SIGNATURE_KEY_DDDDDD = BurnSignature.make_key(
+        sp.nat(2), UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)), signer1.address
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signatures[SIGNATURE_KEY_DDDDDD], sp.bytes("0x000000")
+    )
+
+    scenario.p("sign_burn overrides a signature without counting it twice")
+    scenario += tzbtc_ledger.sign_burn(
+        burn_id=sp.nat(2),
+        utxos_with_signature=sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xdddddd"),
+                    output_no=sp.nat(0),
+                    signature=sp.bytes("0x000001"),
+                ),
+            ]
+        ),
+    ).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(2)),
+        sp.map({signer1.address: sp.nat(2)}),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signatures[SIGNATURE_KEY_DDDDDD], sp.bytes("0x000001")
+    )
+
+    scenario.p("sign_burn stores the signatures of every signer separately")
+    scenario += tzbtc_ledger.sign_burn(
+        burn_id=sp.nat(2),
+        utxos_with_signature=sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xffffff"),
+                    output_no=sp.nat(0),
+                    signature=sp.bytes("0x222000"),
+                ),
+            ]
+        ),
+    ).run(sender=signer2)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(2)),
+        sp.map({signer1.address: sp.nat(2), signer2.address: sp.nat(1)}),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signatures(sp.nat(2)),
+        sp.map(
+            {
+                UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)): sp.map(
+                    {signer1.address: sp.bytes("0x000001")}
+                ),
+                UTXO.make_key(make_txid("0xffffff"), sp.nat(0)): sp.map(
+                    {
+                        signer1.address: sp.bytes("0x111000"),
+                        signer2.address: sp.bytes("0x222000"),
+                    }
+                ),
+            }
+        ),
+    )
+
+    ######################################################################################
+    #                            relay_approvals checks                                  #
+    ######################################################################################
+    scenario.h2("Relayed approvals")
+    CHAIN_ID = sp.chain_id_cst("0x9caecab9")
+    OTHER_CHAIN_ID = sp.chain_id_cst("0x7a06a770")
+
+    def make_relayed_approval(signer, action, nonce, chain_id=CHAIN_ID):
+        action = sp.set_type_expr(action, RelayedApproval.get_action_type())
+        payload = RelayedApproval.make_payload(
+            chain_id, tzbtc_ledger.address, nonce, action
+        )
+        signature = sp.make_signature(
+            signer.secret_key, sp.pack(payload), message_format="Raw"
+        )
+        return RelayedApproval.make(signer.public_key, signature, action)
+
+    RELAYED_UTXO_KEY = UTXO.make_key(make_txid("0xabab01"), sp.nat(0))
+    relayed_confirmation = sp.variant(
+        "confirm_utxos",
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xabab01"),
+                    skip_confirmed=False,
+                )
+            ]
+        ),
+    )
+
+    scenario.p("relay_approvals fails if the key is not a trusted signer")
+    scenario += tzbtc_ledger.relay_approvals(
+        sp.list([make_relayed_approval(alice, relayed_confirmation, sp.nat(0))])
+    ).run(sender=alice, chain_id=CHAIN_ID, valid=False)
+
+    scenario.p("relay_approvals fails if the approval was signed for another nonce")
+    scenario += tzbtc_ledger.relay_approvals(
+        sp.list([make_relayed_approval(signer1, relayed_confirmation, sp.nat(1))])
+    ).run(sender=alice, chain_id=CHAIN_ID, valid=False)
+
+    scenario.p("relay_approvals fails if the approval was signed for another chain")
+    scenario += tzbtc_ledger.relay_approvals(
+        sp.list(
+            [
+                make_relayed_approval(
+                    signer1, relayed_confirmation, sp.nat(0), chain_id=OTHER_CHAIN_ID
+                )
+            ]
+        )
+    ).run(sender=alice, chain_id=CHAIN_ID, valid=False)
+
+    relayed_confirmations = sp.list(
+        [
+            make_relayed_approval(signer1, relayed_confirmation, sp.nat(0)),
+            make_relayed_approval(signer2, relayed_confirmation, sp.nat(0)),
+        ]
+    )
+
+    scenario.p("relay_approvals fails without approvals")
+    scenario += tzbtc_ledger.relay_approvals(sp.list([])).run(
+        sender=bob, chain_id=CHAIN_ID, valid=False
+    )
+
+    scenario.p("relay_approvals of another signer do not consume the pending nonces")
+    other_confirmation = sp.variant(
+        "confirm_utxos",
+        sp.list(
+            [
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=charlie.address,
+                    txid=make_txid("0xabab09"),
+                    skip_confirmed=False,
+                )
+            ]
+        ),
+    )
+    scenario += tzbtc_ledger.relay_approvals(
+        sp.list([make_relayed_approval(signer3, other_confirmation, sp.nat(0))])
+    ).run(sender=bob, chain_id=CHAIN_ID)
+    scenario.verify_equal(tzbtc_ledger.data.relay_nonces[signer3.address], sp.nat(1))
+    scenario.verify(~tzbtc_ledger.data.relay_nonces.contains(signer1.address))
+
+    scenario.p("relay_approvals lands the confirmations of a quorum in one operation")
+    scenario += tzbtc_ledger.relay_approvals(relayed_confirmations).run(
+        sender=alice, chain_id=CHAIN_ID
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[UTXO.make_packed_key(RELAYED_UTXO_KEY)],
+        UTXO.make_value(UTXO_STATE.INIT, sp.some(charlie.address), sp.nat(1000)),
+    )
+    scenario.verify(~tzbtc_ledger.data.candidate_utxo_map.contains(RELAYED_UTXO_KEY))
+    scenario.verify_equal(tzbtc_ledger.data.relay_nonces[signer1.address], sp.nat(1))
+    scenario.verify_equal(tzbtc_ledger.data.relay_nonces[signer2.address], sp.nat(1))
+    scenario.verify_equal(tzbtc_ledger.get_relay_nonce(signer1.address), sp.nat(1))
+
+    scenario.p("relay_approvals cannot replay approvals")
+    scenario += tzbtc_ledger.relay_approvals(relayed_confirmations).run(
+        sender=alice, chain_id=CHAIN_ID, valid=False
+    )
+
+    scenario.p("relay_approvals signs a burn on behalf of a signer")
+    scenario += tzbtc_ledger.relay_approvals(
+        sp.list(
+            [
+                make_relayed_approval(
+                    signer3,
+                    sp.variant(
+                        "sign_burn",
+                        sp.record(
+                            burn_id=sp.nat(2),
+                            utxos_with_signature=sp.list(
+                                [
+                                    sp.record(
+                                        txid=make_txid("0xdddddd"),
+                                        output_no=sp.nat(0),
+                                        signature=sp.bytes("0x333000"),
+                                    )
+                                ]
+                            ),
+                        ),
+                    ),
+                    sp.nat(1),
+                )
+            ]
+        )
+    ).run(sender=bob, chain_id=CHAIN_ID)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(2)),
+        sp.map(
+            {
+                signer1.address: sp.nat(2),
+                signer2.address: sp.nat(1),
+                signer3.address: sp.nat(1),
+            }
+        ),
+    )
+    RELAYED_SIGNATURE_KEY = BurnSignature.make_key(
+        sp.nat(2), UTXO.make_key(make_txid("0xdddddd"), sp.nat(0)), signer3.address
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signatures[RELAYED_SIGNATURE_KEY], sp.bytes("0x333000")
+    )
+    scenario.verify_equal(tzbtc_ledger.data.relay_nonces[signer3.address], sp.nat(2))
+
+    ######################################################################################
+    #                                  views checks                                      #
+    ######################################################################################
+    scenario.h2("Batch views")
+    MISSING_UTXO_KEY = UTXO.make_key(make_txid("0x000000"), sp.nat(7))
+    scenario.p("get_utxos returns the UTXOs that are in the UTXO map")
+    scenario.verify_equal(
+        tzbtc_ledger.get_utxos(sp.list([RELAYED_UTXO_KEY, MISSING_UTXO_KEY])),
+        sp.map(
+            {
+                RELAYED_UTXO_KEY: UTXO.make_value(
+                    UTXO_STATE.INIT, sp.some(charlie.address), sp.nat(1000)
+                )
+            }
+        ),
+    )
+
+    scenario.p("get_candidates returns the candidates that are in the candidate map")
+    CANDIDATE_VIEW_KEY = UTXO.make_key(make_txid("0xabab02"), sp.nat(0))
+    scenario += tzbtc_ledger.confirm_utxo(
+        amount=sp.nat(1000),
+        output_no=sp.nat(0),
+        receiver=dan.address,
+        txid=make_txid("0xabab02"),
+    ).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.get_candidates(sp.list([CANDIDATE_VIEW_KEY, MISSING_UTXO_KEY])),
+        sp.map(
+            {
+                CANDIDATE_VIEW_KEY: UTXO.make_utxo_candidate_value_type(
+                    approvers=SIGNER1_BIT,
+                    candidates=sp.map(
+                        {
+                            UTXO.make_candidate_hash(
+                                sp.some(dan.address), sp.nat(1000)
+                            ): UTXO.make_candidate_votes(SIGNER1_BIT, sp.nat(1))
+                        }
+                    ),
+                )
+            }
+        ),
+    )
+
+    scenario.p("get_burns returns the burns that are in the burns map")
+    scenario.verify_equal(
+        tzbtc_ledger.get_burns(sp.list([sp.nat(2), sp.nat(99)])),
+        sp.map({sp.nat(2): tzbtc_ledger.data.burns_map[sp.nat(2)]}),
+    )
+
+    scenario.p("get_burn_status summarizes the burns that are in the burns map")
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_status(sp.list([sp.nat(2), sp.nat(99)])),
+        sp.map(
+            {
+                sp.nat(2): Burn.make_status(
+                    state=BurnState.CONFIRMED,
+                    amount=sp.nat(900),
+                    fee=sp.nat(2 * 101),
+                    utxo_count=sp.nat(2),
+                    complete_signers=sp.nat(1),  # only signer1 signed both UTXOs
+                )
+            }
+        ),
+    )
+
+    ######################################################################################
+    #                              remove_burn checks                                    #
+    ######################################################################################
+    scenario.h2("Remove Burn")
+    scenario.p("remove_burn fails if the sender is not an admin of the contract")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(2)).run(sender=alice, valid=False)
+
+    scenario.p("remove_burn fails if the burn id does not exist")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(3)).run(
+        sender=ledger_admin, valid=False
+    )
+
+    scenario.p("remove_burn goes through")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(2)).run(sender=ledger_admin)
+    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(2)) == False)
+    scenario.verify(~tzbtc_ledger.data.burn_signatures.contains(SIGNATURE_KEY_DDDDDD))
+    scenario.verify(~tzbtc_ledger.data.burn_signatures.contains(RELAYED_SIGNATURE_KEY))
+    scenario.verify(~tzbtc_ledger.data.burn_signers.contains(sp.nat(2)))
+    for signer in [signer1, signer2, signer3]:
+        scenario.verify(
+            ~tzbtc_ledger.data.burn_signed_utxos.contains(
+                Burn.make_signer_key(sp.nat(2), signer.address)
+            )
+        )
+
+
+@sp.add_test(name="TzBTC Ledger Batch Mint")
+def test_batch_mint():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Batch Mint")
+    scenario.p(
+        "Mints the same number of UTXOs with mint and with mint_utxos and checks that "
+        "both end up with the same balances and accrued fees. The gas consumed by both "
+        "flows is measured on a node with benchmarks/gas.py (make benchmark-ghostnet)."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    treasury = sp.test_account("Treasury")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    SERVICE_FEE = 100
+    UTXO_AMOUNT = 1000
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=SERVICE_FEE,
+        redeem_address=redeem_address.address,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+
+    def set_init_utxos(txid_prefix, n):
+        utxo_keys = []
+        for i in range(n):
+            txid = make_txid("0x%02x%04x" % (txid_prefix, i))
+            scenario += tzbtc_ledger.set_utxo(
+                txid=txid,
+                output_no=sp.nat(0),
+                receiver=sp.some([alice.address, bob.address][i % 2]),
+                amount=sp.nat(UTXO_AMOUNT),
+                utxo_state=UTXO_STATE.INIT,
+            ).run(sender=ledger_admin)
+            utxo_keys.append(txid)
+        return utxo_keys
+
+    accounts = {"alice": alice, "bob": bob}
+    minted_utxos = {"alice": 0, "bob": 0}
+    for txid_prefix, n in enumerate([1, 10, 50]):
+        scenario.h2("Minting %d UTXOs" % n)
+        alice_utxos, bob_utxos = (n + 1) // 2, n // 2
+
+        scenario.h3("Single mints")
+        for txid in set_init_utxos(2 * txid_prefix, n):
+            scenario += tzbtc_ledger.mint(txid=txid, output_no=sp.nat(0)).run(
+                sender=gatekeeper
+            )
+        minted_utxos["alice"] += alice_utxos
+        minted_utxos["bob"] += bob_utxos
+        for name, account in accounts.items():
+            scenario.verify_equal(
+                token_contract.data.ledger[account.address].balance,
+                sp.nat(minted_utxos[name] * (UTXO_AMOUNT - SERVICE_FEE)),
+            )
+
+        scenario.h3("Batch mint")
+        scenario += tzbtc_ledger.mint_utxos(
+            sp.list(
+                [
+                    sp.record(txid=txid, output_no=sp.nat(0))
+                    for txid in set_init_utxos(2 * txid_prefix + 1, n)
+                ]
+            )
+        ).run(sender=gatekeeper)
+        minted_utxos["alice"] += alice_utxos
+        minted_utxos["bob"] += bob_utxos
+        for name, account in accounts.items():
+            scenario.verify_equal(
+                token_contract.data.ledger[account.address].balance,
+                sp.nat(minted_utxos[name] * (UTXO_AMOUNT - SERVICE_FEE)),
+            )
+        scenario.verify_equal(
+            tzbtc_ledger.data.accrued_fees,
+            sp.nat(sum(minted_utxos.values()) * SERVICE_FEE),
+        )
+
+    scenario.h2("Claiming the accrued fees")
+    scenario += tzbtc_ledger.claim_fees().run(sender=treasury)
+    scenario.verify_equal(
+        token_contract.data.ledger[treasury.address].balance,
+        sp.nat(sum(minted_utxos.values()) * SERVICE_FEE),
+    )
+
+    scenario.h2("Reserves")
+    scenario.p("The minted UTXOs back the whole supply once the fees are claimed")
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(sum(minted_utxos.values()) * UTXO_AMOUNT),
+            proposed_burn_amount=sp.nat(0),
+            utxo_count=sp.nat(sum(minted_utxos.values())),
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves().minted_amount, token_contract.data.total_supply
+    )
+
+
+@sp.add_test(name="TzBTC Ledger Fast Mint")
+def test_fast_mint():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Fast Mint")
+    scenario.p(
+        "With fast_mint set, the confirmation that brings a deposit UTXO to the "
+        "threshold also mints it if the receiver is whitelisted, other deposits keep "
+        "the two-stage flow and wait for a gatekeeper to call mint."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    signer1 = sp.test_account("Signer1")
+    signer2 = sp.test_account("Signer2")
+    treasury = sp.test_account("Treasury")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+                signer2.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(2),
+        active_signers=sp.nat(3),
+        threshold=sp.nat(2),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=sp.nat(100),
+        redeem_address=redeem_address.address,
+        fast_mint=True,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+    scenario += tzbtc_ledger.verify_address(address=alice.address, verified=True).run(
+        sender=gatekeeper
+    )
+
+    def confirm_utxo(txid, receiver):
+        for signer in [signer1, signer2]:
+            scenario += tzbtc_ledger.confirm_utxo(
+                sp.record(
+                    amount=sp.nat(1000),
+                    output_no=sp.nat(0),
+                    receiver=receiver.address,
+                    txid=txid,
+                )
+            ).run(sender=signer)
+        return UTXO.make_packed_key(UTXO.make_key(txid, sp.nat(0)))
+
+    scenario.h2("One-stage flow")
+    scenario.p("The last confirmation mints the UTXO of a whitelisted receiver")
+    packed_key = confirm_utxo(make_txid("0xa1"), alice)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[packed_key],
+        UTXO.make_used_for_mint_value(sp.nat(1000)),
+    )
+    scenario.verify_equal(token_contract.data.ledger[alice.address].balance, 900)
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, 100)
+
+    scenario.p("confirm_utxos mints the UTXOs that reach the threshold as well")
+    for signer in [signer1, signer2]:
+        scenario += tzbtc_ledger.confirm_utxos(
+            sp.list(
+                [
+                    sp.record(
+                        amount=sp.nat(1000),
+                        output_no=sp.nat(0),
+                        receiver=alice.address,
+                        txid=make_txid("0xa2"),
+                        skip_confirmed=False,
+                    )
+                ]
+            )
+        ).run(sender=signer)
+    scenario.verify_equal(token_contract.data.ledger[alice.address].balance, 1800)
+
+    scenario.p("The UTXO of a receiver that is not whitelisted waits for mint")
+    packed_key = confirm_utxo(make_txid("0xb1"), bob)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[packed_key],
+        UTXO.make_init_value(sp.some(bob.address), sp.nat(1000)),
+    )
+    scenario.verify(~token_contract.data.ledger.contains(bob.address))
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xb1"), output_no=sp.nat(0)).run(
+        sender=gatekeeper
+    )
+    scenario.verify_equal(token_contract.data.ledger[bob.address].balance, 900)
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(3000),
+            proposed_burn_amount=sp.nat(0),
+            utxo_count=sp.nat(3),
+        ),
+    )
+
+    scenario.h2("Merkle whitelist")
+    scenario.p(
+        "The UTXO of a receiver verified only through the Merkle root waits for mint"
+    )
+    MERKLE_USER = sp.address("tz1Ke2h7sDdakHJQh8WX4Z372du1KD25fCcX")
+    scenario += tzbtc_ledger.set_whitelist_root(
+        sp.some(
+            sp.bytes(
+                "0x"
+                + MerkleWhitelist(["tz1Ke2h7sDdakHJQh8WX4Z372du1KD25fCcX"]).root.hex()
+            )
+        )
+    ).run(sender=gatekeeper)
+    for signer in [signer1, signer2]:
+        scenario += tzbtc_ledger.confirm_utxo(
+            sp.record(
+                amount=sp.nat(1000),
+                output_no=sp.nat(0),
+                receiver=MERKLE_USER,
+                txid=make_txid("0xc1"),
+            )
+        ).run(sender=signer)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xc1"), sp.nat(0)))
+        ],
+        UTXO.make_init_value(sp.some(MERKLE_USER), sp.nat(1000)),
+    )
+    scenario.verify(~token_contract.data.ledger.contains(MERKLE_USER))
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xc1"), output_no=sp.nat(0)).run(
+        sender=gatekeeper
+    )
+    scenario.verify_equal(token_contract.data.ledger[MERKLE_USER].balance, 900)
+
+    scenario.h2("set_fast_mint")
+    scenario.p("set_fast_mint fails if the sender is not an admin")
+    scenario += tzbtc_ledger.set_fast_mint(False).run(sender=gatekeeper, valid=False)
+
+    scenario.p("The two-stage flow is used once fast_mint is unset")
+    scenario += tzbtc_ledger.set_fast_mint(False).run(sender=ledger_admin)
+    packed_key = confirm_utxo(make_txid("0xa3"), alice)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[packed_key],
+        UTXO.make_init_value(sp.some(alice.address), sp.nat(1000)),
+    )
+    scenario.verify_equal(token_contract.data.ledger[alice.address].balance, 1800)
+
+
+@sp.add_test(name="TzBTC Ledger Batch Burns")
+def test_batch_burns():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Batch Burns")
+    scenario.p(
+        "Cancels and confirms several burns with cancel_burns and confirm_burns, which "
+        "run the same checks as cancel_burn and confirm_burn for every burn and merge "
+        "the token transfers of the batch."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    signer1 = sp.test_account("Signer1")
+    treasury = sp.test_account("Treasury")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=sp.nat(100),
+        min_burn_amount=sp.nat(100),
+        redeem_address=redeem_address.address,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+
+    def set_utxo(txid, receiver, utxo_state):
+        scenario += tzbtc_ledger.set_utxo(
+            txid=txid,
+            output_no=sp.nat(0),
+            receiver=receiver,
+            amount=sp.nat(1000),
+            utxo_state=utxo_state,
+        ).run(sender=ledger_admin)
+
+    # scriptPubKey of bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4 (see utils/btc_address.py)
+    PROPOSER_BTC_SCRIPT = sp.bytes("0x160014751e76e8199196d454941c45d1b3a323f1433bd6")
+
+    def propose_burn(proposer):
+        scenario += tzbtc_ledger.propose_burn(
+            amount=sp.nat(300), receiver=PROPOSER_BTC_SCRIPT, optional_callback=sp.none
+        ).run(sender=proposer)
+
+    for txid, account in [("0xa1", alice), ("0xb1", bob)]:
+        set_utxo(make_txid(txid), sp.some(account.address), UTXO_STATE.INIT)
+        scenario += tzbtc_ledger.mint(txid=make_txid(txid), output_no=sp.nat(0)).run(
+            sender=gatekeeper
+        )
+        scenario += tzbtc_ledger.verify_address(
+            address=account.address, verified=True
+        ).run(sender=gatekeeper)
+        scenario += token_contract.approve(
+            sp.record(spender=tzbtc_ledger.address, value=sp.nat(900))
+        ).run(sender=account)
+
+    scenario.h2("cancel_burns")
+    propose_burn(alice)  # burn 0
+    propose_burn(alice)  # burn 1
+    propose_burn(bob)  # burn 2
+    scenario.verify_equal(token_contract.data.ledger[alice.address].balance, 300)
+    scenario.verify_equal(token_contract.data.ledger[bob.address].balance, 600)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([sp.nat(0), sp.nat(1), sp.nat(2)]),
+            confirmed=sp.set([]),
+        ),
+    )
+    scenario.p("get_open_burns lists the open burns page by page")
+    scenario.verify_equal(
+        tzbtc_ledger.get_open_burns(
+            sp.record(from_burn_id=sp.nat(1), to_burn_id=sp.nat(2))
+        ),
+        sp.record(proposed=sp.set([sp.nat(1)]), confirmed=sp.set([])),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_open_burns(
+            sp.record(from_burn_id=sp.nat(2), to_burn_id=sp.nat(10))
+        ),
+        sp.record(proposed=sp.set([sp.nat(2)]), confirmed=sp.set([])),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(2000),
+            proposed_burn_amount=sp.nat(900),
+            utxo_count=sp.nat(2),
+        ),
+    )
+
+    scenario.p("cancel_burns fails if the sender did not propose all the burns")
+    scenario += tzbtc_ledger.cancel_burns(
+        sp.list([sp.nat(0), sp.nat(1), sp.nat(2)])
+    ).run(sender=alice, valid=False)
+
+    scenario.p("cancel_burns fails if any burn id does not exist")
+    scenario += tzbtc_ledger.cancel_burns(sp.list([sp.nat(0), sp.nat(3)])).run(
+        sender=gatekeeper, valid=False
+    )
+
+    scenario.p("cancel_burns refunds every proposer")
+    scenario += tzbtc_ledger.cancel_burns(
+        sp.list([sp.nat(0), sp.nat(1), sp.nat(2)])
+    ).run(sender=gatekeeper)
+    for burn_id in range(3):
+        scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(burn_id)))
+    scenario.verify_equal(token_contract.data.ledger[alice.address].balance, 900)
+    scenario.verify_equal(token_contract.data.ledger[bob.address].balance, 900)
+    scenario.verify_equal(token_contract.data.ledger[tzbtc_ledger.address].balance, 0)
+    scenario.verify_equal(tzbtc_ledger.data.reserves.proposed_burn_amount, 0)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([]),
+            confirmed=sp.set([]),
+        ),
+    )
+
+    scenario.h2("confirm_burns")
+    propose_burn(alice)  # burn 3
+    propose_burn(bob)  # burn 4
+    set_utxo(make_txid("0xa2"), sp.none, UTXO_STATE.USED_FOR_MINT)
+    set_utxo(make_txid("0xb2"), sp.none, UTXO_STATE.USED_FOR_MINT)
+    UTXOS_A2 = sp.map(
+        {UTXO.make_key(make_txid("0xa2"), sp.nat(0)): UTXO.make_burn_type(sp.nat(1000))}
+    )
+    UTXOS_B2 = sp.map(
+        {UTXO.make_key(make_txid("0xb2"), sp.nat(0)): UTXO.make_burn_type(sp.nat(1000))}
+    )
+
+    scenario.p("confirm_burns fails if the sender is not a gatekeeper")
+    scenario += tzbtc_ledger.confirm_burns(
+        sp.list([sp.record(burn_id=sp.nat(3), utxos=UTXOS_A2, fee=sp.nat(10))])
+    ).run(sender=alice, valid=False)
+
+    scenario.p("confirm_burns fails if two burns use the same UTXO")
+    scenario += tzbtc_ledger.confirm_burns(
+        sp.list(
+            [
+                sp.record(burn_id=sp.nat(3), utxos=UTXOS_A2, fee=sp.nat(10)),
+                sp.record(burn_id=sp.nat(4), utxos=UTXOS_A2, fee=sp.nat(10)),
+            ]
+        )
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("confirm_burns fails if any burn id does not exist")
+    scenario += tzbtc_ledger.confirm_burns(
+        sp.list(
+            [
+                sp.record(burn_id=sp.nat(3), utxos=UTXOS_A2, fee=sp.nat(10)),
+                sp.record(burn_id=sp.nat(0), utxos=UTXOS_B2, fee=sp.nat(10)),
+            ]
+        )
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("confirm_burns confirms all the burns and burns their total amount")
+    scenario += tzbtc_ledger.confirm_burns(
+        sp.list(
+            [
+                sp.record(burn_id=sp.nat(3), utxos=UTXOS_A2, fee=sp.nat(10)),
+                sp.record(burn_id=sp.nat(4), utxos=UTXOS_B2, fee=sp.nat(10)),
+            ]
+        )
+    ).run(sender=gatekeeper)
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(3)],
+        Burn.make(
+            proposer=alice.address,
+            receiver=PROPOSER_BTC_SCRIPT,
+            amount=sp.nat(300),
+            state=BurnState.CONFIRMED,
+            fee=10,
+            utxos=UTXOS_A2,
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(4)].state, BurnState.CONFIRMED
+    )
+    scenario.verify(
+        ~tzbtc_ledger.data.utxo_map.contains(
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xb2"), sp.nat(0)))
+        )
+    )
+    scenario.verify_equal(token_contract.data.ledger[tzbtc_ledger.address].balance, 0)
+    scenario.verify_equal(token_contract.data.ledger[redeem_address.address].balance, 0)
+    scenario.verify_equal(token_contract.data.total_supply, 2 * 900 - 2 * 300)
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, 2 * 100 + 2 * 100)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([]),
+            confirmed=sp.set([sp.nat(3), sp.nat(4)]),
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(2000),
+            proposed_burn_amount=sp.nat(0),
+            utxo_count=sp.nat(2),
+        ),
+    )
+
+    scenario.p("confirm_burns fails if the burns are already confirmed")
+    scenario += tzbtc_ledger.confirm_burns(
+        sp.list([sp.record(burn_id=sp.nat(3), utxos=UTXOS_A2, fee=sp.nat(10))])
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.h2("Burn signatures as events")
+    scenario.p("set_emit_burn_signatures fails if the sender is not an admin")
+    scenario += tzbtc_ledger.set_emit_burn_signatures(True).run(
+        sender=gatekeeper, valid=False
+    )
+    scenario += tzbtc_ledger.set_emit_burn_signatures(True).run(sender=ledger_admin)
+    scenario.verify(tzbtc_ledger.data.emit_burn_signatures)
+
+    def sign_burn_4(signature):
+        return tzbtc_ledger.sign_burn(
+            burn_id=sp.nat(4),
+            utxos_with_signature=sp.list(
+                [
+                    sp.record(
+                        txid=make_txid("0xb2"), output_no=sp.nat(0), signature=signature
+                    )
+                ]
+            ),
+        )
+
+    scenario.p("sign_burn still fails if the UTXO is not part of the burn")
+    scenario += tzbtc_ledger.sign_burn(
+        burn_id=sp.nat(3),
+        utxos_with_signature=sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xb2"),
+                    output_no=sp.nat(0),
+                    signature=sp.bytes("0x111000"),
+                )
+            ]
+        ),
+    ).run(sender=signer1, valid=False)
+
+    scenario.p("sign_burn emits the signature and only counts it on chain")
+    scenario += sign_burn_4(sp.bytes("0x111000")).run(sender=signer1)
+    scenario += sign_burn_4(sp.bytes("0x111001")).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(4)),
+        sp.map({signer1.address: sp.nat(1)}),
+    )
+    scenario.verify(
+        ~tzbtc_ledger.data.burn_signatures.contains(
+            BurnSignature.make_key(
+                sp.nat(4),
+                UTXO.make_key(make_txid("0xb2"), sp.nat(0)),
+                signer1.address,
+            )
+        )
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signatures(sp.nat(4)),
+        sp.map(
+            {
+                UTXO.make_key(make_txid("0xb2"), sp.nat(0)): sp.map(
+                    l={}, tkey=sp.TAddress, tvalue=sp.TBytes
+                )
+            }
+        ),
+    )
+
+    scenario.p("sign_burn stores the signatures again once the option is unset")
+    scenario += tzbtc_ledger.set_emit_burn_signatures(False).run(sender=ledger_admin)
+    scenario += sign_burn_4(sp.bytes("0x111002")).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(4)),
+        sp.map({signer1.address: sp.nat(1)}),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signatures(sp.nat(4)),
+        sp.map(
+            {
+                UTXO.make_key(make_txid("0xb2"), sp.nat(0)): sp.map(
+                    {signer1.address: sp.bytes("0x111002")}
+                )
+            }
+        ),
+    )
+
+    scenario.h2("remove_burns")
+    scenario.p("remove_burns fails if the sender is not an admin")
+    scenario += tzbtc_ledger.remove_burns(
+        from_burn_id=sp.nat(0), to_burn_id=sp.nat(10)
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("remove_burns removes the burns of the range and skips missing ids")
+    scenario += token_contract.approve(
+        sp.record(spender=tzbtc_ledger.address, value=sp.nat(300))
+    ).run(sender=alice)
+    propose_burn(alice)  # burn 5
+    scenario += tzbtc_ledger.remove_burns(
+        from_burn_id=sp.nat(0), to_burn_id=sp.nat(5)
+    ).run(sender=ledger_admin)
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(3)))
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(4)))
+    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(5)))
+    scenario.verify_equal(tzbtc_ledger.data.reserves.proposed_burn_amount, 300)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([sp.nat(5)]),
+            confirmed=sp.set([]),
+        ),
+    )
+
+    scenario.h2("Reserves")
+    scenario.p("set_utxo replaces the amount of an overwritten UTXO in the reserves")
+    scenario += tzbtc_ledger.set_utxo(
+        txid=make_txid("0xa1"),
+        output_no=sp.nat(0),
+        receiver=sp.some(alice.address),
+        amount=sp.nat(500),
+        utxo_state=UTXO_STATE.INIT,
+    ).run(sender=ledger_admin)
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(500),
+            minted_amount=sp.nat(1000),
+            proposed_burn_amount=sp.nat(300),
+            utxo_count=sp.nat(2),
+        ),
+    )
+
+    scenario.p("remove_utxo removes the UTXO from the reserves")
+    scenario += tzbtc_ledger.remove_utxo(
+        txid=make_txid("0xa1"), output_no=sp.nat(0)
+    ).run(sender=ledger_admin)
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(1000),
+            proposed_burn_amount=sp.nat(300),
+            utxo_count=sp.nat(1),
+        ),
+    )
+
+    scenario.p("remove_utxo leaves the reserves unchanged for a missing UTXO")
+    scenario += tzbtc_ledger.remove_utxo(
+        txid=make_txid("0xa1"), output_no=sp.nat(0)
+    ).run(sender=ledger_admin)
+    scenario.verify_equal(tzbtc_ledger.data.reserves.utxo_count, 1)
+
+    scenario.h2("Open burns")
+    scenario.p("remove_burn removes a proposed burn from the open burns")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(5)).run(sender=ledger_admin)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([]),
+            confirmed=sp.set([]),
+        ),
+    )
+    scenario.verify_equal(tzbtc_ledger.data.reserves.proposed_burn_amount, 0)
+
+    scenario.h2("confirm_burn_batch")
+    scenario += token_contract.approve(
+        sp.record(spender=tzbtc_ledger.address, value=sp.nat(300))
+    ).run(sender=alice)
+    propose_burn(alice)  # burn 6
+    propose_burn(bob)  # burn 7
+    set_utxo(make_txid("0xc1"), sp.none, UTXO_STATE.USED_FOR_MINT)
+    UTXO_KEY_C1 = UTXO.make_key(make_txid("0xc1"), sp.nat(0))
+    UTXOS_C1 = sp.map({UTXO_KEY_C1: UTXO.make_burn_type(sp.nat(1000))})
+
+    scenario.p("confirm_burn_batch fails if the sender is not a gatekeeper")
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([sp.nat(6), sp.nat(7)]), utxos=UTXOS_C1, fee=sp.nat(10)
+    ).run(sender=alice, valid=False)
+
+    scenario.p("confirm_burn_batch fails if the list of burns is empty")
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([]), utxos=UTXOS_C1, fee=sp.nat(10)
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("confirm_burn_batch fails if a burn is listed twice")
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([sp.nat(6), sp.nat(6)]), utxos=UTXOS_C1, fee=sp.nat(10)
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p(
+        "confirm_burn_batch fails if the UTXOs do not cover all the burns, the amounts "
+        "are read from the UTXO map and not from the parameter"
+    )
+    scenario += tzbtc_ledger.set_utxo(
+        txid=make_txid("0xc2"),
+        output_no=sp.nat(0),
+        receiver=sp.none,
+        amount=sp.nat(500),
+        utxo_state=UTXO_STATE.USED_FOR_MINT,
+    ).run(sender=ledger_admin)
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([sp.nat(6), sp.nat(7)]),
+        utxos=sp.map(
+            {
+                UTXO.make_key(make_txid("0xc2"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
+                )
+            }
+        ),
+        fee=sp.nat(10),
+    ).run(sender=gatekeeper, valid=False)
+    scenario += tzbtc_ledger.remove_utxo(
+        txid=make_txid("0xc2"), output_no=sp.nat(0)
+    ).run(sender=ledger_admin)
+
+    scenario.p(
+        "confirm_burn_batch fails if the UTXOs cover the amounts of the burns but not "
+        "the fees"
+    )
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([sp.nat(6), sp.nat(7)]), utxos=UTXOS_C1, fee=sp.nat(401)
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("confirm_burn_batch attaches the UTXOs to the batch id")
+    scenario += tzbtc_ledger.confirm_burn_batch(
+        burn_ids=sp.list([sp.nat(6), sp.nat(7)]), utxos=UTXOS_C1, fee=sp.nat(10)
+    ).run(sender=gatekeeper)
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(6)],
+        Burn.make(
+            proposer=alice.address,
+            receiver=PROPOSER_BTC_SCRIPT,
+            amount=sp.nat(300),
+            state=BurnState.CONFIRMED,
+            fee=10,
+            utxos=UTXOS_C1,
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(7)],
+        Burn.make(
+            proposer=bob.address,
+            receiver=PROPOSER_BTC_SCRIPT,
+            amount=sp.nat(300),
+            state=BurnState.CONFIRMED,
+            fee=0,
+            utxos=sp.map({}),
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_batches[sp.nat(6)], sp.set([sp.nat(6), sp.nat(7)])
+    )
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(
+            proposed=sp.set([]),
+            confirmed=sp.set([sp.nat(6)]),
+        ),
+    )
+    scenario.verify_equal(tzbtc_ledger.data.reserves.proposed_burn_amount, 0)
+    scenario.verify_equal(token_contract.data.total_supply, 2 * 900 - 4 * 300)
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, 2 * 100 + 4 * 100)
+
+    scenario.p("sign_burn signs the UTXOs of the batch once under the batch id")
+    scenario += tzbtc_ledger.sign_burn(
+        burn_id=sp.nat(6),
+        utxos_with_signature=sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xc1"),
+                    output_no=sp.nat(0),
+                    signature=sp.bytes("0x111000"),
+                )
+            ]
+        ),
+    ).run(sender=signer1)
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(6)),
+        sp.map({signer1.address: sp.nat(1)}),
+    )
+    scenario += tzbtc_ledger.sign_burn(
+        burn_id=sp.nat(7),
+        utxos_with_signature=sp.list(
+            [
+                sp.record(
+                    txid=make_txid("0xc1"),
+                    output_no=sp.nat(0),
+                    signature=sp.bytes("0x111000"),
+                )
+            ]
+        ),
+    ).run(sender=signer1, valid=False)
+
+    scenario.p("remove_burn removes all the burns of a batch")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(6)).run(sender=ledger_admin)
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(6)))
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(7)))
+    scenario.verify(~tzbtc_ledger.data.burn_batches.contains(sp.nat(6)))
+    scenario.verify(
+        ~tzbtc_ledger.data.burn_signatures.contains(
+            BurnSignature.make_key(sp.nat(6), UTXO_KEY_C1, signer1.address)
+        )
+    )
+
+
+@sp.add_test(name="TzBTC Ledger Lazy Entry Points")
+def test_lazy_entry_points():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Lazy Entry Points")
+    scenario.p(
+        "Runs the mint flow on the build with lazy entrypoints (tzBTCLedgerLazy), where "
+        "the administration entrypoints are loaded from a big_map and the mint and burn "
+        "entrypoints stay in the contract code. The gas consumed by both builds is "
+        "measured on a node with benchmarks/gas.py (make benchmark-ghostnet)."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    treasury = sp.test_account("Treasury")
+    signer = sp.test_account("Signer")
+    alice = sp.test_account("Alice")
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(1),
+        active_signers=sp.nat(1),
+        threshold=sp.nat(1),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=sp.nat(100),
+        redeem_address=redeem_address.address,
+        lazy_entry_points=True,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+
+    scenario.h2("Lazy administration entrypoints")
+    scenario += tzbtc_ledger.update_service_fee(sp.nat(200)).run(
+        sender=alice, valid=False
+    )
+    scenario += tzbtc_ledger.update_service_fee(sp.nat(200)).run(sender=ledger_admin)
+    scenario.verify_equal(tzbtc_ledger.data.service_fee, sp.nat(200))
+
+    scenario.h2("Hot entrypoints")
+    scenario += tzbtc_ledger.confirm_utxo(
+        amount=sp.nat(1000),
+        output_no=sp.nat(0),
+        receiver=alice.address,
+        txid=make_txid("0xaaaaaa"),
+    ).run(sender=signer)
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xaaaaaa"), output_no=sp.nat(0)).run(
+        sender=gatekeeper
+    )
+    scenario.verify_equal(
+        token_contract.data.ledger[alice.address].balance, sp.nat(800)
+    )
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, sp.nat(200))
+
+    scenario.h2("Lazy claim_fees")
+    scenario += tzbtc_ledger.claim_fees().run(sender=treasury)
+    scenario.verify_equal(
+        token_contract.data.ledger[treasury.address].balance, sp.nat(200)
+    )
+    scenario.verify_equal(tzbtc_ledger.data.accrued_fees, sp.nat(0))
+
+
+@sp.add_test(name="TzBTC Ledger Candidate Storage")
+def test_candidate_storage():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Candidate Storage")
+    scenario.p(
+        "Compares the packed size of a candidate_utxo_map entry holding a vote of every "
+        "signer with the former layout (sets of signer addresses keyed by receiver and "
+        "amount) and with the signer index bitmasks. The packed size is what every "
+        "confirm_utxo/confirm_change_utxo call deserializes, serializes and pays "
+        "storage for."
+    )
+    scenario.table_of_contents()
+
+    receiver = sp.some(sp.test_account("Alice").address)
+    amount = sp.nat(1000)
+    address_sets_candidate_type = sp.TRecord(
+        approvers=sp.TSet(sp.TAddress),
+        candidates=sp.TMap(UTXO.get_candidate_key_type(), sp.TSet(sp.TAddress)),
+    ).layout(("approvers", "candidates"))
+
+    for signers_num in [3, 9, 20]:
+        scenario.h2("%d signers" % signers_num)
+        signers = [sp.test_account("Signer%d" % i).address for i in range(signers_num)]
+        address_sets_candidate = sp.set_type_expr(
+            sp.record(
+                approvers=sp.set(signers),
+                candidates=sp.map(
+                    {UTXO.make_candidate_key_type(receiver, amount): sp.set(signers)}
+                ),
+            ),
+            address_sets_candidate_type,
+        )
+        approvers = sp.nat(2**signers_num - 1)
+        bitmask_candidate = UTXO.make_utxo_candidate_value_type(
+            approvers=approvers,
+            candidates=sp.map(
+                {
+                    UTXO.make_candidate_hash(
+                        receiver, amount
+                    ): UTXO.make_candidate_votes(approvers, signers_num)
+                }
+            ),
+        )
+
+        scenario.show(
+            sp.record(
+                address_sets_bytes=sp.len(sp.pack(address_sets_candidate)),
+                bitmask_bytes=sp.len(sp.pack(bitmask_candidate)),
+            )
+        )
+        scenario.verify(
+            sp.len(sp.pack(bitmask_candidate)) < sp.len(sp.pack(address_sets_candidate))
+        )
+
+
+@sp.add_test(name="TzBTC Ledger UTXO Storage")
+def test_utxo_storage():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger UTXO Storage")
+    scenario.p(
+        "Compares the packed size of an utxo_map entry with the former layout (a "
+        "txid/output_no record key and a state/receiver/amount record value) and with "
+        "the compact layout (a txid || output_no bytes key and a value tagged by the "
+        "state that drops the receiver once minted)."
+    )
+    scenario.table_of_contents()
+
+    record_value_type = sp.TRecord(
+        state=sp.TNat,
+        receiver=sp.TOption(sp.TAddress),
+        amount=sp.TNat,
+    ).layout(("state", ("receiver", "amount")))
+    utxo_key = UTXO.make_key(sp.bytes("0x" + "ab" * 32), sp.nat(1))
+    receiver = sp.some(sp.test_account("Alice").address)
+    amount = sp.nat(100_000_000)
+
+    for name, state in [
+        ("INIT", UTXO_STATE.INIT),
+        ("USED_FOR_MINT", UTXO_STATE.USED_FOR_MINT),
+    ]:
+        scenario.h2("%s UTXO" % name)
+        record_entry_size = sp.len(sp.pack(utxo_key)) + sp.len(
+            sp.pack(
+                sp.set_type_expr(
+                    sp.record(state=state, receiver=receiver, amount=amount),
+                    record_value_type,
+                )
+            )
+        )
+        compact_entry_size = sp.len(sp.pack(UTXO.make_packed_key(utxo_key))) + sp.len(
+            sp.pack(UTXO.make_value(state, receiver, amount))
+        )
+
+        scenario.show(
+            sp.record(
+                record_bytes=record_entry_size,
+                compact_bytes=compact_entry_size,
+                saved_bytes=sp.as_nat(record_entry_size - compact_entry_size),
+            )
+        )
+        scenario.verify(compact_entry_size < record_entry_size)
+
+    scenario.h2("Packed keys")
+    scenario.p(
+        "The packed key is the txid followed by the zarith encoded output number"
+    )
+    txid = "0x" + "abcd" * 16
+    scenario.verify_equal(
+        UTXO.make_packed_key(UTXO.make_key(sp.bytes(txid), sp.nat(1))),
+        sp.bytes(txid + "01"),
+    )
+    scenario.verify_equal(
+        UTXO.make_packed_key(UTXO.make_key(sp.bytes(txid), sp.nat(300))),
+        sp.bytes(txid + "ac04"),
+    )
+
+
+@sp.add_test(name="TzBTC Ledger Candidate Purge")
+def test_candidate_purge():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Candidate Purge")
+    scenario.p(
+        "Purges the UTXO candidates that expired or that can no longer reach the "
+        "threshold with the votes of the remaining trusted signers."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    ledger_admin = sp.test_account("LedgerAdmin")
+    signer1 = sp.test_account("Signer1")
+    signer2 = sp.test_account("Signer2")
+    signer3 = sp.test_account("Signer3")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    CANDIDATE_EXPIRY_LEVELS = 100
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+                signer2.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
+                signer3.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=2),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(3),
+        active_signers=sp.nat(7),
+        threshold=sp.nat(2),
+        candidate_expiry_levels=sp.nat(CANDIDATE_EXPIRY_LEVELS),
+    )
+    scenario += tzbtc_ledger
+
+    def confirm_utxo(signer, txid, receiver, level):
+        scenario += tzbtc_ledger.confirm_utxo(
+            amount=sp.nat(1000),
+            output_no=sp.nat(0),
+            receiver=receiver.address,
+            txid=txid,
+        ).run(sender=signer, level=level)
+
+    DISPUTED_KEY = UTXO.make_key(make_txid("0xd1"), sp.nat(0))
+    STALE_KEY = UTXO.make_key(make_txid("0xd2"), sp.nat(0))
+    MISSING_KEY = UTXO.make_key(make_txid("0xd3"), sp.nat(0))
+    ALL_KEYS = sp.list([DISPUTED_KEY, STALE_KEY, MISSING_KEY])
+
+    scenario.h2("Candidates record the level of their first confirmation")
+    confirm_utxo(signer1, make_txid("0xd1"), alice, 10)
+    confirm_utxo(signer1, make_txid("0xd2"), alice, 10)
+    confirm_utxo(signer2, make_txid("0xd1"), bob, 20)
+    scenario.verify_equal(
+        tzbtc_ledger.data.candidate_utxo_map[DISPUTED_KEY].created_at, 10
+    )
+
+    scenario.h2("purge_candidates")
+    scenario.p("Candidates that can still reach the threshold are not purged")
+    scenario += tzbtc_ledger.purge_candidates(ALL_KEYS).run(sender=alice, level=30)
+    scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(DISPUTED_KEY))
+    scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(STALE_KEY))
+
+    scenario.p("A candidate is purgeable once its signers are removed")
+    scenario += tzbtc_ledger.remove_trusted_signer(signer3.address).run(
+        sender=ledger_admin, level=30
+    )
+    scenario.verify_equal(tzbtc_ledger.data.active_signers, sp.nat(3))
+    scenario += tzbtc_ledger.purge_candidates(sp.list([DISPUTED_KEY])).run(
+        sender=alice, level=30
+    )
+    scenario.verify(~tzbtc_ledger.data.candidate_utxo_map.contains(DISPUTED_KEY))
+    scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(STALE_KEY))
+
+    scenario.p("A candidate is purgeable once it expired")
+    scenario += tzbtc_ledger.purge_candidates(ALL_KEYS).run(
+        sender=alice, level=10 + CANDIDATE_EXPIRY_LEVELS - 1
+    )
+    scenario.verify(tzbtc_ledger.data.candidate_utxo_map.contains(STALE_KEY))
+    scenario += tzbtc_ledger.purge_candidates(ALL_KEYS).run(
+        sender=alice, level=10 + CANDIDATE_EXPIRY_LEVELS
+    )
+    scenario.verify(~tzbtc_ledger.data.candidate_utxo_map.contains(STALE_KEY))
+
+    scenario.h2("set_candidate_expiry_levels")
+    scenario.p("set_candidate_expiry_levels fails if the sender is not an admin")
+    scenario += tzbtc_ledger.set_candidate_expiry_levels(sp.nat(10)).run(
+        sender=alice, valid=False
+    )
+    scenario += tzbtc_ledger.set_candidate_expiry_levels(sp.nat(10)).run(
+        sender=ledger_admin
+    )
+    scenario.verify_equal(tzbtc_ledger.data.candidate_expiry_levels, sp.nat(10))
+
+
+@sp.add_test(name="TzBTC Ledger Burn Pruning")
+def test_burn_pruning():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Burn Pruning")
+    scenario.p(
+        "A confirmed burn can be pruned by anyone once at least threshold signers "
+        "signed all of its UTXOs and burn_prune_levels levels passed since its "
+        "confirmation. Sweeps, which consolidate UTXOs, are signed and settled like "
+        "burns."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    signer1 = sp.test_account("Signer1")
+    signer2 = sp.test_account("Signer2")
+    treasury = sp.test_account("Treasury")
+    alice = sp.test_account("Alice")
+
+    BURN_PRUNE_LEVELS = 100
+    CONFIRMATION_LEVEL = 10
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+                signer2.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(2),
+        active_signers=sp.nat(3),
+        threshold=sp.nat(2),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=sp.nat(100),
+        min_burn_amount=sp.nat(100),
+        redeem_address=redeem_address.address,
+        burn_prune_levels=sp.nat(BURN_PRUNE_LEVELS),
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+
+    scenario += tzbtc_ledger.set_utxo(
+        txid=make_txid("0xa1"),
+        output_no=sp.nat(0),
+        receiver=sp.some(alice.address),
+        amount=sp.nat(1000),
+        utxo_state=UTXO_STATE.INIT,
+    ).run(sender=ledger_admin)
+    scenario += tzbtc_ledger.mint(txid=make_txid("0xa1"), output_no=sp.nat(0)).run(
+        sender=gatekeeper
+    )
+    scenario += tzbtc_ledger.verify_address(address=alice.address, verified=True).run(
+        sender=gatekeeper
+    )
+    scenario += token_contract.approve(
+        sp.record(spender=tzbtc_ledger.address, value=sp.nat(900))
+    ).run(sender=alice)
+    scenario += tzbtc_ledger.propose_burn(
+        amount=sp.nat(300), receiver=sp.bytes("0xff"), optional_callback=sp.none
+    ).run(sender=alice)
+
+    scenario += tzbtc_ledger.set_utxo(
+        txid=make_txid("0xa2"),
+        output_no=sp.nat(0),
+        receiver=sp.none,
+        amount=sp.nat(1000),
+        utxo_state=UTXO_STATE.USED_FOR_MINT,
+    ).run(sender=ledger_admin)
+    UTXO_KEY_A2 = UTXO.make_key(make_txid("0xa2"), sp.nat(0))
+    scenario += tzbtc_ledger.confirm_burn(
+        burn_id=sp.nat(0),
+        utxos=sp.map({UTXO_KEY_A2: UTXO.make_burn_type(sp.nat(1000))}),
+        fee=sp.nat(10),
+    ).run(sender=gatekeeper, level=CONFIRMATION_LEVEL)
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(0)].confirmed_at, CONFIRMATION_LEVEL
+    )
+
+    def sign_burn(signer):
+        scenario += tzbtc_ledger.sign_burn(
+            burn_id=sp.nat(0),
+            utxos_with_signature=sp.list(
+                [
+                    sp.record(
+                        txid=make_txid("0xa2"),
+                        output_no=sp.nat(0),
+                        signature=sp.bytes("0x000000"),
+                    )
+                ]
+            ),
+        ).run(sender=signer, level=CONFIRMATION_LEVEL)
+
+    PRUNE_LEVEL = CONFIRMATION_LEVEL + BURN_PRUNE_LEVELS
+
+    scenario.h2("prune_burns")
+    scenario.p("prune_burns skips burns signed by less than threshold signers")
+    sign_burn(signer1)
+    scenario += tzbtc_ledger.prune_burns(sp.list([sp.nat(0)])).run(
+        sender=alice, level=PRUNE_LEVEL
+    )
+    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(0)))
+
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(proposed=sp.set([]), confirmed=sp.set([sp.nat(0)])),
+    )
+
+    scenario.p(
+        "sign_burn removes a burn signed by threshold signers from the open burns"
+    )
+    sign_burn(signer2)
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(proposed=sp.set([]), confirmed=sp.set([])),
+    )
+
+    scenario.p("prune_burns skips burns confirmed less than burn_prune_levels ago")
+    scenario.verify_equal(
+        tzbtc_ledger.get_prunable_burns(sp.list([sp.nat(0), sp.nat(1)])),
+        sp.list([]),
+    )
+    scenario += tzbtc_ledger.prune_burns(sp.list([sp.nat(0)])).run(
+        sender=alice, level=PRUNE_LEVEL - 1
+    )
+    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(0)))
+
+    scenario.p("prune_burns removes prunable burns and their signatures")
+    scenario += tzbtc_ledger.prune_burns(sp.list([sp.nat(0), sp.nat(1)])).run(
+        sender=alice, level=PRUNE_LEVEL
+    )
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(0)))
+    scenario.verify(~tzbtc_ledger.data.burn_signers.contains(sp.nat(0)))
+    for signer in [signer1, signer2]:
+        scenario.verify(
+            ~tzbtc_ledger.data.burn_signatures.contains(
+                BurnSignature.make_key(sp.nat(0), UTXO_KEY_A2, signer.address)
+            )
+        )
+        scenario.verify(
+            ~tzbtc_ledger.data.burn_signed_utxos.contains(
+                Burn.make_signer_key(sp.nat(0), signer.address)
+            )
+        )
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(proposed=sp.set([]), confirmed=sp.set([])),
+    )
+
+    scenario.h2("set_burn_prune_levels")
+    scenario.p("set_burn_prune_levels fails if the sender is not an admin")
+    scenario += tzbtc_ledger.set_burn_prune_levels(sp.nat(10)).run(
+        sender=alice, valid=False
+    )
+    scenario += tzbtc_ledger.set_burn_prune_levels(sp.nat(10)).run(sender=ledger_admin)
+    scenario.verify_equal(tzbtc_ledger.data.burn_prune_levels, sp.nat(10))
+
+    scenario.h2("sweep_utxos")
+    SWEEP_LEVEL = PRUNE_LEVEL + 1
+    for txid in ["0xb1", "0xb2"]:
+        scenario += tzbtc_ledger.set_utxo(
+            txid=make_txid(txid),
+            output_no=sp.nat(0),
+            receiver=sp.none,
+            amount=sp.nat(1000),
+            utxo_state=UTXO_STATE.USED_FOR_MINT,
+        ).run(sender=ledger_admin)
+    UTXO_KEY_B1 = UTXO.make_key(make_txid("0xb1"), sp.nat(0))
+    UTXO_KEY_B2 = UTXO.make_key(make_txid("0xb2"), sp.nat(0))
+    SWEPT_UTXOS = sp.map(
+        {
+            UTXO_KEY_B1: UTXO.make_burn_type(sp.nat(1000)),
+            UTXO_KEY_B2: UTXO.make_burn_type(sp.nat(1000)),
+        }
+    )
+
+    scenario.p("sweep_utxos fails if the sender is not a gatekeeper")
+    scenario += tzbtc_ledger.sweep_utxos(utxos=SWEPT_UTXOS, fee=sp.nat(5)).run(
+        sender=alice, valid=False
+    )
+
+    scenario.p("sweep_utxos fails if there is nothing to consolidate")
+    scenario += tzbtc_ledger.sweep_utxos(
+        utxos=sp.map({UTXO_KEY_B1: UTXO.make_burn_type(sp.nat(1000))}), fee=sp.nat(5)
+    ).run(sender=gatekeeper, valid=False)
+
+    scenario.p("sweep_utxos locks the UTXOs in a sweep paying the custody address")
+    scenario += tzbtc_ledger.sweep_utxos(utxos=SWEPT_UTXOS, fee=sp.nat(5)).run(
+        sender=gatekeeper, level=SWEEP_LEVEL
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(1)],
+        Burn.make(
+            proposer=gatekeeper.address,
+            receiver=sp.bytes("0xff"),
+            amount=sp.nat(0),
+            state=BurnState.CONFIRMED,
+            fee=sp.nat(10),
+            utxos=SWEPT_UTXOS,
+            confirmed_at=sp.nat(SWEEP_LEVEL),
+        ),
+    )
+    scenario.verify(
+        ~tzbtc_ledger.data.utxo_map.contains(UTXO.make_packed_key(UTXO_KEY_B1))
+    )
+    scenario.verify_equal(
+        list_open_burns(tzbtc_ledger),
+        sp.record(proposed=sp.set([]), confirmed=sp.set([sp.nat(1)])),
+    )
+    scenario.verify_equal(tzbtc_ledger.data.reserves.utxo_count, 1)
+
+    scenario.p("The consolidated UTXO is added by a quorum of change confirmations")
+    for signer in [signer1, signer2]:
+        scenario += tzbtc_ledger.sign_burn(
+            burn_id=sp.nat(1),
+            utxos_with_signature=sp.list(
+                [
+                    sp.record(
+                        txid=make_txid("0xb1"),
+                        output_no=sp.nat(0),
+                        signature=sp.bytes("0x000000"),
+                    ),
+                    sp.record(
+                        txid=make_txid("0xb2"),
+                        output_no=sp.nat(0),
+                        signature=sp.bytes("0x000000"),
+                    ),
+                ]
+            ),
+        ).run(sender=signer, level=SWEEP_LEVEL)
+        scenario += tzbtc_ledger.confirm_change_utxo(
+            sp.list(
+                [sp.record(txid=make_txid("0xb3"), output_no=sp.nat(0), amount=1990)]
+            )
+        ).run(sender=signer, level=SWEEP_LEVEL)
+    scenario.verify_equal(
+        tzbtc_ledger.data.utxo_map[
+            UTXO.make_packed_key(UTXO.make_key(make_txid("0xb3"), sp.nat(0)))
+        ],
+        UTXO.make_used_for_mint_value(sp.nat(1990)),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_reserves(),
+        Reserves.make(
+            init_amount=sp.nat(0),
+            minted_amount=sp.nat(2990),
+            proposed_burn_amount=sp.nat(0),
+            utxo_count=sp.nat(2),
+        ),
+    )
+
+    scenario.h2("Burn signatures as events")
+    EMIT_LEVEL = SWEEP_LEVEL + 1
+    scenario += tzbtc_ledger.set_emit_burn_signatures(True).run(sender=ledger_admin)
+    scenario += tzbtc_ledger.propose_burn(
+        amount=sp.nat(300), receiver=sp.bytes("0xff"), optional_callback=sp.none
+    ).run(sender=alice)
+    for txid in ["0xc1", "0xc2"]:
+        scenario += tzbtc_ledger.set_utxo(
+            txid=make_txid(txid),
+            output_no=sp.nat(0),
+            receiver=sp.none,
+            amount=sp.nat(1000),
+            utxo_state=UTXO_STATE.USED_FOR_MINT,
+        ).run(sender=ledger_admin)
+    scenario += tzbtc_ledger.confirm_burn(
+        burn_id=sp.nat(2),
+        utxos=sp.map(
+            {
+                UTXO.make_key(make_txid("0xc1"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
+                ),
+                UTXO.make_key(make_txid("0xc2"), sp.nat(0)): UTXO.make_burn_type(
+                    sp.nat(1000)
+                ),
+            }
+        ),
+        fee=sp.nat(10),
+    ).run(sender=gatekeeper, level=EMIT_LEVEL)
+
+    def sign_burn_2(signer, txid):
+        scenario += tzbtc_ledger.sign_burn(
+            burn_id=sp.nat(2),
+            utxos_with_signature=sp.list(
+                [
+                    sp.record(
+                        txid=make_txid(txid),
+                        output_no=sp.nat(0),
+                        signature=sp.bytes("0x000000"),
+                    )
+                ]
+            ),
+        ).run(sender=signer, level=EMIT_LEVEL)
+
+    scenario.p("sign_burn counts the UTXOs a signer signed across several calls")
+    sign_burn_2(signer1, "0xc1")
+    sign_burn_2(signer1, "0xc1")
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(2)),
+        sp.map({signer1.address: sp.nat(1)}),
+    )
+    sign_burn_2(signer1, "0xc2")
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_signers(sp.nat(2)),
+        sp.map({signer1.address: sp.nat(2)}),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.data.burn_signed_utxos[
+            Burn.make_signer_key(sp.nat(2), signer1.address)
+        ],
+        sp.nat(3),
+    )
+    scenario.p("sign_burn leaves the burn entry untouched")
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(2)],
+        Burn.make(
+            proposer=alice.address,
+            receiver=sp.bytes("0xff"),
+            amount=sp.nat(300),
+            state=BurnState.CONFIRMED,
+            fee=2 * 10,
+            utxos=sp.map(
+                {
+                    UTXO.make_key(make_txid(txid), sp.nat(0)): UTXO.make_burn_type(
+                        sp.nat(1000)
+                    )
+                    for txid in ["0xc1", "0xc2"]
+                }
+            ),
+            confirmed_at=EMIT_LEVEL,
+        ),
+    )
+    scenario.verify_equal(
+        tzbtc_ledger.get_burn_status(sp.list([sp.nat(2)]))[sp.nat(2)].complete_signers,
+        sp.nat(1),
+    )
+
+    scenario.p(
+        "prune_burns removes a burn signed in several calls with emitted signatures"
+    )
+    sign_burn_2(signer2, "0xc2")
+    scenario += tzbtc_ledger.prune_burns(sp.list([sp.nat(2)])).run(
+        sender=alice, level=EMIT_LEVEL + 10
+    )
+    scenario.verify(tzbtc_ledger.data.burns_map.contains(sp.nat(2)))
+    sign_burn_2(signer2, "0xc1")
+    scenario += tzbtc_ledger.prune_burns(sp.list([sp.nat(2)])).run(
+        sender=alice, level=EMIT_LEVEL + 10
+    )
+    scenario.verify(~tzbtc_ledger.data.burns_map.contains(sp.nat(2)))
+
+
+@sp.add_test(name="TzBTC Ledger Merkle Whitelist")
+def test_merkle_whitelist():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Merkle Whitelist")
+    scenario.p(
+        "The gatekeeper commits the Merkle root of the verified users built with "
+        "utils/merkle_whitelist.py, a verified user proposes a burn with the proof of "
+        "its address."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    treasury = sp.test_account("Treasury")
+
+    tzbtc_ledger = TzBTCLedger(
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=sp.nat(100),
+        min_burn_amount=sp.nat(100),
+        redeem_address=redeem_address.address,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+
+    VERIFIED_USERS = [
+        "tz1KqTpEZ7Yob7QbPE4Hy4Wo8fHG8LhKxZSx",
+        "tz1Ke2h7sDdakHJQh8WX4Z372du1KCorkCT6",
+        "tz1Ke2h7sDdakHJQh8WX4Z372du1KD25fCcX",
+        "tz1Ke2h7sDdakHJQh8WX4Z372du1KD7JXU7Q",
+        "KT1BEqzn5Wx8uJrZNvuS9DVHmLvG9td3fDLi",
+    ]
+    USER = VERIFIED_USERS[2]
+    OTHER_USER = "tz1bHjtoa9ppb1Zqjpj55E3YNmyhQSnqtoek"
+    tree = MerkleWhitelist(VERIFIED_USERS)
+    ROOT = sp.bytes("0x" + tree.root.hex())
+
+    def make_proof(address):
+        return sp.list(
+            [sp.bytes("0x" + sibling.hex()) for sibling in tree.proof(address)]
+        )
+
+    scenario.p("The leaves are built from the packed addresses")
+    for address in VERIFIED_USERS:
+        scenario.verify_equal(
+            sp.pack(sp.address(address)), sp.bytes("0x" + pack_address(address).hex())
+        )
+
+    for address in [USER, OTHER_USER]:
+        scenario += tzbtc_ledger.set_utxo(
+            txid=sp.sha256(sp.pack(sp.address(address))),
+            output_no=sp.nat(0),
+            receiver=sp.some(sp.address(address)),
+            amount=sp.nat(1000),
+            utxo_state=UTXO_STATE.INIT,
+        ).run(sender=ledger_admin)
+        scenario += tzbtc_ledger.mint(
+            txid=sp.sha256(sp.pack(sp.address(address))), output_no=sp.nat(0)
+        ).run(sender=gatekeeper)
+        scenario += token_contract.approve(
+            sp.record(spender=tzbtc_ledger.address, value=sp.nat(900))
+        ).run(sender=sp.address(address))
+
+    def propose_burn_with_proof(sender, proof, valid=True):
+        scenario += tzbtc_ledger.propose_burn_with_proof(
+            amount=sp.nat(300),
+            receiver=sp.bytes("0xff"),
+            optional_callback=sp.none,
+            proof=proof,
+        ).run(sender=sp.address(sender), valid=valid)
+
+    scenario.h2("set_whitelist_root")
+    scenario.p("propose_burn_with_proof fails while no root is committed")
+    propose_burn_with_proof(USER, make_proof(USER), valid=False)
+
+    scenario.p("set_whitelist_root fails if the sender is not a gatekeeper")
+    scenario += tzbtc_ledger.set_whitelist_root(sp.some(ROOT)).run(
+        sender=ledger_admin, valid=False
+    )
+    scenario += tzbtc_ledger.set_whitelist_root(sp.some(ROOT)).run(sender=gatekeeper)
+
+    scenario.h2("propose_burn_with_proof")
+    scenario.p("propose_burn_with_proof creates the burn of a verified user")
+    propose_burn_with_proof(USER, make_proof(USER))
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(0)].proposer, sp.address(USER)
+    )
+    scenario.verify_equal(
+        token_contract.data.ledger[sp.address(USER)].balance, sp.nat(600)
+    )
+
+    scenario.p("propose_burn still requires the whitelisted_addresses big_map")
+    scenario += tzbtc_ledger.propose_burn(
+        amount=sp.nat(300), receiver=sp.bytes("0xff"), optional_callback=sp.none
+    ).run(sender=sp.address(USER), valid=False)
+
+    scenario.p("propose_burn_with_proof fails with the proof of another address")
+    propose_burn_with_proof(OTHER_USER, make_proof(USER), valid=False)
+
+    scenario.p("propose_burn_with_proof fails without proof")
+    propose_burn_with_proof(USER, sp.list([]), valid=False)
+
+    scenario.h2("Whitelist update")
+    tree.remove(USER)
+    tree.add(OTHER_USER)
+    scenario += tzbtc_ledger.set_whitelist_root(
+        sp.some(sp.bytes("0x" + tree.root.hex()))
+    ).run(sender=gatekeeper)
+
+    scenario.p("propose_burn_with_proof succeeds for an added address")
+    propose_burn_with_proof(OTHER_USER, make_proof(OTHER_USER))
+    scenario.verify_equal(
+        tzbtc_ledger.data.burns_map[sp.nat(1)].proposer, sp.address(OTHER_USER)
+    )
+
+    scenario.p("propose_burn_with_proof fails for a removed address")
+    propose_burn_with_proof(USER, make_proof(VERIFIED_USERS[1]), valid=False)
+
+    scenario.p("propose_burn_with_proof fails once the root is unset")
+    scenario += tzbtc_ledger.set_whitelist_root(sp.none).run(sender=gatekeeper)
+    propose_burn_with_proof(OTHER_USER, make_proof(OTHER_USER), valid=False)
+
+
+@sp.add_test(name="TzBTC Ledger Events")
+def test_events():
+    scenario = sp.test_scenario()
+
+    scenario.h1("TzBTC Ledger Events")
+    scenario.p(
+        "Checks the events emitted by every UTXO and burn state transition. The ledger "
+        "forwards its events to an EventRecorder, whose list is cleared after every check."
+    )
+    scenario.table_of_contents()
+
+    scenario.h2("Set up/Bootstrapping")
+    token_admin = sp.test_account("TokenAdmin")
+    redeem_address = sp.test_account("RedeemAddress")
+    token_contract = DummyTzBtcToken(token_admin.address, redeem_address.address)
+    scenario += token_contract
+    recorder = EventRecorder()
+    scenario += recorder
+
+    ledger_admin = sp.test_account("LedgerAdmin")
+    gatekeeper = sp.test_account("Gatekeeper")
+    signer1 = sp.test_account("Signer1")
+    signer2 = sp.test_account("Signer2")
+    treasury = sp.test_account("Treasury")
+    alice = sp.test_account("Alice")
+
+    SERVICE_FEE = 100
+    UTXO_AMOUNT = 1000
+    BURN_AMOUNT = 300
+    alice_bitcoin_addr = sp.bytes("0xf0f0f0")
+
+    tzbtc_ledger = EventRecordingLedger(
+        recorder.address,
+        roles=sp.big_map(
+            {
+                ledger_admin.address: Roles.make(Roles.ADMINISTRATOR),
+                gatekeeper.address: Roles.make(Roles.GATEKEEPER),
+                signer1.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=0),
+                signer2.address: Roles.make(Roles.TRUSTED_SIGNER, signer_index=1),
+            }
+        ),
+        administrators_num=sp.nat(1),
+        next_signer_index=sp.nat(2),
+        active_signers=sp.nat(3),
+        threshold=sp.nat(2),
+        token_address=token_contract.address,
+        treasury_address=treasury.address,
+        service_fee=SERVICE_FEE,
+        redeem_address=redeem_address.address,
+    )
+    scenario += tzbtc_ledger
+    scenario += token_contract.add_operator(tzbtc_ledger.address).run(
+        sender=token_admin
+    )
+    scenario += tzbtc_ledger.verify_address(address=alice.address, verified=True).run(
+        sender=gatekeeper
+    )
+
+    def verify_events(events):
+        scenario.verify_equal(
+            recorder.data.events,
+            sp.list(list(reversed(events)), t=get_event_type()),
+        )
+        scenario += recorder.clear().run()
+
+    scenario.h2("UTXO events")
+    MINTED_UTXO_KEY = UTXO.make_key(make_txid("0x01"), sp.nat(0))
+    MINTED_UTXO = sp.record(
+        amount=sp.nat(UTXO_AMOUNT),
+        output_no=sp.nat(0),
+        receiver=alice.address,
+        txid=make_txid("0x01"),
+    )
+
+    scenario.p("confirm_utxo emits a candidate_vote event")
+    scenario += tzbtc_ledger.confirm_utxo(MINTED_UTXO).run(sender=signer1)
+    verify_events(
+        [
+            make_event(
+                "candidate_vote",
+                sp.record(
+                    utxo_key=MINTED_UTXO_KEY,
+                    signer=signer1.address,
+                    receiver=sp.some(alice.address),
+                    amount=sp.nat(UTXO_AMOUNT),
+                    votes=sp.nat(1),
+                ),
+            )
+        ]
+    )
+
+    scenario.p("The confirmation reaching the threshold also emits utxo_promoted")
+    scenario += tzbtc_ledger.confirm_utxo(MINTED_UTXO).run(sender=signer2)
+    verify_events(
+        [
+            make_event(
+                "candidate_vote",
+                sp.record(
+                    utxo_key=MINTED_UTXO_KEY,
+                    signer=signer2.address,
+                    receiver=sp.some(alice.address),
+                    amount=sp.nat(UTXO_AMOUNT),
+                    votes=sp.nat(2),
+                ),
+            ),
+            make_event(
+                "utxo_promoted",
+                sp.record(
+                    utxo_key=MINTED_UTXO_KEY,
+                    utxo=UTXO.make_init_value(
+                        sp.some(alice.address), sp.nat(UTXO_AMOUNT)
+                    ),
+                ),
+            ),
+        ]
+    )
+
+    scenario.p("mint emits an utxo_minted event")
+    scenario += tzbtc_ledger.mint(txid=make_txid("0x01"), output_no=sp.nat(0)).run(
+        sender=gatekeeper
+    )
+    verify_events(
+        [
+            make_event(
+                "utxo_minted",
+                sp.record(
+                    utxo_key=MINTED_UTXO_KEY,
+                    receiver=alice.address,
+                    amount=sp.nat(UTXO_AMOUNT - SERVICE_FEE),
+                    service_fee=sp.nat(SERVICE_FEE),
+                ),
+            )
+        ]
+    )
+
+    scenario.p("set_utxo emits an utxo_set event")
+    SET_UTXO_KEY = UTXO.make_key(make_txid("0x02"), sp.nat(0))
+    scenario += tzbtc_ledger.set_utxo(
+        txid=make_txid("0x02"),
+        output_no=sp.nat(0),
+        receiver=sp.none,
+        amount=sp.nat(UTXO_AMOUNT),
+        utxo_state=UTXO_STATE.USED_FOR_MINT,
+    ).run(sender=ledger_admin)
+    verify_events(
+        [
+            make_event(
+                "utxo_set",
+                sp.record(
+                    utxo_key=SET_UTXO_KEY,
+                    utxo=UTXO.make_used_for_mint_value(sp.nat(UTXO_AMOUNT)),
+                ),
+            )
+        ]
+    )
+
+    scenario.p("remove_utxo emits an utxo_removed event")
+    scenario += tzbtc_ledger.remove_utxo(
+        txid=make_txid("0x02"), output_no=sp.nat(0)
+    ).run(sender=ledger_admin)
+    verify_events([make_event("utxo_removed", SET_UTXO_KEY)])
+
+    scenario.p("remove_utxo emits no event for an UTXO that is not in the UTXO map")
+    scenario += tzbtc_ledger.remove_utxo(
+        txid=make_txid("0x02"), output_no=sp.nat(0)
+    ).run(sender=ledger_admin)
+    verify_events([])
+
+    scenario.h2("Burn events")
+
+    def propose_burn(burn_id):
+        scenario += token_contract.approve(
+            sp.record(spender=tzbtc_ledger.address, value=sp.nat(BURN_AMOUNT))
+        ).run(sender=alice)
+        scenario += tzbtc_ledger.propose_burn(
+            amount=sp.nat(BURN_AMOUNT),
+            receiver=alice_bitcoin_addr,
+            optional_callback=sp.none,
+        ).run(sender=alice)
+        verify_events(
+            [
+                make_event(
+                    "burn_proposed",
+                    sp.record(
+                        burn_id=sp.nat(burn_id),
+                        proposer=alice.address,
+                        receiver=alice_bitcoin_addr,
+                        amount=sp.nat(BURN_AMOUNT),
+                    ),
+                )
+            ]
+        )
+
+    scenario.p("propose_burn emits a burn_proposed event")
+    propose_burn(0)
+
+    scenario.p("cancel_burn emits a burn_cancelled event")
+    scenario += tzbtc_ledger.cancel_burn(sp.nat(0)).run(sender=alice)
+    verify_events(
+        [
+            make_event(
+                "burn_cancelled",
+                sp.record(
+                    burn_id=sp.nat(0),
+                    proposer=alice.address,
+                    amount=sp.nat(BURN_AMOUNT),
+                    cancelled_by=alice.address,
+                ),
+            )
+        ]
+    )
+
+    scenario.p("confirm_burn emits a burn_confirmed event")
+    propose_burn(1)
+    BURN_UTXOS = sp.map({MINTED_UTXO_KEY: UTXO.make_burn_type(sp.nat(UTXO_AMOUNT))})
+    scenario += tzbtc_ledger.confirm_burn(
+        utxos=BURN_UTXOS, fee=sp.nat(0), burn_id=sp.nat(1)
+    ).run(sender=gatekeeper)
+    verify_events(
+        [
+            make_event(
+                "burn_confirmed",
+                sp.record(
+                    burn_id=sp.nat(1),
+                    amount=sp.nat(BURN_AMOUNT),
+                    fee=sp.nat(0),
+                    utxos=BURN_UTXOS,
+                ),
+            )
+        ]
+    )
+
+    scenario.p("remove_burn emits a burn_removed event")
+    scenario += tzbtc_ledger.remove_burn(sp.nat(1)).run(sender=ledger_admin)
+    verify_events([make_event("burn_removed", sp.nat(1))])
@@ -3,9 +3,36 @@ import utils.errors as Errors
 import utils.constants as Constants
 
 
-class AdministratorStatus:
-    PROPOSED = 0
-    SET = 1
+class Roles:
+    """
+    Roles stored in the roles big_map of a contract. Every address maps to a nat in
+    which each role is a bit flag, the values below are the positions of these bits.
+    The index of a trusted signer is stored in the bits starting at
+    SIGNER_INDEX_OFFSET. MAX_SIGNER_INDEX is the last index that can be assigned, as
+    the bitmasks are built with LSL which fails for shifts above 256.
+    """
+
+    PROPOSED_ADMINISTRATOR = 0
+    ADMINISTRATOR = 1
+    GATEKEEPER = 2
+    TRUSTED_SIGNER = 3
+    SIGNER_INDEX_OFFSET = 8
+    MAX_SIGNER_INDEX = 256
+
+    @staticmethod
+    def make(*roles, signer_index=0):
+        """
+        Builds the value of an entry in the roles big_map.
+
+        Parameters
+        ----------
+        roles: int
+            The roles of the address.
+        signer_index: int
+            The index of the address if it is a trusted signer.
+        """
+        value = sum(1 << role for role in set(roles))
+        return sp.nat(value + (signer_index << Roles.SIGNER_INDEX_OFFSET))
 
 
 class SingleAdministrableMixin:
@@ -15,29 +42,129 @@ class SingleAdministrableMixin:
     """
 
     @sp.private_lambda(with_storage="read-only", with_operations=False, wrap_call=True)
-    def verify_is_admin(self, unit):
+    def has_role(self, param):
         """
-        Verifies if the sender of the operation is a set admin of the contract.
+        Checks if an address has the given role.
 
         Parameters
         ----------
-        unit: sp.TUnit
-            Unit parameter
+        address: sp.TAddress
+            The address to check.
+        role: sp.TNat
+            The role to check (see Roles).
 
-        Raises
-        ------
-        NotAdmin
-            If the sender of the operation is not a set admin of the contract.
+        Returns
+        -------
+        sp.TBool
+            True if the address has the role.
+        """
+        sp.set_type(param, sp.TRecord(address=sp.TAddress, role=sp.TNat))
+        roles = self.data.roles.get(param.address, default_value=sp.nat(0))
+        sp.result((roles >> param.role) % 2 == 1)
+
+    def verify_has_role(self, role, message):
+        """
+        Verifies if the sender of the operation has the given role.
+
+        Parameters
+        ----------
+        role: int
+            The role the sender needs (see Roles).
+        message: str
+            The error raised if the sender does not have the role.
         """
         sp.verify(
-            self.data.administrators[sp.sender] == AdministratorStatus.SET,
-            message=Errors.NOT_ADMIN,
+            self.has_role(sp.record(address=sp.sender, role=role)), message=message
         )
 
+    def set_roles(self, address, roles):
+        """
+        Stores the roles of an address, the entry is removed if it has no role left.
+
+        Parameters
+        ----------
+        address: sp.TAddress
+            The address to update.
+        roles: sp.TNat
+            The new value of the entry in the roles big_map.
+        """
+        with sp.if_(roles == 0):
+            del self.data.roles[address]
+        with sp.else_():
+            self.data.roles[address] = roles
+
+    def update_role(self, address, role, enabled):
+        """
+        Grants or revokes a single role of an address.
+
+        Parameters
+        ----------
+        address: sp.TAddress
+            The address to update.
+        role: int
+            The role to grant or revoke (see Roles).
+        enabled: bool
+            True to grant the role, false to revoke it.
+        """
+        roles = sp.local("roles", self.data.roles.get(address, default_value=sp.nat(0)))
+        with sp.if_((roles.value >> role) % 2 == (0 if enabled else 1)):
+            if enabled:
+                self.set_roles(address, roles.value + (1 << role))
+            else:
+                self.set_roles(address, sp.as_nat(roles.value - (1 << role)))
+
+    def add_signer(self, signer):
+        """
+        Grants the trusted signer role to an address (see the add_trusted_signer
+        entrypoint).
+
+        Parameters
+        ----------
+        signer: sp.TAddress
+            The address to add to the trusted signer set.
+        """
+        roles = sp.local("roles", self.data.roles.get(signer, default_value=sp.nat(0)))
+        with sp.if_((roles.value >> Roles.TRUSTED_SIGNER) % 2 == 0):
+            sp.verify(
+                self.data.next_signer_index <= Roles.MAX_SIGNER_INDEX,
+                message=Errors.SIGNER_INDICES_EXHAUSTED,
+            )
+            self.data.roles[signer] = (
+                roles.value
+                + (1 << Roles.TRUSTED_SIGNER)
+                + (self.data.next_signer_index << Roles.SIGNER_INDEX_OFFSET)
+            )
+            self.data.active_signers += sp.nat(1) << self.data.next_signer_index
+            self.data.next_signer_index += 1
+
+    def remove_signer(self, signer):
+        """
+        Revokes the trusted signer role of an address (see the remove_trusted_signer
+        entrypoint).
+
+        Parameters
+        ----------
+        signer: sp.TAddress
+            The address to remove from the trusted signer set.
+        """
+        roles = sp.local("roles", self.data.roles.get(signer, default_value=sp.nat(0)))
+        with sp.if_((roles.value >> Roles.TRUSTED_SIGNER) % 2 == 1):
+            self.data.active_signers = sp.as_nat(
+                self.data.active_signers
+                - (sp.nat(1) << (roles.value >> Roles.SIGNER_INDEX_OFFSET))
+            )
+            self.set_roles(
+                signer,
+                sp.as_nat(
+                    roles.value % (1 << Roles.SIGNER_INDEX_OFFSET)
+                    - (1 << Roles.TRUSTED_SIGNER)
+                ),
+            )
+
     @sp.entry_point(check_no_incoming_transfer=True)
     def propose_administrator(self, proposed_admin):
         """
-        Propose an address to be added to the admins map of the contract.
+        Propose an address to become an administrator of the contract.
 
         Parameters
         ----------
@@ -50,18 +177,23 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(proposed_admin, sp.TAddress)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         sp.verify(
-            ~self.data.administrators.contains(proposed_admin),
+            ~self.has_role(
+                sp.record(address=proposed_admin, role=Roles.PROPOSED_ADMINISTRATOR)
+            )
+            & ~self.has_role(
+                sp.record(address=proposed_admin, role=Roles.ADMINISTRATOR)
+            ),
             message=Errors.ALREADY_ADMIN,
         )
 
-        self.data.administrators[proposed_admin] = AdministratorStatus.PROPOSED
+        self.update_role(proposed_admin, Roles.PROPOSED_ADMINISTRATOR, True)
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def add_gatekeeper(self, gatekeeper):
         """
-        Add an address to the gatekeepers map of the contract.
+        Grants the gatekeeper role to an address.
 
         Parameters
         ----------
@@ -74,13 +206,21 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(gatekeeper, sp.TAddress)
-        self.verify_is_admin(sp.unit)
-        self.data.gatekeepers[gatekeeper] = sp.unit
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+        self.update_role(gatekeeper, Roles.GATEKEEPER, True)
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def add_trusted_signer(self, signer):
         """
-        Add an address to the set of trusted signers.
+        Add an address to the set of trusted signers. Every new signer gets the next
+        free signer index, which is used to tally its confirmations in bitmasks. Indices
+        are never reused, so confirmations of a removed signer are never attributed to
+        a new one. Adding an existing signer keeps its index. The index is also set in
+        the active_signers bitmask.
+
+        As the indices are not reused, the bitmasks grow by one bit for every signer
+        ever added, and at most Roles.MAX_SIGNER_INDEX + 1 signers can be added over
+        the lifetime of the contract, re-adding a removed signer included.
 
         Parameters
         ----------
@@ -91,10 +231,12 @@ class SingleAdministrableMixin:
         ------
         NotAdmin
             If the sender of the operation is not a set admin of the contract.
+        SignerIndicesExhausted
+            If the address is not a trusted signer and all the indices are used.
         """
         sp.set_type(signer, sp.TAddress)
-        self.verify_is_admin(sp.unit)
-        self.data.trusted_signers[signer] = sp.unit
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+        self.add_signer(signer)
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def update_threshold(self, threshold):
@@ -112,9 +254,64 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(threshold, sp.TNat)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.threshold = threshold
 
+    @sp.entry_point(check_no_incoming_transfer=True)
+    def update_roles(self, changes, threshold):
+        """
+        Applies a list of role changes and optionally updates the threshold in a
+        single operation, so that a rotation of the gatekeepers and trusted signers is
+        never observed half done. The changes are applied in order with the same rules
+        as add_gatekeeper, remove_gatekeeper, add_trusted_signer and
+        remove_trusted_signer: a signer removed and added again gets a new index.
+
+        Parameters
+        ----------
+        changes: sp.TList(sp.TRecord(address=sp.TAddress, role=sp.TNat, enabled=sp.TBool))
+            The address, the role (Roles.GATEKEEPER or Roles.TRUSTED_SIGNER) and true
+            to grant the role or false to revoke it.
+        threshold: sp.TOption(sp.TNat)
+            The new threshold, none to keep the current one.
+
+        Raises
+        ------
+        NotAdmin
+            If the sender of the operation is not a set admin of the contract.
+        InvalidRole
+            If a change is not about the gatekeeper or trusted signer role.
+        SignerIndicesExhausted
+            If a trusted signer is added and all the signer indices are used.
+        """
+        sp.set_type(
+            changes,
+            sp.TList(
+                sp.TRecord(address=sp.TAddress, role=sp.TNat, enabled=sp.TBool).layout(
+                    ("address", ("role", "enabled"))
+                )
+            ),
+        )
+        sp.set_type(threshold, sp.TOption(sp.TNat))
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+
+        with sp.for_("change", changes) as change:
+            with sp.if_(change.role == Roles.GATEKEEPER):
+                with sp.if_(change.enabled):
+                    self.update_role(change.address, Roles.GATEKEEPER, True)
+                with sp.else_():
+                    self.update_role(change.address, Roles.GATEKEEPER, False)
+            with sp.else_():
+                sp.verify(
+                    change.role == Roles.TRUSTED_SIGNER, message=Errors.INVALID_ROLE
+                )
+                with sp.if_(change.enabled):
+                    self.add_signer(change.address)
+                with sp.else_():
+                    self.remove_signer(change.address)
+
+        with sp.if_(threshold.is_some()):
+            self.data.threshold = threshold.open_some()
+
     @sp.entry_point(check_no_incoming_transfer=True)
     def update_min_burn_amount(self, min_burn_amount):
         """
@@ -131,7 +328,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(min_burn_amount, sp.TNat)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.min_burn_amount = min_burn_amount
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -150,7 +347,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(gatekeeper_btc_address, sp.TBytes)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.btc_gatekeeper_address = gatekeeper_btc_address
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -169,7 +366,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(custody_btc_address, sp.TBytes)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.custody_btc_address = custody_btc_address
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -188,7 +385,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(fee, sp.TNat)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.service_fee = fee
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -207,7 +404,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(max_btc_network_fee, sp.TNat)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.max_btc_network_fee = max_btc_network_fee
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -226,7 +423,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(treasury_address, sp.TAddress)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.treasury_address = treasury_address
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -245,7 +442,7 @@ class SingleAdministrableMixin:
             If the sender of the operation is not a set admin of the contract.
         """
         sp.set_type(redeem_address, sp.TAddress)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         self.data.redeem_address = redeem_address
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -264,11 +461,12 @@ class SingleAdministrableMixin:
             If the caller of the entrypoint is not a proposed admin of the contract.
         """
         sp.set_type(unit, sp.TUnit)
-        sp.verify(
-            self.data.administrators[sp.sender] == AdministratorStatus.PROPOSED,
-            message=Errors.NOT_PROPOSED_ADMIN,
+        self.verify_has_role(Roles.PROPOSED_ADMINISTRATOR, Errors.NOT_PROPOSED_ADMIN)
+        self.data.roles[sp.sender] = sp.as_nat(
+            self.data.roles[sp.sender]
+            + (1 << Roles.ADMINISTRATOR)
+            - (1 << Roles.PROPOSED_ADMINISTRATOR)
         )
-        self.data.administrators[sp.sender] = AdministratorStatus.SET
         self.data.administrators_num += 1
 
     @sp.entry_point(check_no_incoming_transfer=True)
@@ -288,13 +486,21 @@ class SingleAdministrableMixin:
             If the caller of the entrypoint is not a set admin of the contract.
         """
         sp.set_type(administrator_to_remove, sp.TAddress)
-        self.verify_is_admin(sp.unit)
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
         sp.verify(
             self.data.administrators_num > 1, message=Errors.CANNOT_REMOVE_LAST_ADMIN
         )
 
-        del self.data.administrators[administrator_to_remove]
-        self.data.administrators_num = sp.as_nat(self.data.administrators_num - 1)
+        roles = sp.local(
+            "roles",
+            self.data.roles.get(administrator_to_remove, default_value=sp.nat(0)),
+        )
+        with sp.if_((roles.value >> Roles.ADMINISTRATOR) % 2 == 1):
+            roles.value = sp.as_nat(roles.value - (1 << Roles.ADMINISTRATOR))
+            self.data.administrators_num = sp.as_nat(self.data.administrators_num - 1)
+        with sp.if_((roles.value >> Roles.PROPOSED_ADMINISTRATOR) % 2 == 1):
+            roles.value = sp.as_nat(roles.value - (1 << Roles.PROPOSED_ADMINISTRATOR))
+        self.set_roles(administrator_to_remove, roles.value)
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def remove_gatekeeper(self, gatekeeper_to_remove):
@@ -312,13 +518,14 @@ class SingleAdministrableMixin:
             If the caller of the entrypoint is not a set admin of the contract.
         """
         sp.set_type(gatekeeper_to_remove, sp.TAddress)
-        self.verify_is_admin(sp.unit)
-        del self.data.gatekeepers[gatekeeper_to_remove]
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+        self.update_role(gatekeeper_to_remove, Roles.GATEKEEPER, False)
 
     @sp.entry_point(check_no_incoming_transfer=True)
     def remove_trusted_signer(self, signer):
         """
-        Entrypoint called by a set admin to remove a trusted signer.
+        Entrypoint called by a set admin to remove a trusted signer. The index of the
+        signer is cleared from the active_signers bitmask.
 
         Parameters
         ----------
@@ -331,5 +538,5 @@ class SingleAdministrableMixin:
             If the caller of the entrypoint is not a set admin of the contract.
         """
         sp.set_type(signer, sp.TAddress)
-        self.verify_is_admin(sp.unit)
-        del self.data.trusted_signers[signer]
+        self.verify_has_role(Roles.ADMINISTRATOR, Errors.NOT_ADMIN)
+        self.remove_signer(signer)
@@ -0,0 +1,247 @@
+"""
+Conversions between BTC addresses and the scriptPubKey bytes stored by the ledger.
+
+The ledger stores BTC addresses (the receiver of a burn, the custody and gatekeeper
+addresses) as the scriptPubKey of the address prefixed by its length, e.g.
+0x220020... for a P2WSH output. This module is plain Python and is meant to be used by
+the backend and the deployment scripts.
+"""
+
+import hashlib
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_CONST = 1
+BECH32M_CONST = 0x2BC830A3
+BASE58_CHARSET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+OP_0 = 0x00
+OP_1 = 0x51
+OP_DUP = 0x76
+OP_HASH160 = 0xA9
+OP_EQUAL = 0x87
+OP_EQUALVERIFY = 0x88
+OP_CHECKSIG = 0xAC
+
+
+class Network:
+    """
+    The address prefixes of a BTC network.
+    """
+
+    def __init__(self, hrp, p2pkh_version, p2sh_version):
+        self.hrp = hrp
+        self.p2pkh_version = p2pkh_version
+        self.p2sh_version = p2sh_version
+
+
+MAINNET = Network("bc", 0x00, 0x05)
+TESTNET = Network("tb", 0x6F, 0xC4)
+REGTEST = Network("bcrt", 0x6F, 0xC4)
+NETWORKS = [MAINNET, TESTNET, REGTEST]
+
+
+def _bech32_polymod(values):
+    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i in range(5):
+            checksum ^= generator[i] if ((top >> i) & 1) else 0
+    return checksum
+
+
+def _bech32_hrp_expand(hrp):
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+def _convert_bits(data, from_bits, to_bits, pad):
+    accumulator, bits, result = 0, 0, []
+    max_value = (1 << to_bits) - 1
+    for value in data:
+        if value >> from_bits:
+            raise ValueError("Invalid data for a %d bits group" % from_bits)
+        accumulator = (accumulator << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            result.append((accumulator >> bits) & max_value)
+    if pad and bits:
+        result.append((accumulator << (to_bits - bits)) & max_value)
+    elif not pad and (
+        bits >= from_bits or (accumulator << (to_bits - bits)) & max_value
+    ):
+        raise ValueError("Invalid padding")
+    return result
+
+
+def _bech32_decode(address):
+    if address.lower() != address and address.upper() != address:
+        raise ValueError("Mixed case bech32 address: %s" % address)
+    address = address.lower()
+    separator = address.rfind("1")
+    if separator < 1 or separator + 7 > len(address) or len(address) > 90:
+        raise ValueError("Invalid bech32 address: %s" % address)
+    hrp = address[:separator]
+    try:
+        data = [BECH32_CHARSET.index(c) for c in address[separator + 1 :]]
+    except ValueError:
+        raise ValueError("Invalid bech32 character in %s" % address)
+    const = _bech32_polymod(_bech32_hrp_expand(hrp) + data)
+    if const not in (BECH32_CONST, BECH32M_CONST):
+        raise ValueError("Invalid bech32 checksum: %s" % address)
+    return hrp, data[:-6], const
+
+
+def _bech32_encode(hrp, data, const):
+    values = _bech32_hrp_expand(hrp) + data
+    polymod = _bech32_polymod(values + [0] * 6) ^ const
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + "1" + "".join(BECH32_CHARSET[d] for d in data + checksum)
+
+
+def _sha256d(data):
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
+def base58check_decode(address):
+    """
+    Decodes a base58check string, as used by BTC legacy addresses and Tezos addresses.
+
+    Parameters
+    ----------
+    address: str
+        The base58check encoded string.
+
+    Returns
+    -------
+    bytes
+        The payload, without the 4 bytes checksum.
+
+    Raises
+    ------
+    ValueError
+        If the string is not valid base58 or the checksum does not match.
+    """
+    number = 0
+    for c in address:
+        if c not in BASE58_CHARSET:
+            raise ValueError("Invalid base58 character in %s" % address)
+        number = number * 58 + BASE58_CHARSET.index(c)
+    payload = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    payload = b"\x00" * (len(address) - len(address.lstrip("1"))) + payload
+    if len(payload) < 5 or _sha256d(payload[:-4])[:4] != payload[-4:]:
+        raise ValueError("Invalid base58 checksum: %s" % address)
+    return payload[:-4]
+
+
+def _base58check_encode(payload):
+    payload = payload + _sha256d(payload)[:4]
+    number = int.from_bytes(payload, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_CHARSET[remainder] + encoded
+    return "1" * (len(payload) - len(payload.lstrip(b"\x00"))) + encoded
+
+
+def address_to_script(address):
+    """
+    Converts a BTC address to the length prefixed scriptPubKey stored by the ledger.
+
+    Parameters
+    ----------
+    address: str
+        A P2PKH, P2SH (base58) or segwit (bech32/bech32m) address of any network.
+
+    Returns
+    -------
+    bytes
+        The length of the scriptPubKey followed by the scriptPubKey.
+
+    Raises
+    ------
+    ValueError
+        If the address is not valid.
+    """
+    network = next(
+        (n for n in NETWORKS if address.lower().startswith(n.hrp + "1")), None
+    )
+    if network is not None:
+        hrp, data, const = _bech32_decode(address)
+        if hrp != network.hrp or not data or data[0] > 16:
+            raise ValueError("Invalid segwit address: %s" % address)
+        version = data[0]
+        program = bytes(_convert_bits(data[1:], 5, 8, False))
+        if (version == 0) != (const == BECH32_CONST):
+            raise ValueError("Invalid checksum variant for %s" % address)
+        if not 2 <= len(program) <= 40 or (
+            version == 0 and len(program) not in (20, 32)
+        ):
+            raise ValueError("Invalid witness program length: %s" % address)
+        opcode = OP_0 if version == 0 else OP_1 + version - 1
+        script = bytes([opcode, len(program)]) + program
+    else:
+        payload = base58check_decode(address)
+        version, hash160 = payload[0], payload[1:]
+        if len(hash160) != 20:
+            raise ValueError("Invalid base58 address length: %s" % address)
+        if version in (MAINNET.p2pkh_version, TESTNET.p2pkh_version):
+            script = (
+                bytes([OP_DUP, OP_HASH160, 20])
+                + hash160
+                + bytes([OP_EQUALVERIFY, OP_CHECKSIG])
+            )
+        elif version in (MAINNET.p2sh_version, TESTNET.p2sh_version):
+            script = bytes([OP_HASH160, 20]) + hash160 + bytes([OP_EQUAL])
+        else:
+            raise ValueError("Unknown base58 address version: %s" % address)
+    return bytes([len(script)]) + script
+
+
+def script_to_address(script, network=MAINNET):
+    """
+    Converts a length prefixed scriptPubKey stored by the ledger to a BTC address.
+
+    Parameters
+    ----------
+    script: bytes
+        The length of the scriptPubKey followed by the scriptPubKey.
+    network: Network
+        The network of the address (MAINNET, TESTNET or REGTEST).
+
+    Returns
+    -------
+    str
+        The P2PKH, P2SH or segwit address paying to the scriptPubKey.
+
+    Raises
+    ------
+    ValueError
+        If the bytes are not a length prefixed standard scriptPubKey.
+    """
+    if not script or script[0] != len(script) - 1:
+        raise ValueError("Invalid scriptPubKey length prefix: %s" % script.hex())
+    script = script[1:]
+    if (
+        len(script) == 25
+        and script[:3] == bytes([OP_DUP, OP_HASH160, 20])
+        and script[23:] == bytes([OP_EQUALVERIFY, OP_CHECKSIG])
+    ):
+        return _base58check_encode(bytes([network.p2pkh_version]) + script[3:23])
+    if (
+        len(script) == 23
+        and script[:2] == bytes([OP_HASH160, 20])
+        and script[22] == OP_EQUAL
+    ):
+        return _base58check_encode(bytes([network.p2sh_version]) + script[2:22])
+    if (
+        len(script) >= 4
+        and (script[0] == OP_0 or OP_1 <= script[0] <= OP_1 + 15)
+        and script[1] == len(script) - 2
+    ):
+        version = 0 if script[0] == OP_0 else script[0] - OP_1 + 1
+        const = BECH32_CONST if version == 0 else BECH32M_CONST
+        data = [version] + _convert_bits(script[2:], 8, 5, True)
+        return _bech32_encode(network.hrp, data, const)
+    raise ValueError("Unsupported scriptPubKey: %s" % script.hex())
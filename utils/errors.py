@@ -9,15 +9,20 @@ INVALID_BURN_ID = "InvalidBurnId"
 NOT_ALLOWED = "NotAllowed"
 BURN_ALREADY_CONFIRMED = "InvalidState: BurnAlreadyConfirmed"
 INVALID_UTXO_KEY = "InvalidUtxoKey"
+INVALID_TXID = "InvalidTxid"
 INVALID_BURN_STATE = "InvalidBurnState"
 UTXO_NOT_PART_OF_BURN = "UtxoNotPartOfBurn"
 ALREADY_ADMIN = "AlreadyAdmin"
 CANNOT_REMOVE_LAST_ADMIN = "CannotRemoveLastAdmin"
+INVALID_ROLE = "InvalidRole"
 RECEIVER_NOT_SET = "ReceiverNotSet"
 INVALID_UTXO_STATE = "InvalidUTXOState"
 MULTIPLE_CONFIRMS_NOT_ALLOWED = "MultipleConfirmsFromTheSameSourceNotAllowed"
 FEE_TOO_HIGH = "FeeTooHigh"
 UTXO_ALREADY_CONFIRMED = "UTXOAlreadyConfirmed"
 SIGNER_ALREADY_CONFIRMED = "MultipleConfirmationsFromSameSignerNotAllowed"
+SIGNER_INDICES_EXHAUSTED = "SignerIndicesExhausted"
 TOO_MANY_UTXOS = "TooManyUTXOs"
-SIGNATURE_CANNOT_BE_SET = "SignatureCannotBeSet"
+TOO_FEW_UTXOS = "TooFewUTXOs"
+INVALID_SIGNATURE = "InvalidSignature"
+NO_APPROVALS = "NoApprovals"
@@ -0,0 +1,253 @@
+"""
+Merkle tree of the verified users, whose root is committed on the ledger with
+set_whitelist_root so that the verified users can propose burns with
+propose_burn_with_proof instead of being stored in the whitelisted_addresses big_map.
+
+The hashing matches verify_is_verified_user: a leaf is the blake2b hash of the packed
+Tezos address and a parent is the blake2b hash of the concatenation of its two
+children, the smallest one first, so a proof is only the list of the sibling hashes.
+The last node of a level without sibling is promoted unchanged to the next level.
+
+The tree keeps all its levels, so that adding or removing an address only rehashes
+the paths to the root (O(log n)) and serving a proof is a lookup. This module is plain
+Python and is meant to be used by the backend and the deployment scripts.
+
+Usage: python3 -m utils.merkle_whitelist WHITELIST_FILE [ADDRESS]
+"""
+
+import hashlib
+import json
+import sys
+
+from utils.btc_address import base58check_decode
+
+# Base58check prefixes of the Tezos addresses and their forged tag.
+IMPLICIT_PREFIXES = {
+    "tz1": (bytes.fromhex("06a19f"), 0x00),
+    "tz2": (bytes.fromhex("06a1a1"), 0x01),
+    "tz3": (bytes.fromhex("06a1a4"), 0x02),
+    "tz4": (bytes.fromhex("06a1a6"), 0x03),
+}
+ORIGINATED_PREFIX = bytes.fromhex("025a79")
+
+PACK_PREFIX = bytes([0x05, 0x0A])  # packed data, bytes node
+
+
+def pack_address(address):
+    """
+    Packs a Tezos address as sp.pack does on-chain.
+
+    Parameters
+    ----------
+    address: str
+        A tz1, tz2, tz3, tz4 or KT1 address (without entrypoint).
+
+    Returns
+    -------
+    bytes
+        The packed address.
+
+    Raises
+    ------
+    ValueError
+        If the address is not valid.
+    """
+    payload = base58check_decode(address)
+    if address[:3] in IMPLICIT_PREFIXES:
+        prefix, tag = IMPLICIT_PREFIXES[address[:3]]
+        forged = bytes([0x00, tag])
+    elif address[:3] == "KT1":
+        prefix, forged = ORIGINATED_PREFIX, bytes([0x01])
+    else:
+        raise ValueError("Unsupported Tezos address: %s" % address)
+    if payload[:3] != prefix or len(payload) != 23:
+        raise ValueError("Invalid Tezos address: %s" % address)
+    forged += payload[3:]
+    if address[:3] == "KT1":
+        forged += bytes([0x00])
+    return PACK_PREFIX + len(forged).to_bytes(4, "big") + forged
+
+
+def blake2b(data):
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def leaf_hash(address):
+    return blake2b(pack_address(address))
+
+
+def node_hash(left, right):
+    return blake2b(min(left, right) + max(left, right))
+
+
+def verify_proof(address, proof, root):
+    """
+    Checks a proof the same way as verify_is_verified_user.
+
+    Parameters
+    ----------
+    address: str
+        The address of the verified user.
+    proof: list(bytes)
+        The hashes of the siblings on the path from the leaf to the root.
+    root: bytes
+        The committed root.
+
+    Returns
+    -------
+    bool
+        True if the proof leads from the address to the root.
+    """
+    node = leaf_hash(address)
+    for sibling in proof:
+        node = node_hash(node, sibling)
+    return node == root
+
+
+class MerkleWhitelist:
+    """
+    A Merkle tree of addresses supporting incremental updates.
+    """
+
+    def __init__(self, addresses=()):
+        self._addresses = list(dict.fromkeys(addresses))
+        self._indexes = {address: i for i, address in enumerate(self._addresses)}
+        level = [leaf_hash(address) for address in self._addresses]
+        self._levels = [level]
+        while len(level) > 1:
+            level = [
+                node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+            self._levels.append(level)
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def __contains__(self, address):
+        return address in self._indexes
+
+    @property
+    def root(self):
+        """
+        The root to commit with set_whitelist_root, None if the tree is empty.
+        """
+        return self._levels[-1][0] if self._addresses else None
+
+    def add(self, address):
+        if address in self._indexes:
+            return
+        self._indexes[address] = len(self._addresses)
+        self._addresses.append(address)
+        self._levels[0].append(leaf_hash(address))
+        self._update(len(self._addresses) - 1)
+
+    def remove(self, address):
+        # The last leaf takes the place of the removed one, so that only two paths
+        # are rehashed.
+        index = self._indexes.pop(address)
+        last_address = self._addresses.pop()
+        last_leaf = self._levels[0].pop()
+        if index < len(self._addresses):
+            self._addresses[index] = last_address
+            self._indexes[last_address] = index
+            self._levels[0][index] = last_leaf
+            self._update(index)
+        if self._addresses:
+            self._update(len(self._addresses) - 1)
+        else:
+            del self._levels[1:]
+
+    def proof(self, address):
+        """
+        Returns the proof to send to propose_burn_with_proof.
+
+        Parameters
+        ----------
+        address: str
+            An address of the tree.
+
+        Returns
+        -------
+        list(bytes)
+            The hashes of the siblings on the path from the leaf to the root.
+
+        Raises
+        ------
+        KeyError
+            If the address is not in the tree.
+        """
+        index = self._indexes[address]
+        proof = []
+        for nodes in self._levels[:-1]:
+            if index ^ 1 < len(nodes):
+                proof.append(nodes[index ^ 1])
+            index //= 2
+        return proof
+
+    def serve_proof(self, address):
+        """
+        Returns the root and the proof of an address as JSON serializable hex strings,
+        or None if the address is not verified.
+        """
+        if address not in self._indexes:
+            return None
+        return {
+            "address": address,
+            "root": self.root.hex(),
+            "proof": [sibling.hex() for sibling in self.proof(address)],
+        }
+
+    def _update(self, index):
+        # Rehashes the ancestors of a leaf, the levels are truncated on the way up as
+        # the last node of a level can disappear after a removal.
+        level = 0
+        while len(self._levels[level]) > 1:
+            nodes = self._levels[level]
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            parents = self._levels[level + 1]
+            del parents[(len(nodes) + 1) // 2 :]
+            left = index - index % 2
+            if left + 1 < len(nodes):
+                parent = node_hash(nodes[left], nodes[left + 1])
+            else:
+                parent = nodes[left]
+            if index // 2 < len(parents):
+                parents[index // 2] = parent
+            else:
+                parents.append(parent)
+            index //= 2
+            level += 1
+        del self._levels[level + 1 :]
+
+
+def read_whitelist(path):
+    """
+    Reads a whitelist file: one address per line, blank lines and # comments ignored.
+
+    Parameters
+    ----------
+    path: str
+        The path of the whitelist file.
+
+    Returns
+    -------
+    list of str
+        The addresses, in file order.
+    """
+    with open(path) as whitelist_file:
+        lines = [line.strip() for line in whitelist_file]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Invalid number of arguments")
+        sys.exit(1)
+
+    tree = MerkleWhitelist(read_whitelist(sys.argv[1]))
+    if len(sys.argv) == 2:
+        print(tree.root.hex() if tree.root is not None else "Empty whitelist")
+    else:
+        print(json.dumps(tree.serve_proof(sys.argv[2])))